@@ -10,10 +10,16 @@ For map conversion, use sec_to_otbm.py separately.
 """
 import sys
 import os
+import re
 import struct
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from lxml import etree
 from collections import defaultdict
+from operator import itemgetter
+
+from parse_cache import load_cached
 
 # ============================================================================
 # OTB/OTBM Constants (RME items.h itemflags_t, items.cpp loadFromOtbVer1)
@@ -66,40 +72,59 @@ OTBM_TILE = 0x05
 OTBM_ITEM = 0x06
 OTBM_ATTR_DESCRIPTION = 0x01
 
+_CACHE_VERSION = 4  # bump when one of this script's cached parsers changes its output format
+
 
 # ============================================================================
 # OTBM Writer
 # ============================================================================
+# Escaped form of every byte value: the byte itself, or NODE_ESC + byte for the three marker values
+_ESC_TABLE = [bytes((b,)) for b in range(256)]
+for _b in (NODE_ESC, NODE_INIT, NODE_TERM):
+    _ESC_TABLE[_b] = bytes((NODE_ESC, _b))
+del _b
+
+_POS = struct.Struct('<HHB')  # x, y, z position (tile area base)
+
+
 class OTBMWriter:
-    """Handles writing OTBM files with proper escape sequences"""
+    """Handles writing OTBM files with proper escape sequences.
+    target: optional binary file; the buffer is then flushed to it at node ends once it passes FLUSH_AT,
+    so the whole map is never held in memory."""
+    
+    FLUSH_AT = 1 << 20
     
-    def __init__(self):
+    def __init__(self, target=None):
         self.data = bytearray()
+        self.target = target
     
     def write_byte(self, b):
-        """Write a byte with escape handling"""
-        if b in (NODE_ESC, NODE_INIT, NODE_TERM):
-            self.data.append(NODE_ESC)
-        self.data.append(b)
+        """Write a byte with escape handling (one table lookup, no branch)"""
+        self.data += _ESC_TABLE[b]
+    
+    def write_raw(self, payload):
+        """Write already-packed bytes with escape handling (escaped in C via bytes.replace)"""
+        # 0xFD must go first so the escapes added for 0xFE/0xFF are not doubled
+        self.data.extend(payload.replace(b'\xfd', b'\xfd\xfd')
+                                .replace(b'\xfe', b'\xfd\xfe')
+                                .replace(b'\xff', b'\xfd\xff'))
     
     def write_uint16(self, val):
         """Write uint16 (little-endian) with escape handling"""
-        self.write_byte(val & 0xFF)
-        self.write_byte((val >> 8) & 0xFF)
+        self.write_raw((val & 0xFFFF).to_bytes(2, 'little'))
     
     def write_uint32(self, val):
         """Write uint32 (little-endian) with escape handling"""
-        self.write_byte(val & 0xFF)
-        self.write_byte((val >> 8) & 0xFF)
-        self.write_byte((val >> 16) & 0xFF)
-        self.write_byte((val >> 24) & 0xFF)
+        self.write_raw((val & 0xFFFFFFFF).to_bytes(4, 'little'))
+    
+    def write_position(self, x, y, z):
+        """Write an (x uint16, y uint16, z byte) position as one packed, escaped run"""
+        self.write_raw(_POS.pack(x & 0xFFFF, y & 0xFFFF, z))
     
     def write_string(self, s):
-        """Write string with length prefix"""
+        """Write string with length prefix (prefix and text escaped as one run)"""
         encoded = s.encode('latin-1')
-        self.write_uint16(len(encoded))
-        for b in encoded:
-            self.write_byte(b)
+        self.write_raw((len(encoded) & 0xFFFF).to_bytes(2, 'little') + encoded)
     
     def start_node(self, node_type):
         """Start a new node"""
@@ -109,12 +134,65 @@ class OTBMWriter:
     def end_node(self):
         """End current node"""
         self.data.append(NODE_TERM)
+        if self.target is not None and len(self.data) >= self.FLUSH_AT:
+            self.flush()
+    
+    def flush(self):
+        """Push buffered bytes to target (no-op without one)"""
+        if self.target is not None and self.data:
+            self.target.write(self.data)
+            self.data.clear()
     
     def get_bytes(self):
         """Return the complete byte array"""
         return bytes(self.data)
 
 
+def _read_text(path):
+    """Whole latin-1 text file from one binary read and one decode (no TextIOWrapper per-line work).
+    CRLF and lone CR are normalised to \\n like text mode."""
+    with open(path, 'rb') as f:
+        text = f.read().decode('latin-1')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def _read_text_lines(path):
+    """Lines of a latin-1 text file (see _read_text); lines carry no line endings"""
+    return _read_text(path).split('\n')
+
+
+# bytes.split() breaks only on ASCII whitespace; str.split() on the latin-1 text also breaks on these
+_LATIN1_SPACE_TO_ASCII = bytes.maketrans(b'\x1c\x1d\x1e\x1f\x85\xa0', b'      ')
+
+
+def _read_token_lines(path):
+    """Lines of a file as undecoded bytes, for parsers that only pull ASCII numbers out of split() tokens.
+    CR / CRLF are normalised and latin-1-only whitespace becomes a space, so line.split() gives the
+    same tokens as on _read_text_lines, with no decode."""
+    with open(path, 'rb') as f:
+        data = f.read().translate(_LATIN1_SPACE_TO_ASCII)
+    if b'\r' in data:
+        data = data.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+    return data.split(b'\n')
+
+
+def _scan_dir_files(directory, suffix):
+    """DirEntry objects for the files in `directory` whose name ends with `suffix`, in directory order;
+    [] when the directory is missing. One os.scandir pass: no Path object or stat per file."""
+    try:
+        with os.scandir(directory) as it:
+            return [entry for entry in it if entry.name.endswith(suffix) and entry.is_file()]
+    except OSError:
+        return []
+
+
+def _load_cached(kind, paths, build):
+    """parse_cache.load_cached under this script's _CACHE_VERSION and source (kinds are rme_-prefixed)"""
+    return load_cached(kind, paths, build, _CACHE_VERSION, source=__file__)
+
+
 # ============================================================================
 # Step 1: Parse objects.srv for items
 # ============================================================================
@@ -122,8 +200,7 @@ def parse_objects_srv(objects_srv_path):
     """Parse CipSoft objects.srv to extract item definitions"""
     items = {}
     
-    with open(objects_srv_path, 'r', encoding='latin-1', errors='ignore') as f:
-        lines = f.readlines()
+    lines = _read_text_lines(objects_srv_path)
     
     i = 0
     while i < len(lines):
@@ -151,18 +228,18 @@ def parse_objects_srv(objects_srv_path):
                     break
                 
                 if line.startswith('Name') and '=' in line:
-                    name_part = line.split('=', 1)[1].strip()
+                    name_part = line.partition('=')[2].strip()
                     name = name_part.strip('"')
                 elif line.startswith('Flags') and '=' in line:
-                    flags_str = line.split('=', 1)[1].strip()
+                    flags_str = line.partition('=')[2].strip()
                     flags_str = flags_str.strip('{}')
                     flags = [f.strip() for f in flags_str.split(',') if f.strip()]
                 elif line.startswith('Attributes') and '=' in line:
-                    attrs_str = line.split('=', 1)[1].strip().strip('{}')
+                    attrs_str = line.partition('=')[2].strip().strip('{}')
                     for part in attrs_str.split(','):
                         part = part.strip()
                         if '=' in part:
-                            k, v = part.split('=', 1)
+                            k, _, v = part.partition('=')
                             k = k.strip()
                             try:
                                 val = int(v.strip())
@@ -194,13 +271,11 @@ def parse_objects_srv(objects_srv_path):
 # Step 2: Generate items.otb with proper binary format
 # ============================================================================
 def escape_otb_data(data):
-    """Escape special bytes in OTB data"""
-    result = bytearray()
-    for byte in data:
-        if byte in [0xFD, 0xFE, 0xFF]:
-            result.append(0xFD)
-        result.append(byte)
-    return bytes(result)
+    """Escape special bytes in OTB data (in C via bytes.replace, not byte by byte)"""
+    # 0xFD must go first so the escapes added for 0xFE/0xFF are not doubled
+    return (bytes(data).replace(b'\xfd', b'\xfd\xfd')
+                       .replace(b'\xfe', b'\xfd\xfe')
+                       .replace(b'\xff', b'\xfd\xff'))
 
 
 def generate_items_otb(items, output_path):
@@ -389,35 +464,34 @@ def generate_items_xml(items, output_path):
 # ============================================================================
 # Step 4: Parse .mon files and generate creatures.xml
 # ============================================================================
+# .mon lines parse_mon_files reads: one scan over the whole file skips every other line in C
+_MON_FIELD_LINE_RE = re.compile(r'^[^\S\n]*(?:RaceNumber|Outfit)[^\n]*', re.M)
+
+
 def parse_mon_files(mon_dir):
-    """Parse .mon files to extract creature definitions using FILENAME as name"""
+    """Parse .mon files to extract creature definitions using FILENAME as name.
+    Cached across runs while the set of .mon files and their mtimes/sizes are unchanged."""
+    # A missing directory scans as empty
+    mon_files = [entry.path for entry in _scan_dir_files(mon_dir, '.mon')]
+    return _load_cached('rme_creatures', mon_files, lambda: _scan_mon_files(mon_files))
+
+
+def _scan_mon_files(mon_files):
+    """Creature definitions ('mon-<filename>' → looks and race) from the given .mon paths"""
     creatures = {}
     
-    # Convert to Path if needed
-    if isinstance(mon_dir, str):
-        mon_dir = Path(mon_dir)
-    
-    if not mon_dir.exists():
-        return creatures
-    
-    for filename in os.listdir(str(mon_dir)):
-        if not filename.endswith('.mon'):
-            continue
-        
-        filepath = mon_dir / filename
-        
+    for mon_file in mon_files:
         # Use filename with "mon-" prefix (e.g. demon.mon -> mon-demon)
-        creature_name = 'mon-' + filename.replace('.mon', '')
+        creature_name = 'mon-' + os.path.basename(mon_file).replace('.mon', '')
         
-        with open(filepath, 'r', encoding='latin-1', errors='ignore') as f:
-            lines = f.readlines()
+        text = _read_text(mon_file)
         
         race_number = None
         looktype = None
         lookhead = lookbody = looklegs = lookfeet = 0
         
-        for line in lines:
-            line = line.strip()
+        for m in _MON_FIELD_LINE_RE.finditer(text):
+            line = m.group().strip()
             
             if line.startswith('RaceNumber') and '=' in line:
                 try:
@@ -425,7 +499,7 @@ def parse_mon_files(mon_dir):
                 except:
                     pass
             elif line.startswith('Outfit') and '=' in line:
-                outfit_str = line.split('=', 1)[1].strip().strip('()')
+                outfit_str = line.partition('=')[2].strip().strip('()')
                 try:
                     # Format: (118, 0-0-0-0) or (118,0-0-0-0)
                     parts = outfit_str.split(',', 1)
@@ -525,22 +599,63 @@ def generate_creatures_xml(creatures, npc_creatures, output_path):
 # ============================================================================
 # Step 5: Parse .sec files (map data)
 # ============================================================================
+# Well-formed tile line: lx, ly and the Content={...} body up to its first '}' in one match
+_SEC_LINE_RE = re.compile(r'(\d+)-(\d+):.*?Content=\{([^}]*)\}')
+# Item spec of an id and Key=number attributes only (anything else takes the split() path)
+_ITEM_SPEC_RE = re.compile(r'(\d+)((?:\s+\w+=-?\d+)*)', re.ASCII)
+_ITEM_ATTR_RE = re.compile(r'\s+(\w+)=(-?\d+)', re.ASCII)
+
+
+def _parse_sec_item(item_str):
+    """{'id': ..., <lowercased attribute>: int, ...} for one item spec, or None without a numeric id"""
+    m = _ITEM_SPEC_RE.fullmatch(item_str)
+    if m is not None:
+        item_data = {'id': int(m.group(1))}
+        if m.group(2):
+            for key, value in _ITEM_ATTR_RE.findall(m.group(2)):
+                item_data[key.lower()] = int(value)
+        return item_data
+    
+    parts = item_str.split()
+    try:
+        item_id = int(parts[0])
+    except (ValueError, IndexError):
+        return None
+    
+    item_data = {'id': item_id}
+    for part in parts[1:]:
+        if '=' in part:
+            key, _, value = part.partition('=')
+            try:
+                item_data[key.lower()] = int(value)
+            except ValueError:
+                pass
+    return item_data
+
+
 def parse_sec_file(sec_file):
-    """Parse a single .sec file and return tiles with items"""
+    """Parse a single .sec file and return tiles with items.
+    A tile's items are an array('H') of ids when the tile has no attributes (nearly all of them),
+    otherwise a list of item dicts (see _parse_sec_item)."""
     tiles = []
     
-    with open(sec_file, 'r', encoding='latin-1', errors='ignore') as f:
-        for line in f:
-            line = line.strip()
-            
-            if not line or line.startswith('#'):
-                continue
-            
-            if ':' not in line or 'Content=' not in line:
-                continue
-            
-            try:
-                coords_part, rest = line.split(':', 1)
+    for line in _read_text_lines(sec_file):
+        line = line.strip()
+        
+        if not line or line.startswith('#'):
+            continue
+        
+        if ':' not in line or 'Content=' not in line:
+            continue
+        
+        try:
+            m = _SEC_LINE_RE.match(line)
+            if m is not None:
+                lx = int(m.group(1))
+                ly = int(m.group(2))
+                content_str = m.group(3)
+            else:
+                coords_part, _, rest = line.partition(':')
                 lx, ly = map(int, coords_part.strip().split('-'))
                 
                 if 'Refresh' in rest:
@@ -549,124 +664,148 @@ def parse_sec_file(sec_file):
                 if 'Content={' not in rest:
                     continue
                 
-                try:
-                    content_part = rest.split('Content={', 1)[1]
-                    if '}' not in content_part:
-                        continue
-                    content_str = content_part.split('}', 1)[0]
-                except IndexError:
-                    continue
-                    
-                if not content_str.strip():
+                content_part = rest.partition('Content={')[2]
+                if '}' not in content_part:
                     continue
+                content_str = content_part.partition('}')[0]
                 
+            if not content_str.strip():
+                continue
+            
+            if '=' not in content_str:
+                # No attributes: only the leading id of each spec matters, packed as uint16 ids
+                ids = []
+                for item_str in content_str.split(','):
+                    parts = item_str.split()
+                    if parts:
+                        try:
+                            ids.append(int(parts[0]))
+                        except ValueError:
+                            pass
+                try:
+                    items = array('H', ids)
+                except OverflowError:
+                    items = [{'id': item_id} for item_id in ids]
+            else:
                 items = []
                 for item_str in content_str.split(','):
                     item_str = item_str.strip()
                     if not item_str:
                         continue
                     
-                    parts = item_str.split()
-                    
-                    try:
-                        item_id = int(parts[0])
-                    except (ValueError, IndexError):
-                        continue
-                    
-                    item_data = {'id': item_id}
-                    
-                    for part in parts[1:]:
-                        if '=' in part:
-                            key, value = part.split('=', 1)
-                            try:
-                                item_data[key.lower()] = int(value)
-                            except ValueError:
-                                pass
-                    
-                    items.append(item_data)
+                    item_data = _parse_sec_item(item_str)
+                    if item_data is not None:
+                        items.append(item_data)
+            
+            if items:
+                tiles.append((lx, ly, items))
                 
-                if items:
-                    tiles.append((lx, ly, items))
-                    
-            except (ValueError, IndexError):
-                continue
+        except (ValueError, IndexError):
+            continue
     
     return tiles
 
 
+# Below this many files a process pool costs more to start than it saves
+_PARALLEL_SEC_MIN = 200
+
+
+def _parse_sec_job(job):
+    """Worker: ((sx, sy, z), tiles) for one (file name, path) job, or None for a bad name or unreadable file"""
+    name, path = job
+    try:
+        name_parts = name[:-4].split('-')
+        key = (int(name_parts[0]), int(name_parts[1]), int(name_parts[2]))
+        return key, parse_sec_file(path)
+    except Exception:
+        return None
+
+
 def load_all_sectors(sec_dir):
     """Load all .sec files and organize by sector"""
     sec_dir = Path(sec_dir)
-    sectors = defaultdict(list)
+    sectors = {}
     
     print(f"Scanning for .sec files in {sec_dir}...")
-    sec_files = sorted(sec_dir.glob("*.sec"))
+    # Plain (name, path) strings straight from scandir: cheap to build, sort and pickle to workers
+    sec_files = sorted((entry.name, entry.path) for entry in _scan_dir_files(sec_dir, '.sec'))
     total_files = len(sec_files)
     print(f"  Found {total_files} sector files.")
     
     parsed = 0
     skipped = 0
     
-    for idx, sec_file in enumerate(sec_files, 1):
-        if idx % 500 == 0:
-            print(f"  Progress: {idx}/{total_files} files ({parsed} parsed, {skipped} skipped)")
-        
-        try:
-            name_parts = sec_file.stem.split('-')
-            sx = int(name_parts[0])
-            sy = int(name_parts[1])
-            z = int(name_parts[2])
+    # Files are independent: parse them across processes when there are enough to pay for the pool
+    workers = os.cpu_count() or 1
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 and total_files >= _PARALLEL_SEC_MIN else None
+    try:
+        if pool:
+            # ~4 chunks per worker: few enough round trips to amortise pickling, enough to balance uneven sectors
+            results = pool.map(_parse_sec_job, sec_files, chunksize=max(1, total_files // (workers * 4)))
+        else:
+            results = map(_parse_sec_job, sec_files)
+        # Results come back in file order, so merging matches a serial parse
+        for idx, result in enumerate(results, 1):
+            if idx % 500 == 0:
+                print(f"  Progress: {idx}/{total_files} files ({parsed} parsed, {skipped} skipped)")
             
-            tiles = parse_sec_file(sec_file)
-            if tiles:
-                sectors[(sx, sy, z)].extend(tiles)
-                parsed += 1
-            else:
+            if result is None or not result[1]:
                 skipped += 1
-        except (ValueError, IndexError):
-            skipped += 1
-            continue
-        except Exception:
-            skipped += 1
-            continue
+                continue
+            key, tiles = result
+            # One file per sector key in practice; only a differently padded duplicate name extends
+            existing = sectors.get(key)
+            if existing is None:
+                sectors[key] = tiles
+            else:
+                existing.extend(tiles)
+            parsed += 1
+    finally:
+        if pool is not None:
+            pool.shutdown()
     
     print(f"  Loaded {len(sectors)} sectors with tiles (parsed: {parsed}, skipped: {skipped}).")
     return sectors
 
 
-def calculate_offset(sectors):
+def calculate_extent(sectors):
+    """Absolute (min_x, min_y, max_x, max_y) of all tiles in one pass, or None without tiles.
+    Per sector the local lx / ly extremes come from C-level min()/max() over the tile column,
+    then the sector base is added once."""
+    extent = None
+    for (sx, sy, _z), tiles in sectors.items():
+        if not tiles:
+            continue
+        lxs = [tile[0] for tile in tiles]
+        lys = [tile[1] for tile in tiles]
+        base_x = sx * SECTOR_SIZE
+        base_y = sy * SECTOR_SIZE
+        sector_extent = (base_x + min(lxs), base_y + min(lys), base_x + max(lxs), base_y + max(lys))
+        if extent is None:
+            extent = sector_extent
+        else:
+            extent = (min(extent[0], sector_extent[0]), min(extent[1], sector_extent[1]),
+                      max(extent[2], sector_extent[2]), max(extent[3], sector_extent[3]))
+    return extent
+
+
+def calculate_offset(sectors, extent=None):
     """Calculate the offset needed to move map to start at 0,0"""
-    min_x = min_y = float('inf')
-    
-    for (sx, sy, z), tiles in sectors.items():
-        for lx, ly, _ in tiles:
-            abs_x = sx * SECTOR_SIZE + lx
-            abs_y = sy * SECTOR_SIZE + ly
-            min_x = min(min_x, abs_x)
-            min_y = min(min_y, abs_y)
-    
-    return int(min_x), int(min_y)
+    if extent is None:
+        extent = calculate_extent(sectors)
+    if extent is None:
+        return 0, 0
+    return extent[0], extent[1]
 
 
-def calculate_bounds(sectors, offset_x=0, offset_y=0):
+def calculate_bounds(sectors, offset_x=0, offset_y=0, extent=None):
     """Calculate transformed map bounds after applying offset"""
-    min_x = min_y = float('inf')
-    max_x = max_y = float('-inf')
-
-    for (sx, sy, _z), tiles in sectors.items():
-        for lx, ly, _items in tiles:
-            abs_x = sx * SECTOR_SIZE + lx
-            abs_y = sy * SECTOR_SIZE + ly
-            new_x = abs_x - offset_x
-            new_y = abs_y - offset_y
-            min_x = min(min_x, new_x)
-            min_y = min(min_y, new_y)
-            max_x = max(max_x, new_x)
-            max_y = max(max_y, new_y)
-
-    if min_x == float('inf'):
+    if extent is None:
+        extent = calculate_extent(sectors)
+    if extent is None:
         return 0, 0, 0, 0
-    return int(min_x), int(min_y), int(max_x), int(max_y)
+    min_x, min_y, max_x, max_y = extent
+    return min_x - offset_x, min_y - offset_y, max_x - offset_x, max_y - offset_y
 
 
 def build_otbm_header(width, height):
@@ -681,6 +820,39 @@ def build_otbm_header(width, height):
     return writer.get_bytes()
 
 
+def _otbm_item_node(item_id):
+    """Complete, escaped OTBM_ITEM node (start, id, end) for an id-only item"""
+    writer = OTBMWriter()
+    writer.start_node(OTBM_ITEM)
+    writer.write_uint16(item_id)
+    writer.end_node()
+    return bytes(writer.data)
+
+
+class _ItemNodeCache(dict):
+    """item id -> escaped OTBM_ITEM node bytes; a missing id is built once on first lookup"""
+    
+    def __missing__(self, item_id):
+        node = self[item_id] = _otbm_item_node(item_id)
+        return node
+
+
+# Shared across maps: node bytes depend only on the item id
+_ITEM_NODES = _ItemNodeCache()
+_ITEM_ID = itemgetter('id')
+_TILE_LX = itemgetter(0)
+_TILE_LY = itemgetter(1)
+# NODE_INIT + escaped OTBM_TILE; the escaped local x / y bytes follow per tile
+_TILE_NODE_START = bytes((NODE_INIT,)) + _ESC_TABLE[OTBM_TILE]
+
+
+def _area_order_key(area_key):
+    """Sort key for (area_x, area_y, z) in plain tuple order, packed into one int so the sort compares ints.
+    area_x / area_y are multiples of 256 below 65536 and z fits a byte (it is written as one)."""
+    area_x, area_y, z = area_key
+    return (area_x << 24) | (area_y << 8) | z
+
+
 def convert_map_to_otbm(sec_dir, output_file, map_name, apply_offset=True):
     """Convert .sec files to OTBM format"""
     
@@ -694,16 +866,50 @@ def convert_map_to_otbm(sec_dir, output_file, map_name, apply_offset=True):
         print("Error: No valid sectors found!")
         return
     
-    offset_x, offset_y = calculate_offset(sectors)
-    
+    # Binning needs the offset first, so the minima are a pre-pass only when the offset is applied
     if apply_offset:
+        offset_x, offset_y = calculate_offset(sectors)
         print(f"\nApplying coordinate offset: -{offset_x}, -{offset_y}")
     else:
         print(f"\nNOT applying offset (using original coordinates)")
         offset_x = 0
         offset_y = 0
     
-    min_x, min_y, max_x, max_y = calculate_bounds(sectors, offset_x, offset_y)
+    # Sectors are binned whole: per sector the tile extent comes from C-level min()/max(), and a sector
+    # inside a single area (nearly all of them) goes in as one pre-built list extend, not an append per tile
+    areas = defaultdict(list)
+    min_x = min_y = max_x = max_y = None
+    for (sx, sy, z), tiles in sectors.items():
+        if not tiles:
+            continue
+        base_x = sx * SECTOR_SIZE - offset_x
+        base_y = sy * SECTOR_SIZE - offset_y
+        lo_x = base_x + min(map(_TILE_LX, tiles))
+        hi_x = base_x + max(map(_TILE_LX, tiles))
+        lo_y = base_y + min(map(_TILE_LY, tiles))
+        hi_y = base_y + max(map(_TILE_LY, tiles))
+        if min_x is None:
+            min_x, min_y, max_x, max_y = lo_x, lo_y, hi_x, hi_y
+        else:
+            min_x = min(min_x, lo_x)
+            min_y = min(min_y, lo_y)
+            max_x = max(max_x, hi_x)
+            max_y = max(max_y, hi_y)
+        
+        if lo_x >> 8 == hi_x >> 8 and lo_y >> 8 == hi_y >> 8:
+            # Every tile shares the area's 256-block, so its local coordinate is lx / ly plus a
+            # per-sector constant: the comprehension does one add per axis and no masking
+            dx = base_x - (lo_x & ~0xFF)
+            dy = base_y - (lo_y & ~0xFF)
+            areas[(lo_x & 0xFF00, lo_y & 0xFF00, z)].extend([(lx + dx, ly + dy, items) for lx, ly, items in tiles])
+            continue
+        for lx, ly, items in tiles:
+            new_x = base_x + lx
+            new_y = base_y + ly
+            areas[(new_x & 0xFF00, new_y & 0xFF00, z)].append((new_x & 0xFF, new_y & 0xFF, items))
+    if min_x is None:
+        min_x = min_y = max_x = max_y = 0
+    
     width = max_x - min_x + 1
     height = max_y - min_y + 1
 
@@ -714,78 +920,55 @@ def convert_map_to_otbm(sec_dir, output_file, map_name, apply_offset=True):
 
     header = build_otbm_header(width, height)
     
-    writer = OTBMWriter()
-    writer.data.extend(header)
-    
     print("\nWriting OTBM structure...")
     
-    writer.start_node(OTBM_MAP_DATA)
-    writer.write_byte(OTBM_ATTR_DESCRIPTION)
-    writer.write_string(map_name)
-    
-    areas = defaultdict(list)
-    for (sx, sy, z), tiles in sectors.items():
-        for lx, ly, items in tiles:
-            abs_x = sx * SECTOR_SIZE + lx
-            abs_y = sy * SECTOR_SIZE + ly
-            
-            new_x = abs_x - offset_x
-            new_y = abs_y - offset_y
-            
-            area_x = new_x & 0xFF00
-            area_y = new_y & 0xFF00
-            local_x = new_x & 0xFF
-            local_y = new_y & 0xFF
-            
-            areas[(area_x, area_y, z)].append({
-                'x': local_x,
-                'y': local_y,
-                'items': items
-            })
-    
     print(f"  Writing {len(areas)} tile areas...")
     
     total_tiles = 0
     total_items = 0
+    # Item nodes are id-only: each distinct id is escaped once, then its bytes are reused
+    item_nodes = _ITEM_NODES.__getitem__
+    esc = _ESC_TABLE
+    
+    Path(output_file).parent.mkdir(parents=True, exist_ok=True)
     
-    for idx, ((bx, by, z), tiles) in enumerate(sorted(areas.items())):
-        writer.start_node(OTBM_TILE_AREA)
-        writer.write_uint16(bx)
-        writer.write_uint16(by)
-        writer.write_byte(z)
+    # Stream to disk: the writer flushes its buffer to the file at node ends, never holding the whole map
+    with open(output_file, 'wb', buffering=1 << 20) as f:
+        f.write(b'OTBM')
+        writer = OTBMWriter(target=f)
+        writer.data.extend(header)
+        extend = writer.data.extend
         
-        for tile in tiles:
-            total_tiles += 1
-            items = tile['items']
-            
-            if not items:
-                continue
-            
-            writer.start_node(OTBM_TILE)
-            writer.write_byte(tile['x'])
-            writer.write_byte(tile['y'])
+        writer.start_node(OTBM_MAP_DATA)
+        writer.write_byte(OTBM_ATTR_DESCRIPTION)
+        writer.write_string(map_name)
+        
+        for idx, (bx, by, z) in enumerate(sorted(areas, key=_area_order_key)):
+            tiles = areas[(bx, by, z)]
+            writer.start_node(OTBM_TILE_AREA)
+            writer.write_position(bx, by, z)
             
-            for item_data in items:
-                writer.start_node(OTBM_ITEM)
-                writer.write_uint16(item_data['id'])
+            for local_x, local_y, items in tiles:
+                total_tiles += 1
+                
+                if not items:
+                    continue
+                
+                # Tile head and all item nodes go in as one joined run of prebuilt bytes
+                ids = items if type(items) is array else map(_ITEM_ID, items)
+                extend(b''.join([_TILE_NODE_START, esc[local_x], esc[local_y], *map(item_nodes, ids)]))
+                total_items += len(items)
+                
                 writer.end_node()
-                total_items += 1
             
             writer.end_node()
+            
+            if idx % 200 == 0:
+                print(f"  Progress: {idx}/{len(areas)} areas...")
         
         writer.end_node()
-        
-        if idx % 200 == 0:
-            print(f"  Progress: {idx}/{len(areas)} areas...")
-    
-    writer.end_node()
-    writer.end_node()
-    
-    Path(output_file).parent.mkdir(parents=True, exist_ok=True)
-    
-    with open(output_file, 'wb') as f:
-        f.write(b'OTBM')
-        f.write(writer.get_bytes())
+        writer.end_node()
+        writer.flush()
     
     print(f"\n✓ Map generated: {output_file}")
     print(f"  Tiles: {total_tiles:,}, Items: {total_items:,}")
@@ -798,82 +981,89 @@ def parse_houseareas(houseareas_path):
     """Parse houseareas.dat to get Area → Depot mapping"""
     area_to_depot = {}
     
-    with open(houseareas_path, 'r', encoding='latin-1', errors='ignore') as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith('#'):
+    for line in _read_text_lines(houseareas_path):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        
+        if line.startswith('Area'):
+            try:
+                content = line.partition('=')[2].strip()
+                content = content.strip('()')
+                parts = content.split(',')
+                
+                area_id = int(parts[0].strip())
+                depot = int(parts[3].strip())
+                
+                area_to_depot[area_id] = depot
+            except (ValueError, IndexError):
                 continue
-            
-            if line.startswith('Area'):
-                try:
-                    content = line.split('=', 1)[1].strip()
-                    content = content.strip('()')
-                    parts = content.split(',')
-                    
-                    area_id = int(parts[0].strip())
-                    depot = int(parts[3].strip())
-                    
-                    area_to_depot[area_id] = depot
-                except (ValueError, IndexError):
-                    continue
     
     return area_to_depot
 
 
+def _house_set_exit(house, rest):
+    """Exit = [x,y,z] -> house entry"""
+    parts = rest.split('=')[1].strip().strip('[]').split(',')
+    house['entryx'] = int(parts[0])
+    house['entryy'] = int(parts[1])
+    house['entryz'] = int(parts[2])
+
+
+# houses.dat key -> handler(house, rest); rest is the line after the key. Name reads everything after
+# the first '=', the others only up to the second '=' (as the original splits did)
+_HOUSE_FIELD_HANDLERS = {
+    'Name': lambda house, rest: house.update(name=rest.split('=', 1)[1].strip().strip('"')),
+    'RentOffset': lambda house, rest: house.update(rent=int(rest.split('=')[1].strip())),
+    'Area': lambda house, rest: house.update(area=int(rest.split('=')[1].strip())),
+    'GuildHouse': lambda house, rest: house.update(guildhall=rest.split('=')[1].strip().lower() == 'true'),
+    'Exit': _house_set_exit,
+    'Fields': lambda house, rest: house.update(size=rest.split('=')[1].strip().strip('{}').count('[')),
+}
+# Key a houses.dat line starts with: a prefix match, so "AreaXyz = 2" still sets the area
+_HOUSE_FIELD_KEY_RE = re.compile('|'.join(_HOUSE_FIELD_HANDLERS))
+
+
 def parse_houses_dat(houses_path):
-    """Parse houses.dat file"""
+    """Parse houses.dat file (cached across runs while the file is unchanged)"""
+    return _load_cached('rme_houses', [houses_path], lambda: _scan_houses_dat(houses_path))
+
+
+def _scan_houses_dat(houses_path):
+    """Houses from houses.dat: dicts with id, name, rent, area, guildhall, entryx/y/z and size"""
     houses = []
     
-    with open(houses_path, 'r', encoding='latin-1', errors='ignore') as f:
-        lines = f.readlines()
+    lines = _read_text_lines(houses_path)
     
-    i = 0
-    while i < len(lines):
-        line = lines[i].strip()
+    # Single pass: an ID line opens a house, a blank line (or the next ID) closes it
+    house = None
+    for line in lines:
+        line = line.strip()
         
         if line.startswith('ID'):
-            house = {}
-            
+            if house is not None:
+                houses.append(house)
             try:
-                house['id'] = int(line.split('=')[1].strip())
-            except:
-                i += 1
-                continue
-            
-            i += 1
-            while i < len(lines):
-                line = lines[i].strip()
-                
-                if line.startswith('ID'):
-                    i -= 1
-                    break
-                
-                if line.startswith('Name'):
-                    house['name'] = line.split('=', 1)[1].strip().strip('"')
-                elif line.startswith('RentOffset'):
-                    house['rent'] = int(line.split('=')[1].strip())
-                elif line.startswith('Area'):
-                    house['area'] = int(line.split('=')[1].strip())
-                elif line.startswith('GuildHouse'):
-                    house['guildhall'] = line.split('=')[1].strip().lower() == 'true'
-                elif line.startswith('Exit'):
-                    coords = line.split('=')[1].strip().strip('[]')
-                    parts = coords.split(',')
-                    house['entryx'] = int(parts[0])
-                    house['entryy'] = int(parts[1])
-                    house['entryz'] = int(parts[2])
-                elif line.startswith('Fields'):
-                    fields_str = line.split('=')[1].strip()
-                    fields_str = fields_str.strip('{}')
-                    house['size'] = fields_str.count('[')
-                
-                i += 1
-                if not line:
-                    break
-            
+                house = {'id': int(line.split('=')[1].strip())}
+            except (ValueError, IndexError):
+                house = None
+            continue
+        
+        if house is None:
+            continue
+        
+        if not line:
             houses.append(house)
-        else:
-            i += 1
+            house = None
+            continue
+        
+        # One regex match per line, then a dict dispatch on the key; a key line without '=' has no value
+        m = _HOUSE_FIELD_KEY_RE.match(line)
+        if m is not None and '=' in line:
+            _HOUSE_FIELD_HANDLERS[m.group()](house, line[m.end():])
+    
+    if house is not None:
+        houses.append(house)
     
     return houses
 
@@ -890,37 +1080,28 @@ def generate_houses_xml(houses_path, houseareas_path, output_path):
     
     print(f"Found {len(houses)} houses")
     
-    xml_lines = ['<?xml version="1.0"?>']
-    xml_lines.append('<houses>')
-    
-    for house in houses:
-        area = house.get('area', 100)
-        house_id = house['id'] - (area * 100)
-        depot = area_to_depot.get(area, 0)
-        town_id = depot + 1
-        
-        attrs = [
-            f'name="{house.get("name", "")}"',
-            f'houseid="{house_id}"',
-            f'entryx="{house.get("entryx", 0)}"',
-            f'entryy="{house.get("entryy", 0)}"',
-            f'entryz="{house.get("entryz", 7)}"',
-            f'rent="{house.get("rent", 0)}"',
-        ]
-        
-        if house.get('guildhall', False):
-            attrs.append('guildhall="true"')
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    # Stream straight to disk through a 1 MiB buffer instead of collecting every line for one big join
+    with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as out:
+        write = out.write
+        write('<?xml version="1.0"?>\n<houses>')
         
-        attrs.append(f'townid="{town_id}"')
-        attrs.append(f'size="{house.get("size", 0)}"')
+        for house in houses:
+            area = house.get('area', 100)
+            house_id = house['id'] - (area * 100)
+            depot = area_to_depot.get(area, 0)
+            town_id = depot + 1
+            
+            guildhall = ' guildhall="true"' if house.get('guildhall', False) else ''
+            
+            # One f-string per house (no attrs list + join)
+            write(
+                f'\n\t<house name="{house.get("name", "")}" houseid="{house_id}" '
+                f'entryx="{house.get("entryx", 0)}" entryy="{house.get("entryy", 0)}" entryz="{house.get("entryz", 7)}" '
+                f'rent="{house.get("rent", 0)}"{guildhall} townid="{town_id}" size="{house.get("size", 0)}" />'
+            )
         
-        xml_lines.append(f'\t<house {" ".join(attrs)} />')
-    
-    xml_lines.append('</houses>')
-    
-    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(xml_lines))
+        write('\n</houses>')
     
     print(f"✓ Houses XML generated: {len(houses)} houses")
 
@@ -941,90 +1122,88 @@ def build_race_lookup(creatures):
 
 
 def parse_monsters_db(monsters_db_path):
-    """Parse monsters.db file"""
+    """Parse monsters.db file into (race, x, y, z, radius, amount, spawntime) tuples"""
     spawns = []
+    append = spawns.append
     
-    with open(monsters_db_path, 'r', encoding='latin-1', errors='ignore') as f:
-        for line in f:
-            line = line.strip()
-            
-            if not line or line.startswith('#'):
-                continue
-            
-            parts = line.split()
-            if len(parts) < 7:
-                continue
-            
-            try:
-                spawn = {
-                    'race': int(parts[0]),
-                    'x': int(parts[1]),
-                    'y': int(parts[2]),
-                    'z': int(parts[3]),
-                    'radius': int(parts[4]),
-                    'amount': int(parts[5]),
-                    'spawntime': int(parts[6])
-                }
-                spawns.append(spawn)
-            except (ValueError, IndexError):
-                continue
+    # One bulk read, never decoded (int() takes the ASCII byte tokens); the 7 numeric columns are
+    # converted in a single map() per line
+    for line in _read_token_lines(monsters_db_path):
+        parts = line.split()
+        if len(parts) < 7 or parts[0].startswith(b'#'):
+            continue
+        
+        try:
+            append(tuple(map(int, parts[:7])))
+        except ValueError:
+            continue
     
     return spawns
 
 
+def _npc_set_home(npc, rest):
+    """Home = [x,y,z]"""
+    parts = rest.split('=')[1].strip().strip('[]').split(',')
+    npc['home_x'] = int(parts[0])
+    npc['home_y'] = int(parts[1])
+    npc['home_z'] = int(parts[2])
+
+
+def _npc_set_outfit(npc, rest):
+    """Outfit = (looktype, head-body-legs-feet)"""
+    parts = rest.split('=', 1)[1].strip().strip('()').split(',', 1)
+    npc['looktype'] = int(parts[0].strip())
+    if len(parts) > 1:
+        colors = parts[1].strip().split('-')
+        npc['lookhead'] = int(colors[0]) if len(colors) > 0 else 0
+        npc['lookbody'] = int(colors[1]) if len(colors) > 1 else 0
+        npc['looklegs'] = int(colors[2]) if len(colors) > 2 else 0
+        npc['lookfeet'] = int(colors[3]) if len(colors) > 3 else 0
+
+
+# .npc key -> handler(npc, rest); rest is the line after the key and holds an '='. As in the original
+# line parser, Home / Radius read the text between the first and second '=', Outfit all of it after the first
+_NPC_FIELD_HANDLERS = {
+    'Home': _npc_set_home,
+    'Radius': lambda npc, rest: npc.update(radius=int(rest.split('=')[1].strip())),
+    'Outfit': _npc_set_outfit,
+}
+# Lines that start with a handled key (a prefix, as line.startswith did) and hold an '=', found in one scan
+_NPC_FIELD_LINE_RE = re.compile(r'^[^\S\n]*(Home|Radius|Outfit)([^\n]*=[^\n]*)', re.M)
+
+
 def parse_npc_files(npc_dir):
-    """Parse .npc files to extract NPC spawn data and outfit info (using filename with npc- prefix)"""
+    """Parse .npc files to extract NPC spawn data and outfit info (using filename with npc- prefix).
+    Cached across runs while the set of .npc files and their mtimes/sizes are unchanged."""
+    # A missing directory scans as empty
+    npc_files = [entry.path for entry in _scan_dir_files(npc_dir, '.npc')]
+    return _load_cached('rme_npc_files', npc_files, lambda: _scan_npc_files(npc_files))
+
+
+def _scan_npc_files(npc_files):
+    """(npc_spawns, npc_creatures) from the given .npc paths"""
     npc_spawns = []
     npc_creatures = {}  # For creatures.xml generation
     
-    npc_dir = Path(npc_dir)
-    if not npc_dir.exists():
-        return npc_spawns, npc_creatures
-    
-    for npc_file in npc_dir.glob("*.npc"):
-        npc_filename = npc_file.stem
+    for npc_file in npc_files:
+        npc_filename = os.path.basename(npc_file)[:-4]
         # Use filename with "npc-" prefix (e.g. frans.npc -> npc-frans)
         display_name = 'npc-' + npc_filename
         
-        home_x = home_y = home_z = None
-        radius = 3
-        looktype = None
-        lookhead = lookbody = looklegs = lookfeet = 0
+        npc = {'home_x': None, 'home_y': None, 'home_z': None, 'radius': 3, 'looktype': None,
+               'lookhead': 0, 'lookbody': 0, 'looklegs': 0, 'lookfeet': 0}
         
-        with open(npc_file, 'r', encoding='latin-1', errors='ignore') as f:
-            for line in f:
-                line = line.strip()
-                
-                if line.startswith('Name') and '=' in line:
-                    pass  # Name field no longer used for creature id; we use filename + npc- prefix
-                elif line.startswith('Home') and '=' in line:
-                    try:
-                        coords = line.split('=')[1].strip().strip('[]')
-                        parts = coords.split(',')
-                        home_x = int(parts[0])
-                        home_y = int(parts[1])
-                        home_z = int(parts[2])
-                    except:
-                        pass
-                elif line.startswith('Radius') and '=' in line:
-                    try:
-                        radius = int(line.split('=')[1].strip())
-                    except:
-                        pass
-                elif line.startswith('Outfit') and '=' in line:
-                    outfit_str = line.split('=', 1)[1].strip().strip('()')
-                    try:
-                        # Format: (looktype, head-body-legs-feet)
-                        parts = outfit_str.split(',', 1)
-                        looktype = int(parts[0].strip()) if len(parts) > 0 else None
-                        if len(parts) > 1:
-                            colors = parts[1].strip().split('-')
-                            lookhead = int(colors[0]) if len(colors) > 0 else 0
-                            lookbody = int(colors[1]) if len(colors) > 1 else 0
-                            looklegs = int(colors[2]) if len(colors) > 2 else 0
-                            lookfeet = int(colors[3]) if len(colors) > 3 else 0
-                    except:
-                        pass
+        # One regex scan over the file, then a dict dispatch on the key (Name is not used: we use filename + npc- prefix)
+        for key, rest in _NPC_FIELD_LINE_RE.findall(_read_text(npc_file)):
+            try:
+                _NPC_FIELD_HANDLERS[key](npc, rest)
+            except:
+                pass
+        
+        home_x, home_y, home_z = npc['home_x'], npc['home_y'], npc['home_z']
+        radius = npc['radius']
+        looktype = npc['looktype']
+        lookhead, lookbody, looklegs, lookfeet = npc['lookhead'], npc['lookbody'], npc['looklegs'], npc['lookfeet']
         
         # Add to spawn list if has position (display_name is npc- + filename)
         if home_x is not None:
@@ -1065,39 +1244,35 @@ def generate_spawns_xml(monsters_db_path, creatures, npc_dir, output_path):
     npc_spawns, npc_creatures = parse_npc_files(npc_dir)
     print(f"Found {len(npc_spawns)} NPC spawns")
     
-    xml_lines = ['<?xml version="1.0"?>']
-    xml_lines.append('<spawns>')
-    
-    # Add monster spawns
-    for spawn in monster_spawns:
-        race = spawn['race']
-        monster_name = race_to_name.get(race)
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    # Stream straight to disk through a 1 MiB buffer instead of collecting every line for one big join
+    with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as out:
+        write = out.write
+        write('<?xml version="1.0"?>\n<spawns>')
         
-        if not monster_name:
-            continue
+        # Add monster spawns: one identical line per creature, formatted once per spawn.
+        # writelines() drains the generators from C, so there is no Python-level write() call per record
+        named_spawns = ((race_to_name.get(race), x, y, z, radius, amount, spawntime)
+                        for race, x, y, z, radius, amount, spawntime in monster_spawns)
+        out.writelines(
+            f'\n\t<spawn centerx="{x}" centery="{y}" '
+            f'centerz="{z}" radius="{radius}">'
+            f'<monster name="{monster_name}" x="0" y="0" z="{z}" '
+            f'spawntime="{spawntime}"/></spawn>' * max(0, amount)
+            for monster_name, x, y, z, radius, amount, spawntime in named_spawns
+            if monster_name
+        )
         
-        for i in range(spawn['amount']):
-            xml_lines.append(
-                f'\t<spawn centerx="{spawn["x"]}" centery="{spawn["y"]}" '
-                f'centerz="{spawn["z"]}" radius="{spawn["radius"]}">'
-                f'<monster name="{monster_name}" x="0" y="0" z="{spawn["z"]}" '
-                f'spawntime="{spawn["spawntime"]}"/></spawn>'
-            )
-    
-    # Add NPC spawns
-    for npc in npc_spawns:
-        xml_lines.append(
-            f'\t<spawn centerx="{npc["x"]}" centery="{npc["y"]}" '
+        # Add NPC spawns
+        out.writelines(
+            f'\n\t<spawn centerx="{npc["x"]}" centery="{npc["y"]}" '
             f'centerz="{npc["z"]}" radius="{npc["radius"]}">'
             f'<npc name="{npc["name"]}" x="0" y="0" z="{npc["z"]}" '
             f'spawntime="60"/></spawn>'
+            for npc in npc_spawns
         )
-    
-    xml_lines.append('</spawns>')
-    
-    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(xml_lines))
+        
+        write('\n</spawns>')
     
     print(f"✓ Spawns XML generated: {len(monster_spawns)} monsters, {len(npc_spawns)} NPCs")
 
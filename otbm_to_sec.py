@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 import sys
 import json
+import re
 import struct
 from pathlib import Path
 from collections import defaultdict
@@ -18,6 +19,9 @@ OTBM_ITEM = 6
 OTBM_HOUSETILE = 10
 OTBM_ATTR_ITEM = 0x09
 
+# Next NODE_ESC / NODE_INIT / NODE_TERM byte: the runs of plain property bytes between them are skipped in C
+_NODE_MARKER_RE = re.compile(b'[\xfd-\xff]')
+
 def read_byte_escape(data, pos):
     """Read byte handling escape sequences"""
     if pos >= len(data):
@@ -45,19 +49,22 @@ def load_valid_ids(srv_file):
     print(f"Loading valid IDs from {srv_file}...")
     valid_ids = set()
     
+    # One bulk read instead of TextIOWrapper's 8 KiB chunked line iteration (text mode already folded \r\n)
     with open(srv_file, 'r', encoding='latin-1', errors='ignore') as f:
-        for line in f:
-            line = line.strip()
-            # Look for "TypeID = 1234"
-            if line.startswith("TypeID") and "=" in line:
-                try:
-                    # Split by '=' first, then remove comments with '#'
-                    val_part = line.split("=")[1].split("#")[0].strip()
-                    type_id = int(val_part)
-                    valid_ids.add(type_id)
-                except ValueError:
-                    continue
-                    
+        lines = f.read().split('\n')
+    
+    for line in lines:
+        line = line.strip()
+        # Look for "TypeID = 1234"
+        if line.startswith("TypeID") and "=" in line:
+            try:
+                # Split by '=' first, then remove comments with '#'
+                val_part = line.split("=")[1].split("#")[0].strip()
+                type_id = int(val_part)
+                valid_ids.add(type_id)
+            except ValueError:
+                continue
+                
     print(f"  Found {len(valid_ids)} valid object definitions in server.")
     return valid_ids
 
@@ -191,7 +198,9 @@ def convert_otbm_to_secs(otbm_file, out_dir, srv_file):
             depth -= 1
             i += 1
         else:
-            i += 1
+            # Plain property bytes carry nothing the converter reads: jump to the next marker in one scan
+            m = _NODE_MARKER_RE.search(data, i)
+            i = m.start() if m else len(data)
 
     print(f"\nConversion complete!")
     print(f"  Total tiles: {tile_count:,}")
@@ -212,7 +221,8 @@ def convert_otbm_to_secs(otbm_file, out_dir, srv_file):
 
     for (sx, sy, z), records in buckets.items():
         fname = out_dir / f"{sx:04d}-{sy:04d}-{z:02d}.sec"
-        with open(fname, "w", encoding="utf-8") as f:
+        # A sector file fits in one buffer: it reaches the OS as a single write instead of 8 KiB pieces
+        with open(fname, "w", encoding="utf-8", buffering=1 << 18) as f:
             f.write("# Tibia - graphical Multi-User-Dungeon\n")
             f.write(f"# Data for sector {sx}/{sy}/{z}\n\n")
             f.write("# SectorFormat=TextDump\n")
@@ -0,0 +1,83 @@
+"""
+Parse cache shared by sec_to_otbm.py and generate_rme_data.py
+
+Parsed inputs are pickled under the user cache directory ($XDG_CACHE_HOME/otbm-conv, default
+~/.cache/otbm-conv) and reused while the input files are unchanged. Each script passes its own
+cache version, so a parser change in one script never touches the other script's entries.
+"""
+import functools
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "otbm-conv"
+
+
+@functools.lru_cache(maxsize=None)
+def _source_digest(source):
+    """Hash of a parser's source file ('' when unreadable), read once per run"""
+    try:
+        return hashlib.blake2b(Path(source).read_bytes(), digest_size=8).hexdigest()
+    except OSError:
+        return ''
+
+
+def load_cached(kind, paths, build, version, source=None, store=None):
+    """Return build(), memoised in CACHE_DIR/<kind>-<slot>-<sig>.pkl (unless store(result) is false).
+    slot names the directories holding the inputs: storing an entry only replaces older entries of the
+    same kind and slot, so game folders used alternately each keep theirs.
+    sig covers `version`, the contents of the `source` file (the calling script, so editing a parser
+    rebuilds even without a version bump) and each input's path, mtime and size, so editing, adding or
+    removing a file rebuilds.
+    A missing cache just runs build(); an unreadable one (truncated, written by another version of the
+    code) is deleted and rebuilt. Failing to write one is not an error."""
+    inputs = sorted(Path(p).resolve() for p in paths)
+    slot = hashlib.blake2b("\0".join(sorted({str(p.parent) for p in inputs})).encode(), digest_size=4).hexdigest()
+    h = hashlib.blake2b(f"{version}:{kind}:{_source_digest(source) if source else ''}".encode(), digest_size=8)
+    for p in inputs:
+        try:
+            st = p.stat()
+        except OSError:
+            continue
+        h.update(f"\0{p}:{st.st_mtime_ns}:{st.st_size}".encode())
+    cache_file = CACHE_DIR / f"{kind}-{slot}-{h.hexdigest()}.pkl"
+    try:
+        with open(cache_file, 'rb') as f:
+            result = pickle.load(f)
+    except FileNotFoundError:
+        pass
+    except Exception:
+        # pickle.load can raise nearly anything on a bad file: drop it and fall back to parsing
+        try:
+            cache_file.unlink()
+        except OSError:
+            pass
+    else:
+        print(f"  ✓ {kind}: reused cached parse {cache_file.name}")
+        return result
+    result = build()
+    if store is not None and not store(result):
+        return result
+    tmp_name = None
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Unique temp file per writer: concurrent runs never replace() with each other's half-written pickle
+        with tempfile.NamedTemporaryFile(dir=CACHE_DIR, prefix=f"{kind}-", suffix='.tmp', delete=False) as f:
+            tmp_name = f.name
+            pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_name, cache_file)
+        tmp_name = None
+        for stale in CACHE_DIR.glob(f"{kind}-{slot}-*.pkl"):
+            if stale != cache_file:
+                stale.unlink(missing_ok=True)
+    except OSError:
+        pass
+    finally:
+        if tmp_name is not None:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+    return result
@@ -16,16 +16,25 @@ Output:
 Keeps original Tibia coordinates (map centered around 32000,32000).
 Map size: 65535x65535 (full OTBM size).
 """
+import functools
+import mmap
+import os
 import re
+import struct
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from collections import defaultdict
+from collections import defaultdict, namedtuple
+from operator import itemgetter
+
+from parse_cache import load_cached
 
 # First-seen logging: when we see a new type (charge, container, unknown key), log coords + .sec line
 # Attributes we skip when logging (we don't store them; server gives default)
 _DEBUG_LOG_SKIP = frozenset({'remainingexpiretime', 'savedexpiretime', 'remaininguses'})
 _debug_attributes_entries = []  # (type_name, context) for debug_attributes.log
 _LOGS_DIR = Path(__file__).resolve().parent / "logs"
+_CACHE_VERSION = 6  # bump when one of this script's cached parsers changes its output format
 
 # All 18 server instance attributes (enums.hh INSTANCEATTRIBUTE, objects.cc InstanceAttributeNames):
 #   0 Content          -> structure (nested Content={}); not a key=value
@@ -162,36 +171,55 @@ TILESTATE_REFRESH = 0x0020         # WE USE
 # ============================================================================
 # OTBM Writer
 # ============================================================================
+# Precompiled little-endian packers (no format-string parse per call)
+_U16 = struct.Struct('<H')
+_U32 = struct.Struct('<I')
+_POS = struct.Struct('<HHB')  # x, y, z position (tile area base, town temple)
+# Escaped form of every byte value: the byte itself, or NODE_ESC + byte for the three marker values
+_ESC_TABLE = [bytes((b,)) for b in range(256)]
+for _b in (NODE_ESC, NODE_INIT, NODE_TERM):
+    _ESC_TABLE[_b] = bytes((NODE_ESC, _b))
+del _b
+
+
 class OTBMWriter:
-    """Handles writing OTBM files with proper escape sequences"""
+    """Handles writing OTBM files with proper escape sequences.
+    target: optional binary file; the buffer is then flushed to it at node ends once it passes FLUSH_AT,
+    so the whole map is never held in memory."""
+    
+    FLUSH_AT = 1 << 20
     
-    def __init__(self):
+    def __init__(self, target=None):
         self.data = bytearray()
+        self.target = target
     
     def write_byte(self, b):
-        """Write a byte with escape handling"""
-        if b in (NODE_ESC, NODE_INIT, NODE_TERM):
-            self.data.append(NODE_ESC)
-        self.data.append(b)
+        """Write a byte with escape handling (one table lookup, no branch)"""
+        self.data += _ESC_TABLE[b]
+    
+    def write_raw(self, payload):
+        """Write already-packed bytes with escape handling (escaped in C via bytes.replace)"""
+        # 0xFD must go first so the escapes added for 0xFE/0xFF are not doubled
+        self.data.extend(payload.replace(b'\xfd', b'\xfd\xfd')
+                                .replace(b'\xfe', b'\xfd\xfe')
+                                .replace(b'\xff', b'\xfd\xff'))
     
     def write_uint16(self, val):
         """Write uint16 (little-endian) with escape handling"""
-        self.write_byte(val & 0xFF)
-        self.write_byte((val >> 8) & 0xFF)
+        self.write_raw(_U16.pack(val & 0xFFFF))
     
     def write_uint32(self, val):
         """Write uint32 (little-endian) with escape handling"""
-        self.write_byte(val & 0xFF)
-        self.write_byte((val >> 8) & 0xFF)
-        self.write_byte((val >> 16) & 0xFF)
-        self.write_byte((val >> 24) & 0xFF)
+        self.write_raw(_U32.pack(val & 0xFFFFFFFF))
     
     def write_string(self, s):
-        """Write string with length prefix"""
+        """Write string with length prefix (prefix and text escaped as one run)"""
         encoded = s.encode('latin-1')
-        self.write_uint16(len(encoded))
-        for b in encoded:
-            self.write_byte(b)
+        self.write_raw(_U16.pack(len(encoded) & 0xFFFF) + encoded)
+    
+    def write_position(self, x, y, z):
+        """Write an (x uint16, y uint16, z byte) position as one packed, escaped run"""
+        self.write_raw(_POS.pack(x & 0xFFFF, y & 0xFFFF, z))
     
     def start_node(self, node_type):
         """Start a new node"""
@@ -201,6 +229,14 @@ class OTBMWriter:
     def end_node(self):
         """End current node"""
         self.data.append(NODE_TERM)
+        if self.target is not None and len(self.data) >= self.FLUSH_AT:
+            self.flush()
+    
+    def flush(self):
+        """Push buffered bytes to target (no-op without one)"""
+        if self.target is not None and self.data:
+            self.target.write(self.data)
+            self.data.clear()
     
     def get_bytes(self):
         """Return the complete byte array"""
@@ -214,51 +250,50 @@ def parse_temples_from_moveuse(moveuse_path):
     """
     Parse tibia-game/dat/moveuse.dat section BEGIN "Hometeleporters".
     Lines with SetStart(Obj2,[x,y,z]) and "Home TownName (1)" give the actual temple position.
-    Returns dict: town_name -> (x, y, z). Uses first occurrence per town (prefer " (1)" over " (?)").
+    Returns dict: town_name without spaces ("Port Hope" -> "PortHope") -> (x, y, z).
+    Uses first occurrence per town (prefer " (1)" over " (?)").
     """
     path = Path(moveuse_path)
     if not path.exists():
         return {}
 
-    temples = {}  # town_name -> (x, y, z)
+    temples = {}  # town_name without spaces -> (x, y, z)
     in_section = False
 
-    with open(path, 'r', encoding='latin-1', errors='ignore') as f:
-        for line in f:
-            line = line.strip()
-            if line == 'BEGIN "Hometeleporters"':
-                in_section = True
+    for line in _read_text_lines(path):
+        line = line.strip()
+        if line == 'BEGIN "Hometeleporters"':
+            in_section = True
+            continue
+        if in_section:
+            if line.startswith('BEGIN ') or line == 'END':
+                break
+            # Line must have SetStart(Obj2,[x,y,z]) and "Home ... (1)" or "Home ... (?)"
+            if 'SetStart(Obj2,' not in line or '"Home ' not in line:
                 continue
-            if in_section:
-                if line.startswith('BEGIN ') or line == 'END':
-                    break
-                # Line must have SetStart(Obj2,[x,y,z]) and "Home ... (1)" or "Home ... (?)"
-                if 'SetStart(Obj2,' not in line or '"Home ' not in line:
-                    continue
-                try:
-                    # Coords: SetStart(Obj2,[32369,32241,07]) -> 32369, 32241, 7
-                    i = line.index('SetStart(Obj2,[') + len('SetStart(Obj2,[')
-                    j = line.index('])', i)
-                    coord_str = line[i:j]  # "32369,32241,07"
-                    coords = [int(c.strip()) for c in coord_str.split(',')]
-                    x, y, z = coords[0], coords[1], coords[2]
-                    # Town name: "Home Thais (1)" or "Home Port Hope (1)" -> Thais / Port Hope
-                    label_start = line.index('"Home ') + len('"Home ')
-                    label_end_1 = line.find(' (1)"', label_start)
-                    label_end_2 = line.find(' (?)"', label_start)
-                    if label_end_1 != -1:
-                        label_end = label_end_1
-                    elif label_end_2 != -1:
-                        label_end = label_end_2
-                    else:
-                        continue
-                    name = line[label_start:label_end]
-                    # Prefer (1) over (?): only overwrite if we don't have this name yet, or if current is (1)
-                    if name not in temples or ' (1)"' in line:
-                        temples[name] = (x, y, z)
-                        temples[name.replace(' ', '')] = (x, y, z)  # "Port Hope" -> "PortHope"
-                except (ValueError, IndexError):
+            try:
+                # Coords: SetStart(Obj2,[32369,32241,07]) -> 32369, 32241, 7
+                i = line.index('SetStart(Obj2,[') + len('SetStart(Obj2,[')
+                j = line.index('])', i)
+                coord_str = line[i:j]  # "32369,32241,07"
+                coords = [int(c.strip()) for c in coord_str.split(',')]
+                x, y, z = coords[0], coords[1], coords[2]
+                # Town name: "Home Thais (1)" or "Home Port Hope (1)" -> Thais / Port Hope
+                label_start = line.index('"Home ') + len('"Home ')
+                label_end_1 = line.find(' (1)"', label_start)
+                label_end_2 = line.find(' (?)"', label_start)
+                if label_end_1 != -1:
+                    label_end = label_end_1
+                elif label_end_2 != -1:
+                    label_end = label_end_2
+                else:
                     continue
+                name = line[label_start:label_end].replace(' ', '')  # "Port Hope" -> "PortHope"
+                # Prefer (1) over (?): only overwrite if we don't have this name yet, or if current is (1)
+                if name not in temples or ' (1)"' in line:
+                    temples[name] = (x, y, z)
+            except (ValueError, IndexError):
+                continue
 
     return temples
 
@@ -266,10 +301,15 @@ def parse_temples_from_moveuse(moveuse_path):
 # ============================================================================
 # Parse map.dat for towns (Depot = id+name); temple from moveuse or Mark
 # ============================================================================
+# Well-formed Depot / Mark lines in one match each; anything else goes through the manual split below
+_DEPOT_RE = re.compile(r'Depot\s*=\s*\(\s*(\d+)\s*,\s*"([^",]*)"\s*,')
+_MARK_RE = re.compile(r'Mark\s*=\s*\(\s*"([^"\[]*)"\s*,\s*\[\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*\]')
+
+
 def parse_map_dat(map_dat_path, temple_positions=None):
     """
     Parse tibia-game/dat/map.dat for Depots (town id + name).
-    Temple position: use temple_positions[name] if provided (from moveuse Hometeleporters),
+    Temple position: use temple_positions[name without spaces] if provided (from moveuse Hometeleporters),
     else fall back to Mark lines in map.dat.
     Returns list of dicts: [{'id': town_id, 'name': str, 'x': int, 'y': int, 'z': int}, ...]
     town_id = depot_id + 1 (Thais depot 0 -> town 1).
@@ -279,50 +319,56 @@ def parse_map_dat(map_dat_path, temple_positions=None):
         return []
 
     depots = []   # (depot_id, name)
-    marks = {}    # name -> (x, y, z); fallback from map.dat Mark lines
-
-    with open(path, 'r', encoding='latin-1', errors='ignore') as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith('#'):
+    marks = {}    # name without spaces -> (x, y, z); fallback from map.dat Mark lines
+
+    for line in _read_text_lines(path):
+        line = line.strip()
+        # First-character dispatch: blank, comment and other lines skip the startswith calls
+        c = line[:1]
+        if c == 'D' and line.startswith('Depot'):
+            # Depot = (0,"Thais",1000)
+            m = _DEPOT_RE.match(line)
+            if m:
+                depots.append((int(m.group(1)), m.group(2)))
+                continue
+            try:
+                rest = line.partition('=')[2].strip().strip('()')
+                parts = [p.strip() for p in rest.split(',', 2)]
+                depot_id = int(parts[0])
+                name = parts[1].strip('"')
+                depots.append((depot_id, name))
+            except (ValueError, IndexError):
                 continue
 
-            if line.startswith('Depot'):
-                # Depot = (0,"Thais",1000)
-                try:
-                    rest = line.split('=', 1)[1].strip().strip('()')
-                    parts = [p.strip() for p in rest.split(',', 2)]
-                    depot_id = int(parts[0])
-                    name = parts[1].strip('"')
-                    depots.append((depot_id, name))
-                except (ValueError, IndexError):
-                    continue
-
-            elif line.startswith('Mark'):
-                # Mark = ("Thais",[32369,32215,7])  (fallback if no moveuse temples)
-                try:
-                    rest = line.split('=', 1)[1].strip()
-                    name_start = rest.index('"') + 1
-                    name_end = rest.index('"', name_start)
-                    name = rest[name_start:name_end]
-                    bracket_start = rest.index('[')
-                    bracket_end = rest.index(']', bracket_start)
-                    rest = rest[bracket_start + 1 : bracket_end]
-                    coords = [int(c.strip()) for c in rest.split(',')]
-                    x, y, z = coords[0], coords[1], coords[2]
-                    marks[name] = (x, y, z)
-                    marks[name.replace(' ', '')] = (x, y, z)
-                except (ValueError, IndexError):
-                    continue
+        elif c == 'M' and line.startswith('Mark'):
+            # Mark = ("Thais",[32369,32215,7])  (fallback if no moveuse temples)
+            m = _MARK_RE.match(line)
+            if m:
+                marks[m.group(1).replace(' ', '')] = (int(m.group(2)), int(m.group(3)), int(m.group(4)))
+                continue
+            try:
+                rest = line.partition('=')[2].strip()
+                name_start = rest.index('"') + 1
+                name_end = rest.index('"', name_start)
+                name = rest[name_start:name_end]
+                bracket_start = rest.index('[')
+                bracket_end = rest.index(']', bracket_start)
+                rest = rest[bracket_start + 1 : bracket_end]
+                coords = [int(c.strip()) for c in rest.split(',')]
+                x, y, z = coords[0], coords[1], coords[2]
+                marks[name.replace(' ', '')] = (x, y, z)
+            except (ValueError, IndexError):
+                continue
 
     towns = []
     for depot_id, name in depots:
         # Prefer temple from moveuse.dat Hometeleporters (SetStart), else map.dat Mark
         pos = None
+        key = name.replace(' ', '')
         if temple_positions:
-            pos = temple_positions.get(name) or temple_positions.get(name.replace(' ', ''))
+            pos = temple_positions.get(key)
         if pos is None:
-            pos = marks.get(name) or marks.get(name.replace(' ', ''))
+            pos = marks.get(key)
         if pos is None:
             continue
         x, y, z = pos
@@ -346,50 +392,341 @@ def load_unpass_type_ids(objects_srv_path):
         return set()
     unpass = set()
     current_type_id = None
-    with open(path, 'r', encoding='latin-1', errors='ignore') as f:
-        for line in f:
-            line = line.strip()
-            if line.startswith('TypeID'):
-                match = re.search(r'TypeID\s*=\s*(\d+)', line)
-                if match:
-                    current_type_id = int(match.group(1))
-            elif current_type_id is not None and line.startswith('Flags'):
-                match = re.search(r'Flags\s*=\s*\{([^}]*)\}', line)
-                if match:
-                    flags_str = match.group(1)
-                    flags = {s.strip().lower() for s in flags_str.split(',')}
-                    if 'unpass' in flags:
-                        unpass.add(current_type_id)
-                current_type_id = None
+    for line in _read_text_lines(path):
+        line = line.strip()
+        if line.startswith('TypeID'):
+            match = re.search(r'TypeID\s*=\s*(\d+)', line)
+            if match:
+                current_type_id = int(match.group(1))
+        elif current_type_id is not None and line.startswith('Flags'):
+            match = re.search(r'Flags\s*=\s*\{([^}]*)\}', line)
+            if match:
+                flags_str = match.group(1)
+                flags = {s.strip().lower() for s in flags_str.split(',')}
+                if 'unpass' in flags:
+                    unpass.add(current_type_id)
+            current_type_id = None
     return unpass
 
 
-def load_walkable_tiles_from_sectors(sectors, unpass_type_ids=None):
+# Packed tile key: one int per (x, y, z) instead of a tuple (cheaper hash, far less memory).
+# Linear in each coordinate, so a neighbour is key + dx + dy * _KEY_Y. Unique while 0 <= x, y < 2**20,
+# which covers every 4-digit sector filename.
+_KEY_Y = 1 << 20
+_KEY_Z = 1 << 40
+
+
+# Spawn placement grid values (0 = not walkable)
+_TILE_FREE = 1
+_TILE_USED = 2
+
+# Farthest any spawn search looks from its center, Chebyshev distance (placement rings run to radius 49)
+_SPAWN_REACH = 49
+
+
+def _tile_key(x, y, z):
+    """Packed set key for tile (x, y, z); see _KEY_Y / _KEY_Z"""
+    return x + y * _KEY_Y + z * _KEY_Z
+
+
+def _spawn_axis(coords):
+    """Compressed layout of one grid axis for the tile coordinates in `coords`.
+    Coordinates within 2 * _SPAWN_REACH of a tile are kept and numbered consecutively; longer empty
+    gaps collapse. Every search from a center within _SPAWN_REACH of a tile only crosses kept
+    coordinates, so key + dx + dy * width still lands on the right cell.
+    Returns (lo, index, size): index[c - lo] is the cell of a possible center c, -1 when c is out of reach."""
+    reach = _SPAWN_REACH
+    # Slice fills are order- and repeat-independent: only the extremes are needed, so no sort or dedup
+    lo = min(coords) - 2 * reach
+    near = bytearray(max(coords) + 2 * reach - lo + 1)  # 1 = kept, 2 = kept and a possible center
+    kept = b'\x01' * (4 * reach + 1)
+    center = b'\x02' * (2 * reach + 1)
+    for c in coords:
+        near[c - lo - 2 * reach:c - lo + 2 * reach + 1] = kept
+    for c in coords:
+        near[c - lo - reach:c - lo + reach + 1] = center
+    index = [-1] * len(near)
+    size = 0
+    for i, v in enumerate(near):
+        if v:
+            if v == 2:
+                index[i] = size
+            size += 1
+    return lo, index, size
+
+
+class _SpawnGrid:
+    """Walkable tiles for spawn placement as one bytearray: 0 = not walkable, else _TILE_FREE / _TILE_USED.
+    Cells are laid out x-fastest on compressed axes (see _spawn_axis), so a neighbour of cell k is
+    k + dx + dy * width. A few bytes per cell instead of a dict entry per walkable tile."""
+    
+    def __init__(self, x_axis, y_axis, z0, depth):
+        self.x_lo, self.x_index, self.width = x_axis
+        self.y_lo, self.y_index, self.height = y_axis
+        self.z0 = z0
+        self.depth = depth
+        self.state = bytearray(self.width * self.height * depth)
+    
+    def key(self, x, y, z):
+        """Cell of (x, y, z) as a search center; None when no walkable tile is within _SPAWN_REACH"""
+        i = x - self.x_lo
+        j = y - self.y_lo
+        k = z - self.z0
+        if 0 <= i < len(self.x_index) and 0 <= j < len(self.y_index) and 0 <= k < self.depth:
+            cx = self.x_index[i]
+            cy = self.y_index[j]
+            if cx >= 0 and cy >= 0:
+                return cx + (cy + k * self.height) * self.width
+        return None
+    
+    def floor(self, z):
+        """Copy of floor z as a single-floor grid (to place that floor in another process)"""
+        sub = _SpawnGrid((self.x_lo, self.x_index, self.width), (self.y_lo, self.y_index, self.height), z, 1)
+        plane = self.width * self.height
+        k = z - self.z0
+        if 0 <= k < self.depth:
+            sub.state[:] = self.state[k * plane:(k + 1) * plane]
+        return sub
+
+
+def load_walkable_tiles_from_sectors(areas, unpass_type_ids=None):
     """
-    Build a set of walkable tile positions from the sector data.
+    Build the walkable tile grid (_SpawnGrid, walkable cells _TILE_FREE) from the tile areas of load_all_sectors.
     A tile is walkable if it has items and no item on the tile has Unpass (objects.srv Flags).
     If unpass_type_ids is None, any tile with items is considered potentially walkable (legacy).
+    Returns (grid, number of walkable tiles).
     """
-    walkable_tiles = set()
-    for (sx, sy, z), tiles in sectors.items():
-        for tile_entry in tiles:
-            lx, ly = tile_entry[0], tile_entry[1]
-            items = tile_entry[3] if len(tile_entry) == 4 else tile_entry[2]
+    if not areas:
+        return _SpawnGrid((0, [], 0), (0, [], 0), 0, 0), 0
+    xs = set()
+    ys = set()
+    for tiles in areas.values():
+        xs.update(map(_TILE_X, tiles))
+        ys.update(map(_TILE_Y, tiles))
+    z0 = min(z for _, _, z in areas)
+    grid = _SpawnGrid(_spawn_axis(xs), _spawn_axis(ys), z0, max(z for _, _, z in areas) - z0 + 1)
+    state = grid.state
+    x_lo, x_index, width = grid.x_lo, grid.x_index, grid.width
+    y_lo, y_index = grid.y_lo, grid.y_index
+    for (_area_x, _area_y, z), tiles in areas.items():
+        floor_base = (z - z0) * grid.height
+        for x, y, _map_flags, items in tiles:
             if not items:
                 continue
-            if unpass_type_ids is not None:
-                item_ids = {item.get('id') for item in items if item.get('id') is not None}
-                if item_ids & unpass_type_ids:
-                    continue  # tile has Unpass (e.g. wall) -> not walkable
-            abs_x = sx * SECTOR_SIZE + lx
-            abs_y = sy * SECTOR_SIZE + ly
-            walkable_tiles.add((abs_x, abs_y, z))
-    return walkable_tiles
+            # Tile has Unpass (e.g. wall) -> not walkable; isdisjoint stops at the first hit, no per-tile id set
+            if unpass_type_ids is not None and not unpass_type_ids.isdisjoint(map(_ITEM_ID, items)):
+                continue
+            state[x_index[x - x_lo] + (y_index[y - y_lo] + floor_base) * width] = _TILE_FREE
+    return grid, state.count(_TILE_FREE)
+
+
+def _ring_offsets(radius):
+    """Yield the (dx, dy) offsets on the square ring at `radius` (just (0, 0) for radius 0).
+    Order is dx-major, the same as scanning the full square and keeping the perimeter."""
+    full = range(-radius, radius + 1)
+    ends = (-radius, radius)
+    for dx in full:
+        for dy in (full if dx == -radius or dx == radius else ends):
+            yield dx, dy
+
+
+def _ring_search_offsets(radii, width):
+    """(dx, dy, cell_delta, key_delta) for every ring in `radii`, ring by ring in _ring_offsets order.
+    cell_delta moves a _SpawnGrid cell of row `width`, key_delta a _tile_key. Built once per run."""
+    return tuple((dx, dy, dx + dy * width, dx + dy * _KEY_Y) for radius in radii for dx, dy in _ring_offsets(radius))
+
+
+def _find_free_center(center_key, cell, offsets, state, spawn_centers):
+    """First (dx, dy) in `offsets` whose tile is walkable and not already a spawn center; None if there is none.
+    center_key: _tile_key of the center (spawn_centers holds those); cell: its grid cell, None when out of reach."""
+    if cell is None:
+        return None
+    for dx, dy, delta, key_delta in offsets:
+        if state[cell + delta] and center_key + key_delta not in spawn_centers:
+            return dx, dy
+    return None
+
+
+def _find_free_tile(cell, offsets, state):
+    """First (dx, dy) in `offsets` whose tile is walkable and nobody stands on; None if there is none"""
+    if cell is None:
+        return None
+    for dx, dy, delta, _ in offsets:
+        if state[cell + delta] == _TILE_FREE:
+            return dx, dy
+    return None
+
+
+def _place_spawn_creatures(cell, amount, grid, placement_offsets):
+    """Claim up to `amount` free walkable tiles spiralling out from the spawn center cell (radius <= _SPAWN_REACH).
+    placement_offsets: _ring_search_offsets for rings 0.._SPAWN_REACH, so each ring is walked perimeter-only
+    from a list built once per run. Claimed cells are set to _TILE_USED. Returns (offsets, skipped_unwalkable)."""
+    offsets = []
+    skipped = 0
+    if amount <= 0:
+        return offsets, skipped
+    if cell is None:
+        # No walkable tile within reach: every probe of the full search misses
+        return offsets, (2 * _SPAWN_REACH + 1) ** 2
+    # One byte read per probe answers both "walkable?" and "free?"
+    state = grid.state
+    append = offsets.append
+    for dx, dy, delta, _ in placement_offsets:
+        tile = cell + delta
+        cell_state = state[tile]
+        if not cell_state:
+            skipped += 1
+        elif cell_state == _TILE_FREE:
+            state[tile] = _TILE_USED
+            append((dx, dy))
+            if len(offsets) >= amount:
+                return offsets, skipped
+    return offsets, skipped
+
+
+def _place_monster_floor(spawns, grid, spawn_centers, center_offsets, placement_offsets):
+    """Center nudge + creature placement for monster spawns, in monster.db order.
+    spawns: (monster_name, x, y, z, amount, spawntime) tuples. grid / spawn_centers are updated in place. Returns one
+    (center_x, center_y, creature_offsets, skipped_unwalkable, shifted_from) per spawn; shifted_from is the
+    original (x, y) when the center was nudged off another spawn center, else None."""
+    results = []
+    for _, center_x, center_y, z, amount, _ in spawns:
+        shifted_from = None
+        
+        # Nudge spawn center ONLY when another spawn center is there; nudged center must be walkable (no Unpass)
+        center_key = _tile_key(center_x, center_y, z)
+        if center_key in spawn_centers:
+            nudge = _find_free_center(center_key, grid.key(center_x, center_y, z), center_offsets,
+                                      grid.state, spawn_centers)
+            if nudge is not None:
+                shifted_from = (center_x, center_y)
+                center_x, center_y = center_x + nudge[0], center_y + nudge[1]
+        spawn_centers.add(_tile_key(center_x, center_y, z))
+        
+        # Place creatures on unique, WALKABLE tiles and track their offsets
+        creature_offsets, skipped = _place_spawn_creatures(grid.key(center_x, center_y, z), amount, grid,
+                                                           placement_offsets)
+        results.append((center_x, center_y, creature_offsets, skipped, shifted_from))
+    return results
+
+
+# Below this many monster spawns, forking workers costs more than it saves
+_PARALLEL_SPAWN_MIN = 2000
+
+
+def _place_monster_spawns(spawns, grid, spawn_centers, center_offsets, placement_offsets):
+    """_place_monster_floor over all spawns; results are aligned with `spawns`.
+    Floors never share tiles or centers, so with several CPUs and enough spawns each floor is placed in
+    its own process and the claims are replayed into grid / spawn_centers afterwards."""
+    floors = defaultdict(list)  # z -> indices into spawns
+    for i, spawn in enumerate(spawns):
+        floors[spawn[3]].append(i)
+    workers = min(len(floors), os.cpu_count() or 1)
+    if workers < 2 or len(spawns) < _PARALLEL_SPAWN_MIN:
+        return _place_monster_floor(spawns, grid, spawn_centers, center_offsets, placement_offsets)
+    
+    floor_centers = defaultdict(set)
+    for key in spawn_centers:
+        floor_centers[key // _KEY_Z].add(key)
+    
+    results = [None] * len(spawns)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            (indices, pool.submit(_place_monster_floor, [spawns[i] for i in indices],
+                                  grid.floor(z), floor_centers.get(z, set()), center_offsets, placement_offsets))
+            for z, indices in floors.items()
+        ]
+        for indices, future in futures:
+            for i, result in zip(indices, future.result()):
+                results[i] = result
+    
+    # Replay the workers' claims so the NPC pass sees the same state as a serial run
+    state = grid.state
+    for spawn, (center_x, center_y, creature_offsets, _, _) in zip(spawns, results):
+        z = spawn[3]
+        spawn_centers.add(_tile_key(center_x, center_y, z))
+        if creature_offsets:
+            cell = grid.key(center_x, center_y, z)
+            for dx, dy in creature_offsets:
+                state[cell + dx + dy * grid.width] = _TILE_USED
+    return results
+
+
+# ============================================================================
+# Parse cache (parse_cache.py, reused across runs)
+# ============================================================================
+def _load_cached(kind, paths, build, store=None):
+    """parse_cache.load_cached under this script's _CACHE_VERSION and source"""
+    return load_cached(kind, paths, build, _CACHE_VERSION, source=__file__, store=store)
 
 
 # ============================================================================
 # Parse .sec files
 # ============================================================================
+def _read_file_bytes(path, require=None):
+    """Return the whole file as bytes via a read-only mmap (one bulk copy, no per-line buffered reads).
+    Empty files cannot be mapped and return b''. require: bytes that must occur in the file;
+    when they don't, b'' is returned without copying anything out of the mapping."""
+    with open(path, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return b''
+        with mm:
+            if require is not None and mm.find(require) < 0:
+                return b''
+            return mm.read()
+
+
+def _read_text(path, require=None):
+    """Read a latin-1 text file in one bulk pass (no TextIOWrapper per-line decoding).
+    CRLF and lone CR are normalised to \\n like text mode. require: see _read_file_bytes."""
+    text = _read_file_bytes(path, require).decode('latin-1')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+
+def _read_text_lines(path, require=None):
+    """Lines of _read_text(path) without line endings; matches iterating the open file."""
+    return _read_text(path, require).split('\n')
+
+
+# bytes.split() breaks only on ASCII whitespace; str.split() on the latin-1 text also breaks on these
+_LATIN1_SPACE_TO_ASCII = bytes.maketrans(b'\x1c\x1d\x1e\x1f\x85\xa0', b'      ')
+
+
+def _read_token_lines(path):
+    """Lines of a file as undecoded bytes, for parsers that only pull ASCII numbers out of split() tokens.
+    CR / CRLF are normalised and latin-1-only whitespace becomes a space, so line.split() gives the
+    same tokens as on _read_text_lines, with no decode."""
+    data = _read_file_bytes(path).translate(_LATIN1_SPACE_TO_ASCII)
+    if b'\r' in data:
+        data = data.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+    return data.split(b'\n')
+
+
+def _scan_dir_files(directory, suffix):
+    """DirEntry objects for the files in `directory` whose name ends with `suffix`, in directory order
+    (the order Path.glob yields); [] when the directory is missing. One os.scandir pass with a plain
+    endswith filter: no fnmatch pattern, and is_file() is answered from the entry type without a stat."""
+    try:
+        with os.scandir(directory) as it:
+            return [entry for entry in it if entry.name.endswith(suffix) and entry.is_file()]
+    except OSError:
+        return []
+
+
+def _map_files_threaded(parse_one, files):
+    """parse_one(path) for many small files on a thread pool; results come back in input order.
+    File open/read releases the GIL, so the per-file syscall latency overlaps."""
+    files = list(files)
+    if len(files) < 2:
+        return [parse_one(path) for path in files]
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as pool:
+        return list(pool.map(parse_one, files))
+
+
 def _parse_sec_tile_flags(rest_before_content):
     """Parse tile flags from the part before Content=. Returns uint32 flags for OTBM.
     Real .sec examples: 'Refresh, ProtectionZone, Content={...}' (1023-0989-06.sec), etc. See docs/SEC_OTBM_DATA_CHECKLIST.md."""
@@ -408,57 +745,92 @@ def _parse_sec_tile_flags(rest_before_content):
     return flags
 
 
-def _parse_sec_content_list(content_str, context=None):
-    """
-    Parse Content={...} inner string into list of item specs.
-    Split by comma only at top level: not inside String="..." (respects escaped \\ and \\")
-    and not inside nested Content={} (brace-matched).
-    Container items have nested Content={...}; we parse recursively into item_data['content'].
-    context: optional dict with sec_file, lx, ly, line for debug_attributes.log (all occurrences, by type).
-    """
-    items = []
-    segments = []
+def _scan_top_level(s, want_close_brace=True):
+    """Walk a Content={...} body: skip String="..." values (respecting \\ escapes) and track {} depth.
+    want_close_brace=True: s starts just inside a '{'; return the index just past its matching '}' (-1 if unbalanced).
+    want_close_brace=False: return the positions of top-level commas (the item separators)."""
+    n = len(s)
     i = 0
-    start = 0
-    in_string = False
+    in_str = False
     escape = False
-    depth = 0
-    while i < len(content_str):
-        c = content_str[i]
+    depth = 1 if want_close_brace else 0
+    commas = []
+    while i < n:
+        c = s[i]
         if escape:
             escape = False
             i += 1
             continue
-        if in_string:
+        if in_str:
             if c == '\\':
                 escape = True
             elif c == '"':
-                in_string = False
+                in_str = False
             i += 1
             continue
-        if content_str[i:i+8] == 'String="' and i + 8 <= len(content_str):
-            in_string = True
+        if c == 'S' and s.startswith('String="', i):
+            in_str = True
             i += 8
             continue
         if c == '{':
             depth += 1
         elif c == '}':
             depth -= 1
-        elif c == ',' and depth == 0 and not in_string:
+            if want_close_brace and depth == 0:
+                return i + 1
+        elif c == ',' and depth == 0:
+            commas.append(i)
+        i += 1
+    return -1 if want_close_brace else commas
+
+
+# Characters that need the _scan_top_level walk; a Content= body without them is split and closed by plain search
+_SEC_NESTING_RE = re.compile(r'[{}"]')
+# Content={ body up to its closing brace when it holds no string and no nested Content={}
+_SEC_PLAIN_CONTENT_RE = re.compile(r'[^{}"]*\}')
+
+
+def _parse_sec_content_list(content_str, context=None):
+    """
+    Parse Content={...} inner string into list of item specs.
+    Split by comma only at top level: not inside String="..." (respects escaped \\ and \\")
+    and not inside nested Content={} (brace-matched).
+    Container items have nested Content={...}; we parse recursively into attrs['content'].
+    context: optional dict with sec_file, lx, ly, line for debug_attributes.log (all occurrences, by type).
+    """
+    items = []
+    if _SEC_NESTING_RE.search(content_str) is None:
+        # No strings or nested braces: every comma is a top-level separator
+        segments = [spec.strip() for spec in content_str.split(',')]
+    else:
+        segments = []
+        start = 0
+        for i in _scan_top_level(content_str, want_close_brace=False):
             segments.append(content_str[start:i].strip())
             start = i + 1
-        i += 1
-    if start < len(content_str):
-        segments.append(content_str[start:].strip())
+        if start < len(content_str):
+            segments.append(content_str[start:].strip())
     for spec in segments:
         if spec:
             _append_item_from_spec(items, spec, context)
     return items
 
 
+@functools.lru_cache(maxsize=8192)
+def _to_int(s):
+    """int(s), memoized: item ids and attribute values repeat across the whole map (ValueError is not cached)."""
+    return int(s)
+
+
+# Item spec of an id and Key=number attributes only (anything else takes the split() path below)
+_ITEM_SPEC_RE = re.compile(r'(\d+)((?:\s+\w+=-?\d+)*)', re.ASCII)
+_ITEM_ATTR_RE = re.compile(r'\s+(\w+)=(-?\d+)', re.ASCII)
+
+
 def _append_item_from_spec(items, spec, context=None):
     """Parse one item spec (e.g. '2816', '2816 String="text"', '2434 Content={3124}').
-    Nested Content={...} is parsed recursively and stored as item_data['content'].
+    Appends an (id, attrs) tuple; attrs is a dict of parsed attributes, or None for a plain id.
+    Nested Content={...} is parsed recursively and stored as attrs['content'].
     When context is set, each attribute/container/string occurrence is recorded for logs/debug_attributes.log (sorted by type).
     Order matters: extract Content={...} (brace-matched) BEFORE String="...", else the string truncation loses the closing }} and nested item ids (e.g. 2822) can be mis-parsed."""
     string_val = None
@@ -503,142 +875,154 @@ def _append_item_from_spec(items, spec, context=None):
             end = i
         string_val = rest[:end].replace('\\n', '\n').replace('\\"', '"')
         spec = head
-    parts = spec.split()
-    if not parts:
-        return
-    try:
-        item_id = int(parts[0])
-    except (ValueError, IndexError):
-        return
-    item_data = {'id': item_id}
+    # Common shape first: an id plus optional Key=number attributes, tokenized by one regex match
+    m = _ITEM_SPEC_RE.fullmatch(spec)
+    if m is not None:
+        item_id = _to_int(m[1])
+        attrs_str = m[2]
+        if string_val is None and nested_content_str is None and not attrs_str:
+            items.append((item_id, None))  # plain item, the common case: no attribute dict at all
+            return
+        pairs = [(key, value) for key, value in _ITEM_ATTR_RE.findall(attrs_str)
+                 if not key.endswith(('String', 'Content'))]
+    else:
+        parts = spec.split()
+        if not parts:
+            return
+        try:
+            item_id = _to_int(parts[0])
+        except ValueError:
+            return
+        pairs = [part.partition('=')[::2] for part in parts[1:]
+                 if '=' in part and 'String=' not in part and 'Content=' not in part]
+    item_data = {}
     if string_val is not None:
         item_data['text'] = string_val
         if context is not None:
             _log_new_type("string", context)
     if nested_content_str is not None:
         item_data['content'] = _parse_sec_content_list(nested_content_str, context)
-    for part in parts[1:]:
-        if '=' in part and 'String=' not in part and 'Content=' not in part:
-            key, value = part.split('=', 1)
-            key = key.lower()
-            if context is not None:
-                _log_new_type(key, context)
-            try:
-                v = int(value)
-            except ValueError:
-                continue
-            if key in ('chestquestnumber', 'doorquestnumber', 'keyholenumber', 'level'):
-                item_data['actionid'] = v  # level = required level for level doors (Gate of Expertise); RME has no Level attr, Action ID is conventional
-            elif key == 'keynumber':
-                item_data['uniqueid'] = v
-            elif key == 'doorquestvalue':
-                item_data['uniqueid'] = v  # RME disables "Door ID" for non-house tiles; Unique ID is visible for all doors
-            elif key == 'amount':
-                item_data['count'] = v
-            elif key in ('poolliquidtype', 'containerliquidtype'):
-                item_data['liquid_type'] = v
-            elif key == 'charges':
-                item_data['charges'] = v
-            elif key == 'absteleportdestination':
-                item_data['teleport_dest'] = _unpack_absolute_coordinate(v)  # RME OTBM_ATTR_TELE_DEST = (x, y, z)
-            elif key in ('remainingexpiretime', 'savedexpiretime', 'remaininguses'):
-                pass  # skip: server gives default (full TotalExpireTime / TotalUses) on load when omitted
-            else:
-                item_data[key] = v
-    items.append(item_data)
+    for key, value in pairs:
+        key = key.lower()
+        if context is not None:
+            _log_new_type(key, context)
+        try:
+            v = _to_int(value)
+        except ValueError:
+            continue
+        if key in ('chestquestnumber', 'doorquestnumber', 'keyholenumber', 'level'):
+            item_data['actionid'] = v  # level = required level for level doors (Gate of Expertise); RME has no Level attr, Action ID is conventional
+        elif key == 'keynumber':
+            item_data['uniqueid'] = v
+        elif key == 'doorquestvalue':
+            item_data['uniqueid'] = v  # RME disables "Door ID" for non-house tiles; Unique ID is visible for all doors
+        elif key == 'amount':
+            item_data['count'] = v
+        elif key in ('poolliquidtype', 'containerliquidtype'):
+            item_data['liquid_type'] = v
+        elif key == 'charges':
+            item_data['charges'] = v
+        elif key == 'absteleportdestination':
+            item_data['teleport_dest'] = _unpack_absolute_coordinate(v)  # RME OTBM_ATTR_TELE_DEST = (x, y, z)
+        elif key in ('remainingexpiretime', 'savedexpiretime', 'remaininguses'):
+            pass  # skip: server gives default (full TotalExpireTime / TotalUses) on load when omitted
+        else:
+            item_data[key] = v
+    items.append((item_id, item_data or None))
+
+
+# Tile line prefix: lx, ly, flags text before the first Content={ (the content itself is brace-matched)
+_SEC_LINE_RE = re.compile(r'(\d+)-(\d+):(.*?)Content=\{')
 
 
-def parse_sec_file(sec_file):
-    """Parse a single .sec file and return tiles with items and tile flags."""
+def parse_sec_file(sec_file, sector=None):
+    """Parse a single .sec file and return tiles with items and tile flags.
+    sector: (sx, sy, z) from the filename when the caller already parsed it; otherwise taken from the stem."""
     tiles = []
     
-    with open(sec_file, 'r', encoding='latin-1', errors='ignore') as f:
-        for line in f:
-            line = line.strip()
+    # Absolute coords from sector filename (e.g. 0998-0990-05.sec) + tile (lx, ly); same for every line
+    if sector is None:
+        try:
+            parts = Path(sec_file).stem.split("-")
+            sector = (int(parts[0]), int(parts[1]), int(parts[2]))
+        except (ValueError, IndexError):
+            sector = None
+    if sector is not None:
+        sx, sy, sz = sector
+        base_x = sx * SECTOR_SIZE
+        base_y = sy * SECTOR_SIZE
+    else:
+        base_x = base_y = sz = None
+    sec_file_str = str(sec_file)
+    
+    # Sectors without a single Content={ (empty / flags-only) never yield tiles: skip them before decoding
+    for line in _read_text_lines(sec_file, require=b'Content={'):
+        # Cheap reject before strip: comment/blank/flag-only lines never carry Content=
+        if 'Content=' not in line:
+            continue
+        line = line.strip()
+        
+        try:
+            # Well-formed "lx-ly: [flags, ]Content={" prefix in one match; anything else takes the split path
+            m = _SEC_LINE_RE.match(line)
+            if m is not None:
+                lx = int(m.group(1))
+                ly = int(m.group(2))
+                rest_before_content = m.group(3)
+                content_part = line[m.end():]
+            else:
+                if not line or line.startswith('#'):
+                    continue
+                coords_part, sep, rest = line.partition(':')
+                if not sep:
+                    continue
+                lx, ly = map(int, coords_part.strip().split('-'))
+                rest_before_content, sep, content_part = rest.partition('Content={')
+                if not sep:
+                    continue
             
-            if not line or line.startswith('#'):
+            # Content={} (flags-only tile, no items): reject before the brace scan
+            if content_part.startswith('}'):
                 continue
+            # Brace-matched extract: do not truncate at first '}' (nested Content={}).
+            # Plain bodies (no string, no nesting) end at the first '}' and skip the character walk
+            m = _SEC_PLAIN_CONTENT_RE.match(content_part)
+            if m is not None:
+                end = m.end()
+            else:
+                end = _scan_top_level(content_part)
+                if end < 0:
+                    continue
+            content_str = content_part[:end - 1]
             
-            if ':' not in line or 'Content=' not in line:
+            if content_str.isspace():
                 continue
             
-            try:
-                coords_part, rest = line.split(':', 1)
-                lx, ly = map(int, coords_part.strip().split('-'))
-                
-                if 'Content={' not in rest:
-                    continue
-                
-                rest_before_content = rest.split('Content={', 1)[0].strip()
-                map_flags = _parse_sec_tile_flags(rest_before_content)
-                
-                try:
-                    content_part = rest.split('Content={', 1)[1]
-                    # Brace-matched extract: do not truncate at first '}' (nested Content={}).
-                    depth = 1
-                    i = 0
-                    in_str = False
-                    escape = False
-                    while i < len(content_part) and depth > 0:
-                        if escape:
-                            escape = False
-                            i += 1
-                            continue
-                        if in_str:
-                            if content_part[i] == '\\':
-                                escape = True
-                            elif content_part[i] == '"':
-                                in_str = False
-                            i += 1
-                            continue
-                        if content_part[i:i+8] == 'String="' and i + 8 <= len(content_part):
-                            in_str = True
-                            i += 8
-                            continue
-                        if content_part[i] == '{':
-                            depth += 1
-                        elif content_part[i] == '}':
-                            depth -= 1
-                        i += 1
-                    if depth != 0:
-                        continue
-                    content_str = content_part[:i - 1]
-                except IndexError:
-                    continue
-                    
-                if not content_str.strip():
-                    continue
-                
-                # Absolute coords from sector filename (e.g. 0998-0990-05.sec) + tile (lx, ly)
-                try:
-                    stem = Path(sec_file).stem
-                    parts = stem.split("-")
-                    if len(parts) >= 3:
-                        sx, sy, sz = int(parts[0]), int(parts[1]), int(parts[2])
-                        abs_x = sx * SECTOR_SIZE + lx
-                        abs_y = sy * SECTOR_SIZE + ly
-                    else:
-                        abs_x = abs_y = sz = None
-                except (ValueError, IndexError):
-                    abs_x = abs_y = sz = None
-                
+            # Flag detection is substring-based: surrounding whitespace cannot change it, no strip needed
+            map_flags = _parse_sec_tile_flags(rest_before_content)
+            
+            # Only attributes, strings and containers are logged, and each of them carries a '=':
+            # plain id lists skip building the debug context altogether
+            if '=' in content_str:
                 context = {
-                    "sec_file": str(sec_file),
+                    "sec_file": sec_file_str,
                     "lx": lx,
                     "ly": ly,
-                    "x": abs_x,
-                    "y": abs_y,
+                    "x": base_x + lx if base_x is not None else None,
+                    "y": base_y + ly if base_y is not None else None,
                     "z": sz,
                     "line": line,
                 }
-                items = _parse_sec_content_list(content_str, context)
+            else:
+                context = None
+            items = _parse_sec_content_list(content_str, context)
+            
+            if items:
+                tiles.append((lx, ly, map_flags, items))
                 
-                if items:
-                    tiles.append((lx, ly, map_flags, items))
-                    
-            except (ValueError, IndexError):
-                continue
-    
+        except (ValueError, IndexError):
+            continue
+
     return tiles
 
 
@@ -665,7 +1049,7 @@ def _write_debug_attributes_log():
         ly = context.get("ly", "?")
         line = context.get("line", "")
         lines.append(f"{type_name} | {coord_str} | {sec_file} | tile {lx}-{ly} | {line}\n")
-    with open(log_file, "w", encoding="utf-8") as f:
+    with open(log_file, "w", encoding="utf-8", buffering=1 << 20) as f:
         f.writelines(lines)
 
 
@@ -687,42 +1071,45 @@ def load_item_stack_priority(objects_srv_path):
         return {}
     type_to_priority = {}
     current_type_id = None
-    with open(path, 'r', encoding='latin-1', errors='ignore') as f:
-        for line in f:
-            line = line.strip()
-            if line.startswith('TypeID'):
-                match = re.search(r'TypeID\s*=\s*(\d+)', line)
-                if match:
-                    current_type_id = int(match.group(1))
-            elif current_type_id is not None and line.startswith('Flags'):
-                match = re.search(r'Flags\s*=\s*\{([^}]*)\}', line)
-                if match:
-                    flags_str = match.group(1)
-                    flags = {s.strip().lower() for s in flags_str.split(',')}
-                    if 'bank' in flags:
-                        p = STACK_PRIORITY_BANK
-                    elif 'clip' in flags:
-                        p = STACK_PRIORITY_CLIP
-                    elif 'bottom' in flags:
-                        p = STACK_PRIORITY_BOTTOM
-                    elif 'top' in flags:
-                        p = STACK_PRIORITY_TOP
-                    elif 'height' in flags:
-                        p = STACK_PRIORITY_HEIGHT
-                    else:
-                        p = STACK_PRIORITY_LOW
-                    type_to_priority[current_type_id] = p
-                current_type_id = None
+    for line in _read_text_lines(path):
+        line = line.strip()
+        if line.startswith('TypeID'):
+            match = re.search(r'TypeID\s*=\s*(\d+)', line)
+            if match:
+                current_type_id = int(match.group(1))
+        elif current_type_id is not None and line.startswith('Flags'):
+            match = re.search(r'Flags\s*=\s*\{([^}]*)\}', line)
+            if match:
+                flags_str = match.group(1)
+                flags = {s.strip().lower() for s in flags_str.split(',')}
+                if 'bank' in flags:
+                    p = STACK_PRIORITY_BANK
+                elif 'clip' in flags:
+                    p = STACK_PRIORITY_CLIP
+                elif 'bottom' in flags:
+                    p = STACK_PRIORITY_BOTTOM
+                elif 'top' in flags:
+                    p = STACK_PRIORITY_TOP
+                elif 'height' in flags:
+                    p = STACK_PRIORITY_HEIGHT
+                else:
+                    p = STACK_PRIORITY_LOW
+                type_to_priority[current_type_id] = p
+            current_type_id = None
     return type_to_priority
 
 
 def _sort_tile_items_by_priority(items, type_to_priority):
-    """Stable-sort tile items by engine stack priority. Same priority = keep original order."""
-    if not items or not type_to_priority:
+    """Stable-sort tile items by engine stack priority. Same priority = keep original order.
+    Tiles with one item, or whose items all share a priority, are returned as-is (no sort)."""
+    if len(items) < 2 or not type_to_priority:
+        return items
+    get = type_to_priority.get
+    priorities = [get(item[0], STACK_PRIORITY_LOW) for item in items]
+    if min(priorities) == max(priorities):
         return items
-    def key(item):
-        return type_to_priority.get(item.get('id'), STACK_PRIORITY_LOW)
-    return sorted(items, key=key)
+    order = sorted(range(len(items)), key=priorities.__getitem__)
+    return [items[i] for i in order]
 
 
 def _reverse_trailing_low_group(items, type_to_priority):
@@ -732,7 +1119,7 @@ def _reverse_trailing_low_group(items, type_to_priority):
     if not items or not type_to_priority or len(items) < 2:
         return items
     def priority(item):
-        return type_to_priority.get(item.get('id'), STACK_PRIORITY_LOW)
+        return type_to_priority.get(item[0], STACK_PRIORITY_LOW)
     i = len(items)
     while i > 0 and priority(items[i - 1]) == STACK_PRIORITY_LOW:
         i -= 1
@@ -741,68 +1128,157 @@ def _reverse_trailing_low_group(items, type_to_priority):
     return items
 
 
-def load_all_sectors(sec_dir):
-    """Load all .sec files and organize by sector"""
-    sec_dir = Path(sec_dir)
-    sectors = defaultdict(list)
-    _init_debug_attributes_log()
-    
-    print(f"\nScanning for .sec files in {sec_dir}...")
-    sec_files = sorted(sec_dir.glob("*.sec"))
+# Shortest .sec content that can hold a tile: len("0-0:Content={0}")
+_MIN_SEC_TILE_BYTES = 15
+
+# Below this many sector files, starting worker processes costs more than it saves
+_PARALLEL_SEC_MIN = 200
+
+
+def _bin_sector_tiles(tiles, sector):
+    """Group one sector's (lx, ly, map_flags, items) tiles into OTBM tile areas.
+    Returns {(area_x, area_y, z): [(x, y, map_flags, items), ...]} with absolute x, y, in .sec order."""
+    sx, sy, z = sector
+    base_x = sx * SECTOR_SIZE
+    base_y = sy * SECTOR_SIZE
+    # A 32x32 sector never straddles a 256x256 tile area: resolve its bucket once, not per tile
+    area_key = (base_x & 0xFF00, base_y & 0xFF00, z)
+    area_tiles = []
+    append = area_tiles.append
+    groups = {}
+    for lx, ly, map_flags, items in tiles:
+        x = base_x + lx
+        y = base_y + ly
+        if 0 <= lx < SECTOR_SIZE and 0 <= ly < SECTOR_SIZE:
+            append((x, y, map_flags, items))
+        else:
+            # Malformed local coords outside the sector: bucket by the tile's own area
+            key = (x & 0xFF00, y & 0xFF00, z)
+            if key == area_key:
+                append((x, y, map_flags, items))
+            else:
+                groups.setdefault(key, []).append((x, y, map_flags, items))
+    if area_tiles:
+        groups[area_key] = area_tiles
+    return groups
+
+
+def _parse_sec_job(job):
+    """Worker for load_all_sectors: parse one (sec_file, sector) job and bin its tiles by area.
+    Returns (_bin_sector_tiles result, or None when the file has no tiles or fails to parse,
+    debug attribute entries logged while parsing, True if the file failed to parse)."""
+    global _debug_attributes_entries
+    _debug_attributes_entries = []
+    sec_file, sector = job
+    try:
+        tiles = parse_sec_file(sec_file, sector)
+        groups = _bin_sector_tiles(tiles, sector) if tiles else None
+    except Exception:
+        return None, _debug_attributes_entries, True
+    return groups, _debug_attributes_entries, False
+
+
+# What _scan_sectors returns (and load_all_sectors caches). Files that failed to parse count as skipped
+# and are also counted in parse_failures
+_SectorScan = namedtuple('_SectorScan', 'areas debug_entries n_sectors parsed skipped parse_failures')
+
+
+def _scan_sectors(sec_files, tiny=frozenset()):
+    """Parse and bin every .sec file (see load_all_sectors); files in `tiny` are counted as skipped unopened.
+    Returns a _SectorScan."""
     total_files = len(sec_files)
-    print(f"  Found {total_files} sector files.")
+    areas = defaultdict(list)
+    loaded_sectors = set()
+    
+    # Sector key from each filename up front; tiny files and unparseable names never become a parse job
+    keys = []
+    for sec_file in sec_files:
+        if sec_file in tiny:
+            keys.append(None)
+            continue
+        try:
+            name_parts = sec_file.stem.split('-')
+            keys.append((int(name_parts[0]), int(name_parts[1]), int(name_parts[2])))
+        except (ValueError, IndexError):
+            keys.append(None)
+    jobs = [(sec_file, key) for sec_file, key in zip(sec_files, keys) if key is not None]
     
     parsed = 0
     skipped = 0
+    failed = 0
+    debug_entries = []
     
-    for idx, sec_file in enumerate(sec_files, 1):
-        if idx % 500 == 0:
-            print(f"  Progress: {idx}/{total_files} files ({parsed} parsed, {skipped} skipped)")
-        
-        try:
-            name_parts = sec_file.stem.split('-')
-            sx = int(name_parts[0])
-            sy = int(name_parts[1])
-            z = int(name_parts[2])
+    # Files are independent: parse them across processes when there are enough to pay for the pool
+    workers = os.cpu_count() or 1
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 and len(jobs) >= _PARALLEL_SEC_MIN else None
+    try:
+        if pool:
+            # ~4 chunks per worker: few enough round trips to amortise pickling, enough to balance uneven sectors
+            results = pool.map(_parse_sec_job, jobs, chunksize=max(1, len(jobs) // (workers * 4)))
+        else:
+            results = map(_parse_sec_job, jobs)
+        for idx, key in enumerate(keys, 1):
+            if idx % 500 == 0:
+                print(f"  Progress: {idx}/{total_files} files ({parsed} parsed, {skipped} skipped)")
             
-            tiles = parse_sec_file(sec_file)
-            if tiles:
-                sectors[(sx, sy, z)].extend(tiles)
+            if key is None:
+                skipped += 1
+                continue
+            groups, entries, job_failed = next(results)
+            failed += job_failed
+            # Entries come back per file, in file order (same as a serial parse)
+            debug_entries.extend(entries)
+            if groups:
+                # The first sector of an area hands over its list; later ones extend it
+                for area_key, area_tiles in groups.items():
+                    existing = areas.get(area_key)
+                    if existing is None:
+                        areas[area_key] = area_tiles
+                    else:
+                        existing.extend(area_tiles)
+                loaded_sectors.add(key)
                 parsed += 1
             else:
                 skipped += 1
-        except (ValueError, IndexError):
-            skipped += 1
-            continue
-        except Exception:
-            skipped += 1
-            continue
+    finally:
+        if pool is not None:
+            pool.shutdown()
     
-    print(f"  Loaded {len(sectors)} sectors with tiles (parsed: {parsed}, skipped: {skipped}).")
-    return sectors
-
-
-def calculate_bounds(sectors, offset_x=0, offset_y=0):
-    """Calculate transformed map bounds after applying offset"""
-    min_x = min_y = float('inf')
-    max_x = max_y = float('-inf')
+    return _SectorScan(areas, debug_entries, len(loaded_sectors), parsed, skipped, failed)
 
-    for (sx, sy, _z), tiles in sectors.items():
-        for tile_entry in tiles:
-            lx, ly = tile_entry[0], tile_entry[1]
-            _items = tile_entry[3] if len(tile_entry) == 4 else tile_entry[2]
-            abs_x = sx * SECTOR_SIZE + lx
-            abs_y = sy * SECTOR_SIZE + ly
-            new_x = abs_x - offset_x
-            new_y = abs_y - offset_y
-            min_x = min(min_x, new_x)
-            min_y = min(min_y, new_y)
-            max_x = max(max_x, new_x)
-            max_y = max(max_y, new_y)
 
-    if min_x == float('inf'):
-        return 0, 0, 0, 0
-    return int(min_x), int(min_y), int(max_x), int(max_y)
+def load_all_sectors(sec_dir):
+    """Load all .sec files, binned straight into OTBM tile areas (cached across runs, see _load_cached).
+    Returns {(area_x, area_y, z): [(x, y, map_flags, items), ...]} with absolute tile coordinates."""
+    global _debug_attributes_entries
+    sec_dir = Path(sec_dir)
+    _init_debug_attributes_log()
+    
+    print(f"\nScanning for .sec files in {sec_dir}...")
+    # One scandir pass gives names and sizes; files too small for a single tile line are never opened
+    sec_files = []
+    tiny = set()
+    for entry in sorted(_scan_dir_files(sec_dir, '.sec'), key=lambda e: e.name):
+        sec_file = Path(entry.path)
+        sec_files.append(sec_file)
+        try:
+            if entry.stat().st_size < _MIN_SEC_TILE_BYTES:
+                tiny.add(sec_file)
+        except OSError:
+            pass  # let the parse job report it
+    print(f"  Found {len(sec_files)} sector files.")
+    
+    # The debug attribute entries are a parse side effect, so they are cached along with the tiles.
+    # A scan with parse failures is not cached: a read error must not turn into a permanently empty sector.
+    scan = _load_cached('sectors', sec_files, lambda: _scan_sectors(sec_files, tiny),
+                        store=lambda scan: not scan.parse_failures)
+    _debug_attributes_entries = scan.debug_entries
+    
+    print(f"  Loaded {scan.n_sectors} sectors with tiles (parsed: {scan.parsed}, skipped: {scan.skipped}).")
+    if scan.parse_failures:
+        print(f"  ⚠ Warning: {scan.parse_failures} sector files failed to parse (counted as skipped); "
+              "not cached, rerun to retry")
+    return scan.areas
 
 
 def build_otbm_header(width, height):
@@ -829,37 +1305,56 @@ def build_house_positions(houses):
     return pos_to_house
 
 
-def _write_otbm_item_recursive(writer, item_data, counters):
-    """Write one OTBM_ITEM (id + attributes), then recursively write child items (containers).
+def _otbm_plain_item_node(item_id):
+    """Complete, escaped OTBM_ITEM node (start, id, end) for an id-only item"""
+    writer = OTBMWriter()
+    writer.start_node(OTBM_ITEM)
+    writer.write_uint16(item_id)
+    writer.end_node()
+    return bytes(writer.data)
+
+
+def _write_otbm_item_recursive(writer, item, counters):
+    """Write one OTBM_ITEM (id + attributes) from an (id, attrs) item, then recursively write child items (containers).
     RME (iomap_otbm.cpp): MAP_OTBM_2 reads count from OTBM_ATTR_COUNT; getCount() returns subtype only if item is stackable (items.otb)."""
+    item_id, item_data = item
     writer.start_node(OTBM_ITEM)
-    writer.write_uint16(item_data['id'])
+    if item_data is None:
+        writer.write_uint16(item_id)
+        writer.end_node()
+        counters['total_items'] += 1
+        return
+    # Pack id + attributes unescaped into one buffer, then escape the whole run in a single write_raw
+    props = bytearray(_U16.pack(item_id & 0xFFFF))
     if item_data.get('liquid_type') is not None:
-        writer.write_byte(OTBM_ATTR_COUNT)
-        writer.write_byte(SERVER_LIQUID_TO_RME.get(item_data['liquid_type'], item_data['liquid_type']))
+        props.append(OTBM_ATTR_COUNT)
+        props.append(SERVER_LIQUID_TO_RME.get(item_data['liquid_type'], item_data['liquid_type']))
     elif item_data.get('count') is not None:
-        writer.write_byte(OTBM_ATTR_COUNT)
-        writer.write_byte(min(255, max(0, item_data['count'])))
+        props.append(OTBM_ATTR_COUNT)
+        props.append(min(255, max(0, item_data['count'])))
     if item_data.get('actionid') is not None:
-        writer.write_byte(OTBM_ATTR_ACTION_ID)
-        writer.write_uint16(item_data['actionid'])
+        props.append(OTBM_ATTR_ACTION_ID)
+        props += _U16.pack(item_data['actionid'] & 0xFFFF)
         counters['n_action_id'] += 1
     if item_data.get('uniqueid') is not None:
-        writer.write_byte(OTBM_ATTR_UNIQUE_ID)
-        writer.write_uint16(item_data['uniqueid'])
+        props.append(OTBM_ATTR_UNIQUE_ID)
+        props += _U16.pack(item_data['uniqueid'] & 0xFFFF)
     if item_data.get('charges') is not None:
-        writer.write_byte(OTBM_ATTR_CHARGES)
-        writer.write_uint16(min(65535, max(0, item_data['charges'])))
+        props.append(OTBM_ATTR_CHARGES)
+        props += _U16.pack(min(65535, max(0, item_data['charges'])))
     if item_data.get('text'):
-        writer.write_byte(OTBM_ATTR_TEXT)
-        writer.write_string(item_data['text'])
+        encoded = item_data['text'].encode('latin-1')
+        props.append(OTBM_ATTR_TEXT)
+        props += _U16.pack(len(encoded) & 0xFFFF)
+        props += encoded
         counters['n_text'] += 1
     if item_data.get('teleport_dest'):
         tx, ty, tz = item_data['teleport_dest']
-        writer.write_byte(OTBM_ATTR_TELE_DEST)
-        writer.write_uint16(min(65535, max(0, tx)))
-        writer.write_uint16(min(65535, max(0, ty)))
-        writer.write_byte(min(15, max(0, tz)))
+        props.append(OTBM_ATTR_TELE_DEST)
+        props += _U16.pack(min(65535, max(0, tx)))
+        props += _U16.pack(min(65535, max(0, ty)))
+        props.append(min(15, max(0, tz)))
+    writer.write_raw(props)
     content_list = item_data.get('content') or item_data.get('contents') or []
     for child in content_list:
         _write_otbm_item_recursive(writer, child, counters)
@@ -869,8 +1364,24 @@ def _write_otbm_item_recursive(writer, item_data, counters):
     counters['total_items'] += 1
 
 
-def convert_map_to_otbm(sectors, output_file, map_name, towns=None, house_positions=None, item_stack_priority=None):
-    """Convert .sec files to OTBM format. house_positions: dict (x,y,z) -> house_id for OTBM_HOUSETILE.
+_TILE_X = itemgetter(0)
+_TILE_Y = itemgetter(1)
+_ITEM_ID = itemgetter(0)  # of an (id, attrs) item
+
+# Bits of a byte spread to the even positions (0b1011 -> 0b1000101), for Morton (z-order) keys
+_MORTON_SPREAD = [sum(((i >> b) & 1) << (2 * b) for b in range(8)) for i in range(256)]
+
+
+def _area_order_key(area_key):
+    """Sort key for (area_x, area_y, z): floor first, then z-order of the 256x256 area grid,
+    so areas that are close on the map are also close in the file. Packed into one int
+    (z above the 16-bit Morton code) so the sort compares ints, not tuples."""
+    area_x, area_y, z = area_key
+    return (z << 16) | _MORTON_SPREAD[area_x >> 8] | (_MORTON_SPREAD[area_y >> 8] << 1)
+
+
+def convert_map_to_otbm(areas, output_file, map_name, towns=None, house_positions=None, item_stack_priority=None):
+    """Convert tile areas from load_all_sectors to OTBM format. house_positions: dict (x,y,z) -> house_id for OTBM_HOUSETILE.
     item_stack_priority: optional dict type_id -> priority from load_item_stack_priority(objects.srv); if set, tile items are sorted by engine priority before writing (semantic lossless)."""
     
     print("\n" + "="*70)
@@ -882,12 +1393,17 @@ def convert_map_to_otbm(sectors, output_file, map_name, towns=None, house_positi
     if house_positions is None:
         house_positions = {}
     
-    if not sectors:
+    if not areas:
         print("Error: No valid sectors found!")
         return
     
+    # Tile coverage bounds (informational; the canvas is fixed)
+    min_x = min(min(map(_TILE_X, tiles)) for tiles in areas.values())
+    max_x = max(max(map(_TILE_X, tiles)) for tiles in areas.values())
+    min_y = min(min(map(_TILE_Y, tiles)) for tiles in areas.values())
+    max_y = max(max(map(_TILE_Y, tiles)) for tiles in areas.values())
+    
     print(f"\n✓ Using original Tibia coordinates")
-    min_x, min_y, max_x, max_y = calculate_bounds(sectors, 0, 0)
     # Use full Tibia map size
     width = 65535
     height = 65535
@@ -896,121 +1412,101 @@ def convert_map_to_otbm(sectors, output_file, map_name, towns=None, house_positi
 
     header = build_otbm_header(width, height)
     
-    writer = OTBMWriter()
-    writer.data.extend(header)
-    
-    print("\nWriting OTBM structure...")
-    
-    writer.start_node(OTBM_MAP_DATA)
-    writer.write_byte(OTBM_ATTR_DESCRIPTION)
-    writer.write_string(map_name)
-    # RME looks for these filenames in the same directory as the .otbm
-    writer.write_byte(OTBM_ATTR_EXT_SPAWN_FILE)
-    writer.write_string(f"{map_name}-spawn.xml")
-    writer.write_byte(OTBM_ATTR_EXT_HOUSE_FILE)
-    writer.write_string(f"{map_name}-house.xml")
-    
-    areas = defaultdict(list)
-    for (sx, sy, z), tiles in sectors.items():
-        for tile_entry in tiles:
-            if len(tile_entry) == 4:
-                lx, ly, map_flags, items = tile_entry
-            else:
-                lx, ly, items = tile_entry[0], tile_entry[1], tile_entry[2]
-                map_flags = 0
-            
-            abs_x = sx * SECTOR_SIZE + lx
-            abs_y = sy * SECTOR_SIZE + ly
-            
-            # No offset - use original coordinates
-            new_x = abs_x
-            new_y = abs_y
-            
-            area_x = new_x & 0xFF00
-            area_y = new_y & 0xFF00
-            local_x = new_x & 0xFF
-            local_y = new_y & 0xFF
-            
-            tile_record = {'x': local_x, 'y': local_y, 'items': items, 'map_flags': map_flags}
-            hid = house_positions.get((new_x, new_y, z))
-            if hid is not None:
-                tile_record['house_id'] = hid
-            areas[(area_x, area_y, z)].append(tile_record)
-    
-    print(f"  Writing {len(areas)} tile areas...")
-    
-    total_tiles = 0
-    counters = {'n_action_id': 0, 'n_text': 0, 'total_items': 0, 'container_children': 0}
-    
-    for idx, ((bx, by, z), tiles) in enumerate(sorted(areas.items())):
-        writer.start_node(OTBM_TILE_AREA)
-        writer.write_uint16(bx)
-        writer.write_uint16(by)
-        writer.write_byte(z)
+    # Stream straight to disk: the writer flushes ~1 MiB at a time instead of buffering the whole map
+    Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+    with open(output_file, 'wb', buffering=1 << 20) as f:
+        f.write(b'OTBM')
+        writer = OTBMWriter(target=f)
+        writer.data.extend(header)
         
-        for tile in tiles:
-            total_tiles += 1
-            items = tile['items']
-            
-            if not items:
-                continue
-            
-            house_id = tile.get('house_id')
-            if house_id is not None:
-                writer.start_node(OTBM_HOUSETILE)
-                writer.write_byte(tile['x'])
-                writer.write_byte(tile['y'])
-                writer.write_uint32(house_id)
-            else:
-                writer.start_node(OTBM_TILE)
-                writer.write_byte(tile['x'])
-                writer.write_byte(tile['y'])
-            
-            if tile.get('map_flags'):
-                writer.write_byte(OTBM_ATTR_TILE_FLAGS)
-                writer.write_uint32(tile['map_flags'])
+        print("\nWriting OTBM structure...")
+        
+        writer.start_node(OTBM_MAP_DATA)
+        writer.write_byte(OTBM_ATTR_DESCRIPTION)
+        writer.write_string(map_name)
+        # RME looks for these filenames in the same directory as the .otbm
+        writer.write_byte(OTBM_ATTR_EXT_SPAWN_FILE)
+        writer.write_string(f"{map_name}-spawn.xml")
+        writer.write_byte(OTBM_ATTR_EXT_HOUSE_FILE)
+        writer.write_string(f"{map_name}-house.xml")
+        
+        print(f"  Writing {len(areas)} tile areas...")
+        
+        total_tiles = 0
+        house_get = house_positions.get
+        counters = {'n_action_id': 0, 'n_text': 0, 'total_items': 0, 'container_children': 0}
+        # Id-only items (most of the map) are written from per-id node templates, escaping included
+        plain_item_nodes = {}
+        n_plain_items = 0
+        extend = writer.data.extend  # flush() clears this same buffer, so the bound method stays valid
+        
+        for idx, (bx, by, z) in enumerate(sorted(areas, key=_area_order_key)):
+            tiles = areas[(bx, by, z)]
+            writer.start_node(OTBM_TILE_AREA)
+            writer.write_position(bx, by, z)
             
-            # Flags + reverse whole: sort by engine priority, then reverse whole tile list. RME uses flags (alwaysOnBottom/topOrder) so bottom-block items go below; reversed order gives correct stack (see LOSSLESS_ROUNDTRIP.md, FLAG_ATTRIBUTE_MAPPING.md).
-            if item_stack_priority:
-                items_to_write = _sort_tile_items_by_priority(items, item_stack_priority)
-                items_to_write = list(reversed(items_to_write))
-            else:
-                items_to_write = items
-            for item_data in items_to_write:
-                _write_otbm_item_recursive(writer, item_data, counters)
+            for x, y, map_flags, items in tiles:
+                total_tiles += 1
+                
+                if not items:
+                    continue
+                
+                # Tile header (x, y[, house id][, flags]) is packed unescaped and escaped in one write_raw
+                props = bytearray((x & 0xFF, y & 0xFF))
+                house_id = house_get((x, y, z))
+                if house_id is not None:
+                    writer.start_node(OTBM_HOUSETILE)
+                    props += _U32.pack(house_id & 0xFFFFFFFF)
+                else:
+                    writer.start_node(OTBM_TILE)
+                
+                if map_flags:
+                    props.append(OTBM_ATTR_TILE_FLAGS)
+                    props += _U32.pack(map_flags & 0xFFFFFFFF)
+                writer.write_raw(props)
+                
+                # Flags + reverse whole: sort by engine priority, then reverse whole tile list. RME uses flags (alwaysOnBottom/topOrder) so bottom-block items go below; reversed order gives correct stack (see LOSSLESS_ROUNDTRIP.md, FLAG_ATTRIBUTE_MAPPING.md).
+                if item_stack_priority:
+                    items_to_write = _sort_tile_items_by_priority(items, item_stack_priority)
+                    items_to_write = list(reversed(items_to_write))
+                else:
+                    items_to_write = items
+                for item in items_to_write:
+                    if item[1] is None:
+                        # Plain item: append its prebuilt node bytes
+                        node = plain_item_nodes.get(item[0])
+                        if node is None:
+                            node = plain_item_nodes[item[0]] = _otbm_plain_item_node(item[0])
+                        extend(node)
+                        n_plain_items += 1
+                    else:
+                        _write_otbm_item_recursive(writer, item, counters)
+                
+                writer.end_node()
             
             writer.end_node()
+            
+            if idx % 200 == 0:
+                print(f"  Progress: {idx}/{len(areas)} areas...")
         
-        writer.end_node()
-        
-        if idx % 200 == 0:
-            print(f"  Progress: {idx}/{len(areas)} areas...")
-    
-    # RME: OTBM_TOWNS after TILE_AREA so getOrCreateTile(temple) finds existing tile (no duplicate-tile warning)
-    if towns:
-        writer.start_node(OTBM_TOWNS)
-        for t in towns:
-            writer.start_node(OTBM_TOWN)
-            writer.write_uint32(t['id'])
-            writer.write_string(t['name'])
-            writer.write_uint16(t['x'])
-            writer.write_uint16(t['y'])
-            writer.write_byte(t['z'])
+        # RME: OTBM_TOWNS after TILE_AREA so getOrCreateTile(temple) finds existing tile (no duplicate-tile warning)
+        if towns:
+            writer.start_node(OTBM_TOWNS)
+            for t in towns:
+                writer.start_node(OTBM_TOWN)
+                writer.write_uint32(t['id'])
+                writer.write_string(t['name'])
+                writer.write_position(t['x'], t['y'], t['z'])
+                writer.end_node()
             writer.end_node()
-        writer.end_node()
-        print(f"  ✓ Wrote {len(towns)} towns (after tile areas)")
-    
-    writer.end_node()  # Close MAP_DATA
-    
-    Path(output_file).parent.mkdir(parents=True, exist_ok=True)
-    
-    with open(output_file, 'wb') as f:
-        f.write(b'OTBM')
-        f.write(writer.get_bytes())
+            print(f"  ✓ Wrote {len(towns)} towns (after tile areas)")
+        
+        writer.end_node()  # Close MAP_DATA
+        writer.flush()
     
     n_action_id = counters['n_action_id']
     n_text = counters['n_text']
-    total_items = counters['total_items']
+    total_items = counters['total_items'] + n_plain_items
     n_container_children = counters.get('container_children', 0)
     print(f"\n✓ Map generated: {output_file}")
     print(f"  Tiles: {total_tiles:,}, Items: {total_items:,}")
@@ -1027,166 +1523,176 @@ def convert_map_to_otbm(sectors, output_file, map_name, towns=None, house_positi
 # ============================================================================
 # Parse houseareas.dat and houses.dat
 # ============================================================================
+# Area = (590,"Ankrahmun, Border",40,7) -> group 4 is the depot
+_AREA_RE = re.compile(r'Area\s*=\s*\(\s*(\d+)\s*,\s*"([^"]*)",\s*(\d+)\s*,\s*(\d+)\s*\)$')
+# Fields = {[32258,32309,5],[32259,32309,5],...}
+_FIELDS_RE = re.compile(r'\[(\d+),(\d+),(\d+)\]')
+
+
 def parse_houseareas(houseareas_path):
     """Parse houseareas.dat to get Area → Depot mapping"""
     area_to_depot = {}
     
-    with open(houseareas_path, 'r', encoding='latin-1', errors='ignore') as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
+    for line in _read_text_lines(houseareas_path):
+        line = line.strip()
+        # First-character dispatch: blank, comment and other lines are rejected before startswith
+        if line[:1] != 'A' or not line.startswith('Area'):
+            continue
+        
+        m = _AREA_RE.match(line)
+        if m:
+            area_to_depot[int(m.group(1))] = int(m.group(4))
+            continue
+        # Unusual layout (unquoted name, stray spacing): fall back to manual splitting
+        try:
+            # Area = (590,"Ankrahmun, Border",40,7)
+            # Extract the tuple part
+            content = line.partition('=')[2].strip()
+            content = content.strip('()')
             
-            if line.startswith('Area'):
-                try:
-                    # Area = (590,"Ankrahmun, Border",40,7)
-                    # Extract the tuple part
-                    content = line.split('=', 1)[1].strip()
-                    content = content.strip('()')
-                    
-                    # Split by comma, but need to handle quoted strings
-                    # Format: AreaID,"Name (may have commas)",Price,Depot
-                    
-                    # First, get the area ID (before first comma)
-                    first_comma = content.index(',')
-                    area_id = int(content[:first_comma].strip())
-                    
-                    # The rest after area ID
-                    rest = content[first_comma+1:].strip()
-                    
-                    # Find the quoted name (starts with ")
-                    if rest.startswith('"'):
-                        # Find closing quote
-                        end_quote = rest.index('"', 1)
-                        # After the closing quote, we have ,Price,Depot
-                        after_name = rest[end_quote+1:].strip(',').strip()
-                        parts = after_name.split(',')
-                        # parts[0] = Price, parts[1] = Depot
-                        depot = int(parts[1].strip())
-                    else:
-                        # No quoted name, simpler parsing
-                        parts = rest.split(',')
-                        depot = int(parts[-1].strip())
-                    
-                    area_to_depot[area_id] = depot
-                except (ValueError, IndexError):
-                    continue
+            # Split by comma, but need to handle quoted strings
+            # Format: AreaID,"Name (may have commas)",Price,Depot
+            
+            # First, get the area ID (before first comma)
+            first_comma = content.index(',')
+            area_id = int(content[:first_comma].strip())
+            
+            # The rest after area ID
+            rest = content[first_comma+1:].strip()
+            
+            # Find the quoted name (starts with ")
+            if rest.startswith('"'):
+                # Find closing quote
+                end_quote = rest.index('"', 1)
+                # After the closing quote, we have ,Price,Depot
+                after_name = rest[end_quote+1:].strip(',').strip()
+                parts = after_name.split(',')
+                # parts[0] = Price, parts[1] = Depot
+                depot = int(parts[1].strip())
+            else:
+                # No quoted name, simpler parsing
+                parts = rest.split(',')
+                depot = int(parts[-1].strip())
+            
+            area_to_depot[area_id] = depot
+        except (ValueError, IndexError):
+            continue
     
     return area_to_depot
 
 
+def _house_set_exit(house, rest):
+    """Exit = [x,y,z] -> house entry"""
+    parts = rest.split('=')[1].strip().strip('[]').split(',')
+    house['entryx'] = int(parts[0])
+    house['entryy'] = int(parts[1])
+    house['entryz'] = int(parts[2])
+
+
+def _house_set_fields(house, rest):
+    """Fields = {[32258,32309,5],[32259,32309,5],...} -> list of (x,y,z)"""
+    house['tiles'] = [
+        (int(m.group(1)), int(m.group(2)), int(m.group(3)))
+        for m in _FIELDS_RE.finditer(rest.split('=', 1)[1])
+    ]
+    house['size'] = len(house['tiles'])
+
+
+# houses.dat key -> handler(house, rest); rest is the line after the key. Name and Fields read
+# everything after the first '=', the others only up to the second '=' (as the original splits did)
+_HOUSE_FIELD_HANDLERS = {
+    'Name': lambda house, rest: house.update(name=rest.split('=', 1)[1].strip().strip('"')),
+    'RentOffset': lambda house, rest: house.update(rent=int(rest.split('=')[1].strip())),
+    'Area': lambda house, rest: house.update(area=int(rest.split('=')[1].strip())),
+    'GuildHouse': lambda house, rest: house.update(guildhall=rest.split('=')[1].strip().lower() == 'true'),
+    'Exit': _house_set_exit,
+    'Fields': _house_set_fields,
+}
+# Key a houses.dat line starts with: a prefix match, so "AreaXyz = 2" still sets the area
+_HOUSE_FIELD_KEY_RE = re.compile('|'.join(_HOUSE_FIELD_HANDLERS))
+
+
 def parse_houses_dat(houses_path):
-    """Parse houses.dat file"""
+    """Parse houses.dat file (cached across runs while the file is unchanged)"""
+    return _load_cached('houses', [houses_path], lambda: _scan_houses_dat(houses_path))
+
+
+def _scan_houses_dat(houses_path):
+    """Parse houses.dat into a list of house dicts"""
     houses = []
     
-    with open(houses_path, 'r', encoding='latin-1', errors='ignore') as f:
-        lines = f.readlines()
+    lines = _read_text_lines(houses_path)
     
-    i = 0
-    while i < len(lines):
-        line = lines[i].strip()
+    # Single pass: an ID line opens a house, a blank line (or the next ID) closes it
+    house = None
+    for line in lines:
+        line = line.strip()
         
         if line.startswith('ID'):
-            house = {}
-            
+            if house is not None:
+                houses.append(house)
             try:
-                house['id'] = int(line.split('=')[1].strip())
-            except:
-                i += 1
-                continue
-            
-            i += 1
-            while i < len(lines):
-                line = lines[i].strip()
-                
-                if line.startswith('ID'):
-                    i -= 1
-                    break
-                
-                if line.startswith('Name'):
-                    house['name'] = line.split('=', 1)[1].strip().strip('"')
-                elif line.startswith('RentOffset'):
-                    house['rent'] = int(line.split('=')[1].strip())
-                elif line.startswith('Area'):
-                    house['area'] = int(line.split('=')[1].strip())
-                elif line.startswith('GuildHouse'):
-                    house['guildhall'] = line.split('=')[1].strip().lower() == 'true'
-                elif line.startswith('Exit'):
-                    coords = line.split('=')[1].strip().strip('[]')
-                    parts = coords.split(',')
-                    house['entryx'] = int(parts[0])
-                    house['entryy'] = int(parts[1])
-                    house['entryz'] = int(parts[2])
-                elif line.startswith('Fields'):
-                    fields_str = line.split('=', 1)[1].strip()
-                    # Fields = {[32258,32309,5],[32259,32309,5],...} -> list of (x,y,z)
-                    house['tiles'] = [
-                        (int(m.group(1)), int(m.group(2)), int(m.group(3)))
-                        for m in re.finditer(r'\[(\d+),(\d+),(\d+)\]', fields_str)
-                    ]
-                    house['size'] = len(house.get('tiles', []))
-                
-                i += 1
-                if not line:
-                    break
-            
+                house = {'id': int(line.split('=')[1].strip())}
+            except (ValueError, IndexError):
+                house = None
+            continue
+        
+        if house is None:
+            continue
+        
+        if not line:
             houses.append(house)
-        else:
-            i += 1
+            house = None
+            continue
+        
+        # One regex match per line, then a dict dispatch on the key; a key line without '=' has no value
+        m = _HOUSE_FIELD_KEY_RE.match(line)
+        if m is not None and '=' in line:
+            _HOUSE_FIELD_HANDLERS[m.group()](house, line[m.end():])
+    
+    if house is not None:
+        houses.append(house)
     
     return houses
 
 
-def generate_houses_xml(houses_path, houseareas_path, output_path):
-    """Generate map-house.xml from houses.dat"""
+def generate_houses_xml(houses, area_to_depot, output_path):
+    """Generate map-house.xml from parsed houses.dat (parse_houses_dat) and houseareas.dat (parse_houseareas)"""
     
     print("\n" + "="*70)
     print("GENERATING HOUSES XML")
     print("="*70)
     
-    area_to_depot = parse_houseareas(houseareas_path)
-    houses = parse_houses_dat(houses_path)
-    
     print(f"Found {len(houses)} houses")
     
-    xml_lines = ['<?xml version="1.0"?>']
-    xml_lines.append('<houses>')
-    
-    for house in houses:
-        # Use ID directly from houses.dat
-        house_id = house['id']
-        
-        # Look up area to get depot, then townid = depot + 1
-        area = house.get('area', 100)
-        depot = area_to_depot.get(area, 0)
-        town_id = depot + 1  # Depot 0 → Town 1 (Thais), Depot 1 → Town 2 (Carlin), etc.
-        
-        # Use original coordinates
-        entryx = house.get('entryx', 0)
-        entryy = house.get('entryy', 0)
-        
-        attrs = [
-            f'name="{house.get("name", "")}"',
-            f'houseid="{house_id}"',
-            f'entryx="{entryx}"',
-            f'entryy="{entryy}"',
-            f'entryz="{house.get("entryz", 7)}"',
-            f'rent="{house.get("rent", 0)}"',
-        ]
-        
-        if house.get('guildhall', False):
-            attrs.append('guildhall="true"')
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as out:
+        write = out.write
+        write('<?xml version="1.0"?>\n<houses>')
         
-        attrs.append(f'townid="{town_id}"')
-        attrs.append(f'size="{house.get("size", 0)}"')
+        for house in houses:
+            # Use ID directly from houses.dat
+            house_id = house['id']
+            
+            # Look up area to get depot, then townid = depot + 1
+            area = house.get('area', 100)
+            depot = area_to_depot.get(area, 0)
+            town_id = depot + 1  # Depot 0 → Town 1 (Thais), Depot 1 → Town 2 (Carlin), etc.
+            
+            # Use original coordinates
+            entryx = house.get('entryx', 0)
+            entryy = house.get('entryy', 0)
+            
+            guildhall = ' guildhall="true"' if house.get('guildhall', False) else ''
+            
+            # One f-string per house (no attrs list + join)
+            write(
+                f'\n\t<house name="{house.get("name", "")}" houseid="{house_id}" '
+                f'entryx="{entryx}" entryy="{entryy}" entryz="{house.get("entryz", 7)}" '
+                f'rent="{house.get("rent", 0)}"{guildhall} townid="{town_id}" size="{house.get("size", 0)}" />'
+            )
         
-        xml_lines.append(f'\t<house {" ".join(attrs)} />')
-    
-    xml_lines.append('</houses>')
-    
-    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(xml_lines))
+        write('\n</houses>')
     
     print(f"✓ Houses XML generated: {len(houses)} houses")
 
@@ -1194,142 +1700,182 @@ def generate_houses_xml(houses_path, houseareas_path, output_path):
 # ============================================================================
 # Parse .mon files and build race lookup
 # ============================================================================
+# A RaceNumber line: at the start of a line (\n or \r break) after any bytes str.strip() treats as
+# whitespace once latin-1 decoded; group 1 runs to the end of the line
+_MON_RACE_RE = re.compile(rb'(?:\A|(?<=[\r\n]))[ \t\x0b\x0c\x1c-\x1f\x85\xa0]*(RaceNumber[^\r\n]*)')
+# RaceNumber sits in the header of a .mon file: this much is read first, the rest only if needed
+_MON_HEAD_BYTES = 2048
+
+
 def build_race_lookup(mon_dir):
-    """Build Race → Monster Name lookup from .mon files (using filename, not Name field)"""
-    race_to_name = {}
-    
+    """Build Race → Monster Name lookup from .mon files (using filename, not Name field).
+    Cached across runs while the set of .mon files and their mtimes/sizes are unchanged."""
     mon_dir = Path(mon_dir)
     if not mon_dir.exists():
-        return race_to_name
+        return {}
     
-    for mon_file in mon_dir.glob("*.mon"):
-        race_number = None
-        
-        # Use filename with "mon-" prefix (matches RME creatures.xml and spawn XML)
-        monster_name = 'mon-' + mon_file.stem  # e.g., "demonskeleton.mon" → "mon-demonskeleton"
-        
-        with open(mon_file, 'r', encoding='latin-1', errors='ignore') as f:
-            for line in f:
-                line = line.strip()
-                
-                if line.startswith('RaceNumber'):
-                    try:
-                        race_number = int(line.split('=')[1].split('#')[0].strip())
-                    except:
-                        pass
-                
-                if race_number is not None:
-                    race_to_name[race_number] = monster_name
-                    break
+    mon_files = [Path(entry.path) for entry in _scan_dir_files(mon_dir, '.mon')]
+    return _load_cached('race_lookup', mon_files, lambda: _scan_race_lookup(mon_files))
+
+
+def _mon_race_value(line):
+    """RaceNumber value of one raw RaceNumber line, or None when it does not parse"""
+    line = line.decode('latin-1').strip()
+    try:
+        return int(line.split('=')[1].split('#')[0].strip())
+    except:
+        return None
+
+
+def _parse_mon_race(mon_file):
+    """First valid RaceNumber of one .mon file, or None.
+    One compiled bytes regex scans the raw file for lines starting with RaceNumber; only those lines are
+    decoded, so commented-out or quoted mentions are skipped without touching the rest of the file.
+    Only the first _MON_HEAD_BYTES are read while they settle the answer: a race there on a line
+    that ends inside the head, or a file no longer than the head."""
+    with open(mon_file, 'rb') as f:
+        data = f.read(_MON_HEAD_BYTES)
+        if len(data) == _MON_HEAD_BYTES:
+            for m in _MON_RACE_RE.finditer(data):
+                if m.end() == len(data):
+                    break  # line may continue past the head
+                race = _mon_race_value(m.group(1))
+                if race is not None:
+                    return race
+            data += f.read()
+    
+    for m in _MON_RACE_RE.finditer(data):
+        race = _mon_race_value(m.group(1))
+        if race is not None:
+            return race
+    return None
+
+
+def _scan_race_lookup(mon_files):
+    """Race → 'mon-<stem>' from the first valid RaceNumber line of each .mon file"""
+    race_to_name = {}
+    
+    # Files are read in parallel; merging in directory order keeps "last file wins" for duplicate races
+    for mon_file, race_number in zip(mon_files, _map_files_threaded(_parse_mon_race, mon_files)):
+        if race_number is not None:
+            # Use filename with "mon-" prefix (matches RME creatures.xml and spawn XML)
+            race_to_name[race_number] = 'mon-' + mon_file.stem  # e.g., "demonskeleton.mon" → "mon-demonskeleton"
     
     return race_to_name
 
 
 def parse_monster_db(monster_db_path):
-    """Parse monster.db file"""
+    """Parse monster.db file (cached across runs while the file is unchanged)"""
+    return _load_cached('monster_db', [monster_db_path], lambda: _scan_monster_db(monster_db_path))
+
+
+def _scan_monster_db(monster_db_path):
+    """Parse monster.db into (race, x, y, z, radius, amount, spawntime) tuples"""
     spawns = []
+    append = spawns.append
     
-    with open(monster_db_path, 'r', encoding='latin-1', errors='ignore') as f:
-        for line in f:
-            line = line.strip()
-            
-            if not line or line.startswith('#'):
-                continue
-            
-            parts = line.split()
-            if len(parts) < 7:
-                continue
-            
-            try:
-                spawn = {
-                    'race': int(parts[0]),
-                    'x': int(parts[1]),
-                    'y': int(parts[2]),
-                    'z': int(parts[3]),
-                    'radius': int(parts[4]),
-                    'amount': int(parts[5]),
-                    'spawntime': int(parts[6])
-                }
-                spawns.append(spawn)
-            except (ValueError, IndexError):
-                continue
+    # One bulk read, never decoded (int() takes the ASCII byte tokens); the 7 numeric columns are
+    # converted in a single map() per line
+    for line in _read_token_lines(monster_db_path):
+        parts = line.split()
+        if len(parts) < 7 or parts[0].startswith(b'#'):
+            continue
+        
+        try:
+            append(tuple(map(int, parts[:7])))
+        except ValueError:
+            continue
     
     return spawns
 
 
 def parse_npc_files(npc_dir):
-    """Parse .npc files to extract NPC spawn data and outfit info (using filename with npc- prefix)"""
-    npc_spawns = []
-    npc_creatures = {}  # For creatures.xml generation
-    
+    """Parse .npc files to extract NPC spawn data and outfit info (using filename with npc- prefix).
+    Cached across runs while the set of .npc files and their mtimes/sizes are unchanged."""
     npc_dir = Path(npc_dir)
     if not npc_dir.exists():
-        return npc_spawns, npc_creatures
+        return [], {}
+    
+    npc_files = [Path(entry.path) for entry in _scan_dir_files(npc_dir, '.npc')]
+    return _load_cached('npc_files', npc_files, lambda: _scan_npc_files(npc_files))
+
+
+def _npc_set_home(npc, rest):
+    """Home = [x,y,z]"""
+    parts = rest.split('=')[1].strip().strip('[]').split(',')
+    npc['home_x'] = int(parts[0])
+    npc['home_y'] = int(parts[1])
+    npc['home_z'] = int(parts[2])
+
+
+def _npc_set_outfit(npc, rest):
+    """Outfit = (looktype, head-body-legs-feet)"""
+    parts = rest.split('=', 1)[1].strip().strip('()').split(',', 1)
+    npc['looktype'] = int(parts[0].strip())
+    if len(parts) > 1:
+        colors = parts[1].strip().split('-')
+        npc['lookhead'] = int(colors[0]) if len(colors) > 0 else 0
+        npc['lookbody'] = int(colors[1]) if len(colors) > 1 else 0
+        npc['looklegs'] = int(colors[2]) if len(colors) > 2 else 0
+        npc['lookfeet'] = int(colors[3]) if len(colors) > 3 else 0
+
+
+# .npc key -> handler(npc, rest); rest is the line after the key and holds an '='. As in the original
+# line parser, Home / Radius read the text between the first and second '=', Outfit all of it after the first
+_NPC_FIELD_HANDLERS = {
+    'Home': _npc_set_home,
+    'Radius': lambda npc, rest: npc.update(radius=int(rest.split('=')[1].strip())),
+    'Outfit': _npc_set_outfit,
+}
+# Lines that start with a handled key (a prefix, as line.startswith did) and hold an '=', found in one scan
+_NPC_FIELD_LINE_RE = re.compile(r'^[^\S\n]*(Home|Radius|Outfit)([^\n]*=[^\n]*)', re.M)
+
+
+def _parse_npc_file(npc_file):
+    """Home / Radius / Outfit fields of one .npc file (defaults where absent)"""
+    npc = {'home_x': None, 'home_y': None, 'home_z': None, 'radius': 3, 'looktype': None,
+           'lookhead': 0, 'lookbody': 0, 'looklegs': 0, 'lookfeet': 0}
+    
+    # One regex scan over the file, then a dict dispatch on the key (Name is not used: we use filename + npc- prefix)
+    for key, rest in _NPC_FIELD_LINE_RE.findall(_read_text(npc_file)):
+        try:
+            _NPC_FIELD_HANDLERS[key](npc, rest)
+        except:
+            pass
+    return npc
+
+
+def _scan_npc_files(npc_files):
+    """Parse the given .npc files into (npc_spawns, npc_creatures)"""
+    npc_spawns = []
+    npc_creatures = {}  # For creatures.xml generation
     
-    for npc_file in npc_dir.glob("*.npc"):
+    # Files are read in parallel, then merged in directory order
+    for npc_file, npc in zip(npc_files, _map_files_threaded(_parse_npc_file, npc_files)):
         npc_filename = npc_file.stem
         # Use filename with "npc-" prefix (e.g. frans.npc -> npc-frans); matches RME creatures.xml
         display_name = 'npc-' + npc_filename
         
-        home_x = home_y = home_z = None
-        radius = 3
-        looktype = None
-        lookhead = lookbody = looklegs = lookfeet = 0
-        
-        with open(npc_file, 'r', encoding='latin-1', errors='ignore') as f:
-            for line in f:
-                line = line.strip()
-                
-                if line.startswith('Name') and '=' in line:
-                    pass  # Name field no longer used for creature id; we use filename + npc- prefix
-                elif line.startswith('Home') and '=' in line:
-                    try:
-                        coords = line.split('=')[1].strip().strip('[]')
-                        parts = coords.split(',')
-                        home_x = int(parts[0])
-                        home_y = int(parts[1])
-                        home_z = int(parts[2])
-                    except:
-                        pass
-                elif line.startswith('Radius') and '=' in line:
-                    try:
-                        radius = int(line.split('=')[1].strip())
-                    except:
-                        pass
-                elif line.startswith('Outfit') and '=' in line:
-                    outfit_str = line.split('=', 1)[1].strip().strip('()')
-                    try:
-                        # Format: (looktype, head-body-legs-feet)
-                        parts = outfit_str.split(',', 1)
-                        looktype = int(parts[0].strip()) if len(parts) > 0 else None
-                        if len(parts) > 1:
-                            colors = parts[1].strip().split('-')
-                            lookhead = int(colors[0]) if len(colors) > 0 else 0
-                            lookbody = int(colors[1]) if len(colors) > 1 else 0
-                            looklegs = int(colors[2]) if len(colors) > 2 else 0
-                            lookfeet = int(colors[3]) if len(colors) > 3 else 0
-                    except:
-                        pass
-        
         # Add to spawn list if has position (display_name is npc- + filename)
-        if home_x is not None:
+        if npc['home_x'] is not None:
             npc_spawns.append({
                 'name': display_name,
-                'x': home_x,
-                'y': home_y,
-                'z': home_z,
-                'radius': radius
+                'x': npc['home_x'],
+                'y': npc['home_y'],
+                'z': npc['home_z'],
+                'radius': npc['radius']
             })
         
         # Add to creatures dict (for consistency; spawn XML uses name npc- + filename)
+        looktype = npc['looktype']
         effective_looktype = looktype if (looktype is not None and looktype != 0) else 130
         npc_creatures[display_name] = {
             'name': display_name,
             'looktype': effective_looktype,
-            'lookhead': lookhead,
-            'lookbody': lookbody,
-            'looklegs': looklegs,
-            'lookfeet': lookfeet
+            'lookhead': npc['lookhead'],
+            'lookbody': npc['lookbody'],
+            'looklegs': npc['looklegs'],
+            'lookfeet': npc['lookfeet']
         }
     
     return npc_spawns, npc_creatures
@@ -1341,16 +1887,14 @@ def _write_debug_spawn_shifts_log(shift_entries, log_path=None):
         return
     log_path = log_path or (_LOGS_DIR / "debug_spawn_shifts.log")
     _LOGS_DIR.mkdir(parents=True, exist_ok=True)
-    header = "type\tname\tfrom_x\tfrom_y\tfrom_z\tto_x\tto_y\tto_z\treason"
-    lines = [
-        f"{e['type']}\t{e['name']}\t{e['from_x']}\t{e['from_y']}\t{e['from_z']}\t{e['to_x']}\t{e['to_y']}\t{e['to_z']}\t{e['reason']}"
-        for e in shift_entries
-    ]
-    with open(log_path, 'w', encoding='utf-8') as f:
-        f.write(header + '\n' + '\n'.join(lines))
+    with open(log_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        write = f.write
+        write("type\tname\tfrom_x\tfrom_y\tfrom_z\tto_x\tto_y\tto_z\treason")
+        for e in shift_entries:
+            write(f"\n{e['type']}\t{e['name']}\t{e['from_x']}\t{e['from_y']}\t{e['from_z']}\t{e['to_x']}\t{e['to_y']}\t{e['to_z']}\t{e['reason']}")
 
 
-def generate_spawns_xml(monster_db_path, mon_dir, npc_dir, output_path, sectors, objects_srv_path=None):
+def generate_spawns_xml(monster_db_path, mon_dir, npc_dir, output_path, areas, objects_srv_path=None):
     """Generate map-spawn.xml from monster.db and .npc files, checking walkability.
     Spawn center is only nudged when another SPAWN CENTER is there; spawn centers may sit on monster tiles.
     Walkable = tiles with no Unpass item (objects.srv); nudged centers land on walkable tiles only."""
@@ -1374,221 +1918,127 @@ def generate_spawns_xml(monster_db_path, mon_dir, npc_dir, output_path, sectors,
     
     # Build walkable tile set: tiles with items and no Unpass item on them
     print("Building walkable tile map from sectors...")
-    walkable_tiles = load_walkable_tiles_from_sectors(sectors, unpass_type_ids=unpass_type_ids)
-    print(f"  Found {len(walkable_tiles)} walkable tiles")
+    grid, n_walkable = load_walkable_tiles_from_sectors(areas, unpass_type_ids=unpass_type_ids)
+    print(f"  Found {n_walkable} walkable tiles")
     
-    # Track: used tiles = where a creature stands; spawn centers = where a spawn center is (no two centers on same tile)
-    global_used_tiles = set()
+    # Track: grid = walkable tiles, _TILE_FREE until a creature stands there (_TILE_USED);
+    # spawn centers = where a spawn center is (no two centers on same tile), keyed by _tile_key ints.
+    tile_state = grid.state
     global_spawn_centers = set()
     shift_entries = []  # for logs/debug_spawn_shifts.log
     
-    xml_lines = ['<?xml version="1.0"?>']
-    xml_lines.append('<spawns>')
+    # Search patterns, flattened once: monster center nudge, monster placement spiral,
+    # NPC center nudge (cardinal, then rings), NPC standing tile
+    width = grid.width
+    monster_center_offsets = _ring_search_offsets(range(1, 25), width)
+    monster_placement_offsets = _ring_search_offsets(range(_SPAWN_REACH + 1), width)
+    npc_center_offsets = tuple((dx, dy, dx + dy * width, dx + dy * _KEY_Y)
+                               for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1))) + _ring_search_offsets(range(2, 10), width)
+    npc_stand_offsets = _ring_search_offsets(range(0, 15), width)
     
     total_creatures = 0
     skipped_unwalkable = 0
     
-    # Process each monster.db line as one spawn
-    for spawn in monster_spawns:
-        race = spawn['race']
-        monster_name = race_to_name.get(race)
-        
-        if not monster_name:
-            continue
-        
-        center_x = spawn['x']
-        center_y = spawn['y']
-        z = spawn['z']
-        amount = spawn['amount']
-        
-        # Nudge spawn center ONLY when another spawn center is there; nudged center must be walkable (no Unpass)
-        if (center_x, center_y, z) in global_spawn_centers:
-            orig_x, orig_y = center_x, center_y
-            center_found = False
-            for radius in range(1, 25):
-                if center_found:
-                    break
-                for dx in range(-radius, radius + 1):
-                    for dy in range(-radius, radius + 1):
-                        if abs(dx) == radius or abs(dy) == radius:
-                            nx, ny = orig_x + dx, orig_y + dy
-                            tile = (nx, ny, z)
-                            if tile not in global_spawn_centers and tile in walkable_tiles:
-                                center_x, center_y = nx, ny
-                                center_found = True
-                                shift_entries.append({
-                                    'type': 'monster', 'name': monster_name,
-                                    'from_x': orig_x, 'from_y': orig_y, 'from_z': z,
-                                    'to_x': center_x, 'to_y': center_y, 'to_z': z,
-                                    'reason': 'spawn_center_collision',
-                                })
-                                break
-                    if center_found:
-                        break
-        
-        global_spawn_centers.add((center_x, center_y, z))
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    # Stream straight to disk through a 1 MiB buffer instead of collecting every line for one big join
+    with open(output_path, 'w', encoding='utf-8', buffering=1 << 20) as out:
+        write = out.write
+        write('<?xml version="1.0"?>\n<spawns>')
         
-        # Place creatures and track their offsets
-        creature_offsets = []
+        # Process each monster.db line as one spawn; unknown races are dropped once, up front
+        named_spawns = [(race_to_name[race], x, y, z, amount, spawntime)
+                        for race, x, y, z, _, amount, spawntime in monster_spawns if race in race_to_name]
+        placements = _place_monster_spawns(
+            named_spawns, grid, global_spawn_centers, monster_center_offsets, monster_placement_offsets)
         
-        # Use spiral pattern to place creatures on unique, WALKABLE tiles
-        placed_count = 0
-        for radius in range(50):  # Search outward from center
-            if placed_count >= amount:
-                break
+        for (monster_name, _, _, z, amount, spawntime), placement in zip(named_spawns, placements):
+            center_x, center_y, creature_offsets, skipped, shifted_from = placement
             
-            if radius == 0:
-                # Try center first
-                tile = (center_x, center_y, z)
-                if tile not in global_used_tiles and tile in walkable_tiles:
-                    global_used_tiles.add(tile)
-                    creature_offsets.append((0, 0))
-                    placed_count += 1
-                elif tile not in walkable_tiles:
-                    skipped_unwalkable += 1
+            if shifted_from is not None:
+                shift_entries.append({
+                    'type': 'monster', 'name': monster_name,
+                    'from_x': shifted_from[0], 'from_y': shifted_from[1], 'from_z': z,
+                    'to_x': center_x, 'to_y': center_y, 'to_z': z,
+                    'reason': 'spawn_center_collision',
+                })
+            skipped_unwalkable += skipped
+            placed_count = len(creature_offsets)
+            
+            if placed_count < amount:
+                print(f"  ⚠ Warning: Could only place {placed_count}/{amount} {monster_name} at ({center_x}, {center_y}, {z}) - not enough walkable tiles")
+            
+            # Calculate radius as the max offset used. Offsets are claimed ring by ring
+            # (_place_spawn_creatures), so the last one is the farthest out: no per-creature scan
+            if creature_offsets:
+                last_dx, last_dy = creature_offsets[-1]
+                calculated_radius = max(1, abs(last_dx), abs(last_dy))  # Minimum radius 1
             else:
-                # Spiral outward
-                for dx in range(-radius, radius + 1):
-                    for dy in range(-radius, radius + 1):
-                        if placed_count >= amount:
-                            break
-                        
-                        # Only check perimeter of current radius
-                        if abs(dx) == radius or abs(dy) == radius:
-                            tile = (center_x + dx, center_y + dy, z)
-                            
-                            # Check if walkable AND not used
-                            if tile in walkable_tiles and tile not in global_used_tiles:
-                                global_used_tiles.add(tile)
-                                creature_offsets.append((dx, dy))
-                                placed_count += 1
-                            elif tile not in walkable_tiles:
-                                skipped_unwalkable += 1
-                    
-                    if placed_count >= amount:
-                        break
-        
-        if placed_count < amount:
-            print(f"  ⚠ Warning: Could only place {placed_count}/{amount} {monster_name} at ({center_x}, {center_y}, {z}) - not enough walkable tiles")
-        
-        # Calculate radius as the max offset used
-        if creature_offsets:
-            max_offset = max(max(abs(dx), abs(dy)) for dx, dy in creature_offsets)
-            calculated_radius = max(1, max_offset)  # Minimum radius 1
-        else:
-            calculated_radius = 1
-            continue  # Skip spawn if no creatures placed
-        
-        # Write spawn with calculated radius
-        xml_lines.append(
-            f'\t<spawn centerx="{center_x}" centery="{center_y}" '
-            f'centerz="{z}" radius="{calculated_radius}">'
-        )
-        
-        for dx, dy in creature_offsets:
-            xml_lines.append(
-                f'\t\t<monster name="{monster_name}" x="{dx}" y="{dy}" '
-                f'z="{z}" spawntime="{spawn["spawntime"]}"/>'
+                calculated_radius = 1
+                continue  # Skip spawn if no creatures placed
+            
+            # Write spawn with calculated radius; the whole block goes out in one write
+            monsters = ''.join([
+                f'\n\t\t<monster name="{monster_name}" x="{dx}" y="{dy}" z="{z}" spawntime="{spawntime}"/>'
+                for dx, dy in creature_offsets
+            ])
+            write(
+                f'\n\t<spawn centerx="{center_x}" centery="{center_y}" '
+                f'centerz="{z}" radius="{calculated_radius}">{monsters}\n\t</spawn>'
             )
-            total_creatures += 1
-        
-        xml_lines.append('\t</spawn>')
-    
-    # Add NPC spawns. Spawn center only blocked by other spawn centers; NPC standing tile must be walkable+unused.
-    npc_count = 0
-    for npc in npc_spawns:
-        original_center_x = npc['x']
-        original_center_y = npc['y']
-        z = npc['z']
-        
-        center_x = original_center_x
-        center_y = original_center_y
-        center_found = False
+            total_creatures += placed_count
         
-        # Accept center if not another spawn center (we don't care about solid/wall when just placing)
-        if (center_x, center_y, z) not in global_spawn_centers:
-            center_found = True
-            global_spawn_centers.add((center_x, center_y, z))
-        else:
-            # Nudge ONLY on overlap; then we care: new center must be walkable (no Unpass)
-            for dx, dy in [(1, 0), (-1, 0), (0, 1), (0, -1)]:
-                nx, ny = original_center_x + dx, original_center_y + dy
-                tile = (nx, ny, z)
-                if tile not in global_spawn_centers and tile in walkable_tiles:
-                    center_x, center_y = nx, ny
+        # Add NPC spawns. Spawn center only blocked by other spawn centers; NPC standing tile must be walkable+unused.
+        npc_count = 0
+        for npc in npc_spawns:
+            original_center_x = npc['x']
+            original_center_y = npc['y']
+            z = npc['z']
+            
+            center_x = original_center_x
+            center_y = original_center_y
+            center_found = False
+            
+            # Accept center if not another spawn center (we don't care about solid/wall when just placing)
+            center_key = _tile_key(center_x, center_y, z)
+            if center_key not in global_spawn_centers:
+                center_found = True
+            else:
+                # Nudge ONLY on overlap; then we care: new center must be walkable (no Unpass)
+                cell = grid.key(center_x, center_y, z)
+                nudge = _find_free_center(center_key, cell, npc_center_offsets, tile_state, global_spawn_centers)
+                if nudge is not None:
+                    center_x, center_y = original_center_x + nudge[0], original_center_y + nudge[1]
                     center_found = True
-                    global_spawn_centers.add((center_x, center_y, z))
                     shift_entries.append({
                         'type': 'npc', 'name': npc['name'],
                         'from_x': original_center_x, 'from_y': original_center_y, 'from_z': z,
                         'to_x': center_x, 'to_y': center_y, 'to_z': z,
                         'reason': 'spawn_center_collision',
                     })
-                    break
+            
             if not center_found:
-                for radius in range(2, 10):
-                    if center_found:
-                        break
-                    for dx in range(-radius, radius + 1):
-                        for dy in range(-radius, radius + 1):
-                            if abs(dx) == radius or abs(dy) == radius:
-                                nx, ny = original_center_x + dx, original_center_y + dy
-                                tile = (nx, ny, z)
-                                if tile not in global_spawn_centers and tile in walkable_tiles:
-                                    center_x, center_y = nx, ny
-                                    center_found = True
-                                    global_spawn_centers.add((center_x, center_y, z))
-                                    shift_entries.append({
-                                        'type': 'npc', 'name': npc['name'],
-                                        'from_x': original_center_x, 'from_y': original_center_y, 'from_z': z,
-                                        'to_x': center_x, 'to_y': center_y, 'to_z': z,
-                                        'reason': 'spawn_center_collision',
-                                    })
-                                    break
-                        if center_found:
-                            break
-        
-        if not center_found:
-            print(f"  ⚠ Warning: Could not place NPC '{npc['name']}' near ({original_center_x}, {original_center_y}, {z}) - no available spawn centers")
-            continue
-        
-        # Find where NPC stands: first walkable+unused tile from center outward (spawn center may be on monster)
-        final_dx, final_dy = 0, 0
-        npc_tile_found = False
-        for radius in range(0, 15):
-            if npc_tile_found:
-                break
-            for dx in range(-radius, radius + 1):
-                for dy in range(-radius, radius + 1):
-                    if radius == 0 or abs(dx) == radius or abs(dy) == radius:
-                        tile = (center_x + dx, center_y + dy, z)
-                        if tile in walkable_tiles and tile not in global_used_tiles:
-                            final_dx, final_dy = dx, dy
-                            global_used_tiles.add(tile)
-                            npc_tile_found = True
-                            break
-                if npc_tile_found:
-                    break
-        
-        if not npc_tile_found:
-            print(f"  ⚠ Warning: No walkable tile for NPC '{npc['name']}' near center ({center_x}, {center_y}, {z})")
-            continue
+                print(f"  ⚠ Warning: Could not place NPC '{npc['name']}' near ({original_center_x}, {original_center_y}, {z}) - no available spawn centers")
+                continue
+            global_spawn_centers.add(_tile_key(center_x, center_y, z))
+            
+            # Find where NPC stands: first walkable+unused tile from center outward (spawn center may be on monster)
+            cell = grid.key(center_x, center_y, z)
+            stand = _find_free_tile(cell, npc_stand_offsets, tile_state)
+            if stand is None:
+                print(f"  ⚠ Warning: No walkable tile for NPC '{npc['name']}' near center ({center_x}, {center_y}, {z})")
+                continue
+            final_dx, final_dy = stand
+            tile_state[cell + final_dx + final_dy * width] = _TILE_USED
+            
+            write(
+                f'\n\t<spawn centerx="{center_x}" centery="{center_y}" '
+                f'centerz="{z}" radius="1">'
+                f'\n\t\t<npc name="{npc["name"]}" x="{final_dx}" y="{final_dy}" z="{z}" spawntime="60"/>'
+                '\n\t</spawn>'
+            )
+            npc_count += 1
         
-        xml_lines.append(
-            f'\t<spawn centerx="{center_x}" centery="{center_y}" '
-            f'centerz="{z}" radius="1">'
-        )
-        xml_lines.append(
-            f'\t\t<npc name="{npc["name"]}" x="{final_dx}" y="{final_dy}" z="{z}" spawntime="60"/>'
-        )
-        xml_lines.append('\t</spawn>')
-        npc_count += 1
-    
-    xml_lines.append('</spawns>')
-    
-    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write('\n'.join(xml_lines))
+        write('\n</spawns>')
     
     _write_debug_spawn_shifts_log(shift_entries)
     
@@ -1643,10 +2093,10 @@ def main():
     output_dir = Path('output')
     output_dir.mkdir(parents=True, exist_ok=True)
     
-    # Load sectors once (needed for both map and spawn generation)
-    sectors = load_all_sectors(map_dir)
+    # Load sectors once, binned into tile areas (needed for both map and spawn generation)
+    areas = load_all_sectors(map_dir)
     
-    if not sectors:
+    if not areas:
         print("\n❌ No valid sectors found!")
         sys.exit(1)
     
@@ -1668,9 +2118,10 @@ def main():
     # House positions for OTBM_HOUSETILE (so RME shows houses; house XML only updates metadata)
     houses_dat = dat_dir / 'houses.dat'
     houseareas_dat = dat_dir / 'houseareas.dat'
+    houses_list = []
     house_positions = {}
     if houses_dat.exists():
-        houses_list = parse_houses_dat(dat_dir / 'houses.dat')
+        houses_list = parse_houses_dat(houses_dat)
         house_positions = build_house_positions(houses_list)
         if house_positions:
             print(f"\n✓ House tiles: {len(house_positions)} positions from houses.dat Fields")
@@ -1685,7 +2136,7 @@ def main():
     
     # Convert map (with house tiles so RME creates House objects)
     convert_map_to_otbm(
-        sectors,
+        areas,
         output_dir / f'{output_name}.otbm',
         output_name,
         towns=towns,
@@ -1695,9 +2146,10 @@ def main():
     
     # Generate houses XML (name, entry, rent, townid - applied to houses created from OTBM)
     if houses_dat.exists() and houseareas_dat.exists():
+        # houses.dat was already parsed above for the house tiles; reuse it
         generate_houses_xml(
-            houses_dat,
-            houseareas_dat,
+            houses_list,
+            parse_houseareas(houseareas_dat),
             output_dir / f'{output_name}-house.xml'
         )
     else:
@@ -1712,7 +2164,7 @@ def main():
             mon_dir,
             npc_dir,
             output_dir / f'{output_name}-spawn.xml',
-            sectors,
+            areas,
             objects_srv_path=objects_srv,
         )
     else:
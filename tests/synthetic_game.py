@@ -0,0 +1,158 @@
+"""Small deterministic tibia-game folder (map/, dat/, mon/, npc/) for the output regression tests.
+
+The expected outputs in tests/data/baseline/ were written by the original converter (the repository's
+first commit) from exactly this folder:
+
+    python tests/synthetic_game.py /tmp/game
+    cd /tmp/out && python <original checkout>/sec_to_otbm.py /tmp/game world
+
+so any change here means regenerating them the same way.
+"""
+import random
+import sys
+from pathlib import Path
+
+# Sectors spread over several OTBM tile areas (256x256) and floors, so area order matters
+SECTORS = [
+    (999, 999, 7), (1000, 999, 7), (1000, 1000, 7), (1001, 1000, 7), (1007, 1000, 7), (1008, 1000, 7),
+    (1000, 1008, 7), (1008, 1008, 7), (1000, 1000, 6), (1001, 1001, 6), (1008, 1000, 8), (1000, 1000, 0),
+    (1015, 1016, 15),
+]
+
+STRINGS = ['String="Hello, world"', 'String="brace } inside { and, comma"', 'String="escaped \\" quote"']
+
+
+def _objects_srv(ids):
+    lines = []
+    for type_id in ids:
+        flags = []
+        if type_id % 11 == 0:
+            flags.append('Bank')
+        elif type_id % 11 == 1:
+            flags.append('Clip')
+        elif type_id % 11 == 2:
+            flags.append('Bottom')
+        elif type_id % 11 == 3:
+            flags.append('Top')
+        if type_id % 7 == 0:
+            flags.append('Unpass')
+        if type_id % 13 == 0:
+            flags.append('Container')
+        lines += [f'TypeID      = {type_id}', f'Name        = "item {type_id}"',
+                  f'Flags       = {{{", ".join(flags)}}}', 'Attributes  = {Waypoints=100}', '']
+    return '\n'.join(lines)
+
+
+def _sector(rng, sx, sy, z, ids):
+    lines = ['# Tibia - graphical Multi-User-Dungeon', f'# Data for sector {sx}/{sy}/{z}', '',
+             '# SectorFormat=TextDump', '']
+    for lx in range(32):
+        for ly in range(32):
+            if rng.random() < 0.55:
+                continue
+            flags = [flag for flag, p in (('Refresh', 0.05), ('ProtectionZone', 0.05), ('NoLogout', 0.02))
+                     if rng.random() < p]
+            specs = []
+            for _ in range(rng.choice([0, 1, 1, 1, 2, 2, 3, 4])):
+                spec = str(rng.choice(ids))
+                q = rng.random()
+                if q < 0.04:
+                    spec += f' Amount={rng.randint(1, 100)}'
+                elif q < 0.06:
+                    spec += f' KeyNumber={rng.randint(1, 5000)}'
+                elif q < 0.07:
+                    spec += f' AbsTeleportDestination={rng.randint(-2**31, 2**31 - 1)}'
+                elif q < 0.08:
+                    spec += ' ' + rng.choice(STRINGS)
+                elif q < 0.09:
+                    spec += f' Content={{{rng.choice(ids)}, {rng.choice(ids)} Amount=5}}'
+                specs.append(spec)
+            lines.append(f'{lx}-{ly}: {"".join(flag + ", " for flag in flags)}Content={{{", ".join(specs)}}}')
+    return '\n'.join(lines) + '\n'
+
+
+def _houses_dat(rng, tiles):
+    lines = []
+    for house_id in range(1, 16):
+        lines.append(f'ID = {house_id}')
+        lines.append(f'Name = "House {house_id} & <Co> = Main St."')
+        lines.append(f'RentOffset = {house_id * 100}')
+        if house_id % 5:
+            lines.append(f'Area = {house_id % 4}')
+        if house_id % 4 == 0:
+            lines.append('GuildHouse = true')
+        if house_id == 6:
+            lines.append('GuildHouse = TRUE = yes')   # value between the first and second '='
+        lines.append(f'Exit = [{32000 + house_id},{32100 + house_id},7]')
+        fields = rng.sample(tiles, 4)
+        lines.append('Fields = {' + ','.join(f'[{x},{y},{z}]' for x, y, z in fields) + '}')
+        if house_id == 3:
+            lines.append('AreaOverride = 2')        # key prefix, as line.startswith('Area') read it
+        if house_id % 6 != 0:
+            lines.append('')                        # every sixth house is closed by the next ID line
+    lines += ['ID = notanumber', 'Name = "Broken"', '', '# trailing comment']
+    return '\n'.join(lines) + '\n'
+
+
+def build_game(root, seed=770):
+    """Write the synthetic game folder under `root` (created if missing)"""
+    rng = random.Random(seed)
+    root = Path(root)
+    for sub in ('map', 'dat', 'mon', 'npc'):
+        (root / sub).mkdir(parents=True, exist_ok=True)
+
+    ids = list(range(100, 260)) + [253, 254, 255, 509, 510, 511, 65021]
+    (root / 'dat' / 'objects.srv').write_text(_objects_srv(sorted(set(ids))), encoding='latin-1')
+
+    for sx, sy, z in SECTORS:
+        (root / 'map' / f'{sx:04d}-{sy:04d}-{z:02d}.sec').write_text(_sector(rng, sx, sy, z, ids),
+                                                                     encoding='latin-1')
+    (root / 'map' / '0999-0998-07.sec').write_text('# only comments\n', encoding='latin-1')
+    # Area (124,125) next to (125,124): row-major and z-order put these two in different orders
+    (root / 'map' / '0999-1000-07.sec').write_text('0-0: Content={100}\n31-5: Refresh, Content={101, 102}\n',
+                                                   encoding='latin-1')
+
+    towns = ['Thais', 'Carlin', 'Port Hope']
+    map_dat = ['# map.dat'] + [f'Depot = ({i},"{town}",1000)' for i, town in enumerate(towns)]
+    map_dat += [f'Mark = ("{town}",[{32000 + i},{32000 + i},07])' for i, town in enumerate(towns)]
+    (root / 'dat' / 'map.dat').write_text('\n'.join(map_dat) + '\n', encoding='latin-1')
+    (root / 'dat' / 'moveuse.dat').write_text(
+        'BEGIN "Hometeleporters"\n'
+        'Use, SetStart(Obj2,[32010,32010,7]) -> "Home Thais (1)"\n'
+        'Use, SetStart(Obj2,[32020,32020,7]) -> "Home Port Hope (?)"\n'
+        'END\n', encoding='latin-1')
+
+    (root / 'dat' / 'houseareas.dat').write_text(
+        '# areas\n' + ''.join(f'Area = ({a},"Area {a}, Border",{a * 10},{a % 3})\n' for a in range(4)),
+        encoding='latin-1')
+    tiles = [(sx * 32 + rng.randrange(32), sy * 32 + rng.randrange(32), z)
+             for sx, sy, z in SECTORS for _ in range(6)]
+    (root / 'dat' / 'houses.dat').write_text(_houses_dat(rng, tiles), encoding='latin-1')
+
+    for race in range(1, 9):
+        (root / 'mon' / f'monster{race}.mon').write_text(
+            f'# monster {race}\nName = "mon {race}"\nRaceNumber = {race}   # race\n', encoding='latin-1')
+
+    for i in range(6):
+        body = [f'Name = "Npc {i}"', f'Home = [{32005 + i * 3},{32010},7]', f'Outfit = ({128 + i}, 1-2-3-4)']
+        (root / 'npc' / f'npc{i}.npc').write_text('\n'.join(body) + '\n', encoding='latin-1')
+    # Same home as npc0 and a monster spawn center: forces NPC center nudges
+    (root / 'npc' / 'zz_clone.npc').write_text('Home = [32005,32010,7]\n', encoding='latin-1')
+
+    db = ['# race x y z radius amount spawntime']
+    centers = [(32005, 32010, 7), (32040, 32040, 7), (32016, 32016, 6), (32260, 32010, 8), (32010, 31990, 7)]
+    for i in range(60):
+        sx, sy, z = rng.choice(SECTORS)
+        x, y, z = rng.choice(centers) if i % 3 else (sx * 32 + rng.randrange(32), sy * 32 + rng.randrange(32), z)
+        db.append(f'{rng.randint(1, 10)} {x} {y} {z} {rng.randint(1, 5)} {rng.choice([1, 2, 3, 8])} '
+                  f'{rng.choice([60, 120, 600])}')
+    db += ['3 32005 32010 7 2 2 60', '3 32005 32010 7 2 2 60', '3 32005 32010 7 4 2 60', '', 'a b c']
+    # Centers off the map but within reach of it, one out of reach, and big amounts: long searches
+    # that cross the gaps the spawn grid compresses
+    db += ['4 32100 32010 7 3 150 60', '4 32010 32078 7 3 150 60', '4 32150 32150 7 3 5 60',
+           '4 32290 32290 7 3 300 60', '4 32530 32530 15 3 100 60', '4 32112 32010 7 3 40 60']
+    (root / 'dat' / 'monster.db').write_text('\n'.join(db) + '\n', encoding='latin-1')
+
+
+if __name__ == '__main__':
+    build_game(sys.argv[1])
@@ -0,0 +1,137 @@
+"""sec_to_otbm.py end to end on tests/synthetic_game.py against the original converter's outputs.
+
+The files in tests/data/baseline/ were written by the repository's first sec_to_otbm.py from the
+synthetic game folder (see tests/synthetic_game.py for how to regenerate them).
+
+Run from the repository root: python -m unittest discover tests
+"""
+import os
+import struct
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import parse_cache  # noqa: E402
+import sec_to_otbm  # noqa: E402
+from synthetic_game import build_game  # noqa: E402
+
+BASELINE_DIR = Path(__file__).resolve().parent / 'data' / 'baseline'
+
+NODE_ESC, NODE_START, NODE_END = 0xFD, 0xFE, 0xFF
+OTBM_MAP_DATA, OTBM_TILE_AREA = 2, 4
+
+
+def parse_otbm(data):
+    """OTBM node tree as (type, unescaped props, children); the root node may be left unterminated"""
+    pos = 4  # file identifier
+
+    def node():
+        nonlocal pos
+        assert data[pos] == NODE_START, pos
+        node_type = data[pos + 1]
+        pos += 2
+        props = bytearray()
+        children = []
+        while pos < len(data):
+            byte = data[pos]
+            if byte == NODE_ESC:
+                props.append(data[pos + 1])
+                pos += 2
+            elif byte == NODE_START:
+                children.append(node())
+            elif byte == NODE_END:
+                pos += 1
+                break
+            else:
+                props.append(byte)
+                pos += 1
+        return node_type, bytes(props), children
+
+    root = node()
+    assert pos == len(data), (pos, len(data))
+    return root
+
+
+def canonical(node):
+    """Node tree with areas and the tiles inside each area sorted: the file order of both is free"""
+    node_type, props, children = node
+    children = [canonical(child) for child in children]
+    if node_type in (OTBM_MAP_DATA, OTBM_TILE_AREA):
+        children.sort()
+    return node_type, props, children
+
+
+def z_order(area):
+    """Floor, then the bit-interleaved (x, y) index of the 256x256 area"""
+    x, y, z = area
+    code = 0
+    for bit in range(8):
+        code |= ((x >> (8 + bit)) & 1) << (2 * bit) | ((y >> (8 + bit)) & 1) << (2 * bit + 1)
+    return z, code
+
+
+def find_map_data(node):
+    """The map data node (towns, waypoints and tile areas) under the root"""
+    node_type, props, children = node
+    return node if node_type == OTBM_MAP_DATA else next(filter(None, map(find_map_data, children)), None)
+
+
+class BaselineOutputsTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        tmp = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(tmp.cleanup)
+        root = Path(tmp.name)
+        build_game(root / 'game')
+        cls.outputs = {}
+        cwd = os.getcwd()
+        # Twice: a cold run parses everything, the second one reads the parse cache
+        for run in ('cold', 'cached'):
+            (root / run).mkdir()
+            os.chdir(root / run)
+            try:
+                with mock.patch.object(parse_cache, 'CACHE_DIR', root / 'cache'), \
+                        mock.patch.object(sec_to_otbm, '_LOGS_DIR', root / 'logs'), \
+                        mock.patch.object(sys, 'argv', ['sec_to_otbm.py', str(root / 'game'), 'world']), \
+                        mock.patch('builtins.print'):
+                    sec_to_otbm.main()
+            finally:
+                os.chdir(cwd)
+            cls.outputs[run] = {path.name: path.read_bytes() for path in (root / run / 'output').iterdir()}
+
+    def _assert_output_equal(self, name):
+        expected = (BASELINE_DIR / name).read_bytes()
+        for run, outputs in self.outputs.items():
+            with self.subTest(run=run):
+                self.assertEqual(outputs[name], expected)
+
+    def test_house_xml_matches_baseline(self):
+        self._assert_output_equal('world-house.xml')
+
+    def test_spawn_xml_matches_baseline(self):
+        self._assert_output_equal('world-spawn.xml')
+
+    def test_otbm_content_matches_baseline(self):
+        expected = canonical(parse_otbm((BASELINE_DIR / 'world.otbm').read_bytes()))
+        for run, outputs in self.outputs.items():
+            with self.subTest(run=run):
+                self.assertEqual(canonical(parse_otbm(outputs['world.otbm'])), expected)
+
+    def test_otbm_areas_are_in_z_order(self):
+        for run, outputs in self.outputs.items():
+            _, _, children = find_map_data(parse_otbm(outputs['world.otbm']))
+            areas = [struct.unpack('<HHB', props[:5]) for node_type, props, _ in children
+                     if node_type == OTBM_TILE_AREA]
+            with self.subTest(run=run):
+                self.assertGreater(len({area[2] for area in areas}), 1)
+                self.assertEqual(areas, sorted(areas, key=z_order))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+"""houses.dat parsing (_scan_houses_dat in both scripts) against the original line-by-line parsers.
+
+Run from the repository root: python -m unittest discover tests
+"""
+import random
+import re
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import sec_to_otbm  # noqa: E402
+
+try:
+    import generate_rme_data
+except ImportError:  # lxml missing
+    generate_rme_data = None
+
+
+def reference_houses(path, fields_as_tiles):
+    """The original parse_houses_dat: sec_to_otbm keeps Fields as tiles, generate_rme_data only counts them"""
+    houses = []
+    with open(path, 'r', encoding='latin-1', errors='ignore') as f:
+        lines = f.readlines()
+    i = 0
+    while i < len(lines):
+        line = lines[i].strip()
+        if line.startswith('ID'):
+            house = {}
+            try:
+                house['id'] = int(line.split('=')[1].strip())
+            except:  # noqa: E722 (as in the original)
+                i += 1
+                continue
+            i += 1
+            while i < len(lines):
+                line = lines[i].strip()
+                if line.startswith('ID'):
+                    i -= 1
+                    break
+                if line.startswith('Name'):
+                    house['name'] = line.split('=', 1)[1].strip().strip('"')
+                elif line.startswith('RentOffset'):
+                    house['rent'] = int(line.split('=')[1].strip())
+                elif line.startswith('Area'):
+                    house['area'] = int(line.split('=')[1].strip())
+                elif line.startswith('GuildHouse'):
+                    house['guildhall'] = line.split('=')[1].strip().lower() == 'true'
+                elif line.startswith('Exit'):
+                    parts = line.split('=')[1].strip().strip('[]').split(',')
+                    house['entryx'] = int(parts[0])
+                    house['entryy'] = int(parts[1])
+                    house['entryz'] = int(parts[2])
+                elif line.startswith('Fields'):
+                    if fields_as_tiles:
+                        house['tiles'] = [(int(m.group(1)), int(m.group(2)), int(m.group(3)))
+                                          for m in re.finditer(r'\[(\d+),(\d+),(\d+)\]', line.split('=', 1)[1])]
+                        house['size'] = len(house['tiles'])
+                    else:
+                        house['size'] = line.split('=')[1].strip().strip('{}').count('[')
+                i += 1
+                if not line:
+                    break
+            houses.append(house)
+        else:
+            i += 1
+    return houses
+
+
+SAMPLE = (
+    '# houses\n'
+    'ID = 1\n'
+    'Name = "Main St. 1 = corner"\n'
+    'RentOffset = 100\n'
+    'Area = 3\n'
+    'GuildHouse = true\n'
+    'Exit = [32000,32100,7]\n'
+    'Fields = {[32000,32101,7],[32001,32101,7]}\n'
+    '\n'
+    'ID = 2 = two\n'
+    '  Name="Indented"\r\n'
+    'RentOffset = 5 = five\n'
+    'AreaOverride = 4\n'
+    'GuildHouse = TRUE = no\n'
+    'Exit = [1,2,3] = old\n'
+    'Fields = {[1,2,3]} = {[4,5,6],[7,8,9]}\n'
+    'Unknown = 7\n'
+    'ID = 3\n'
+    'Name\n'
+    'Fields = {}\n'
+    '\n'
+    'ID = x\n'
+    'Name = "Skipped"\n'
+    '\n'
+    'ID = 4\n'
+    'Name = "No trailing blank line"'
+)
+
+
+class HousesDatTest(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+
+    def _write(self, name, text):
+        path = self.root / name
+        path.write_bytes(text.encode('latin-1'))
+        return path
+
+    def _parsers(self):
+        parsers = [(sec_to_otbm._scan_houses_dat, True)]
+        if generate_rme_data is not None:
+            parsers.append((generate_rme_data._scan_houses_dat, False))
+        return parsers
+
+    def _assert_matches_reference(self, path):
+        for scan, fields_as_tiles in self._parsers():
+            self.assertEqual(scan(path), reference_houses(path, fields_as_tiles))
+
+    def test_sample_matches_reference(self):
+        self._assert_matches_reference(self._write('houses.dat', SAMPLE.replace('Name\n', '')))
+
+    def test_key_without_value_is_skipped(self):
+        houses = sec_to_otbm._scan_houses_dat(self._write('houses.dat', SAMPLE))
+        self.assertEqual(houses[2], {'id': 3, 'tiles': [], 'size': 0})
+        self.assertEqual(houses[1]['area'], 4)
+        self.assertEqual(houses[1]['tiles'], [(1, 2, 3), (4, 5, 6), (7, 8, 9)])
+
+    def test_randomised_files_match_reference(self):
+        rng = random.Random(770)
+        lines = ['Name = "a = b"', 'RentOffset = 10', 'RentOffset=20=30', 'Area = 2', 'AreaX = 3',
+                 'GuildHouse = true', 'GuildHouse = false = true', 'GuildHouses = True',
+                 'Exit = [1,2,3]', 'Exit = [4,5,6] = [7,8,9]', 'Fields = {[1,2,3],[4,5,6]}',
+                 'Fields = {[1,2,3]} = {[4,5,6]}', 'Fields = {}', '# comment', 'Other = 1', '', '  ']
+        for i in range(200):
+            body = []
+            for house_id in range(rng.randrange(0, 5)):
+                body.append(rng.choice((f'ID = {house_id}', f'ID={house_id} = 9', 'ID = bad')))
+                # at least one non-ID line after each ID (the original parser loops on two ID lines in a row)
+                body += [rng.choice(lines) for _ in range(rng.randrange(1, 6))]
+            text = rng.choice(('\n', '\r\n')).join(body) + rng.choice(('', '\n'))
+            path = self._write(f'r{i}.dat', text)
+            with self.subTest(i=i):
+                self._assert_matches_reference(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
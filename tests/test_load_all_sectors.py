@@ -0,0 +1,66 @@
+"""load_all_sectors caching: a scan with parse failures is reported and never cached.
+
+Run from the repository root: python -m unittest discover tests
+"""
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import parse_cache  # noqa: E402
+import sec_to_otbm  # noqa: E402
+
+SECTOR = """\
+# Data for sector 1000/1000/7
+0-0: Content={100}
+1-0: Content={101, 102}
+"""
+
+
+class LoadAllSectorsCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        self.map_dir = self.root / 'map'
+        self.map_dir.mkdir()
+        for name in ('1000-1000-07.sec', '1001-1000-07.sec'):
+            (self.map_dir / name).write_text(SECTOR, encoding='latin-1')
+        for patcher in (mock.patch.object(parse_cache, 'CACHE_DIR', self.root / 'cache'),
+                        mock.patch('builtins.print')):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _cache_entries(self):
+        return list(parse_cache.CACHE_DIR.glob('sectors-*.pkl')) if parse_cache.CACHE_DIR.exists() else []
+
+    def test_scan_with_parse_failure_is_not_cached(self):
+        parse_sec_file = sec_to_otbm.parse_sec_file
+
+        def flaky(sec_file, sector):
+            if sec_file.name == '1001-1000-07.sec':
+                raise OSError('read error')
+            return parse_sec_file(sec_file, sector)
+
+        with mock.patch.object(sec_to_otbm, 'parse_sec_file', flaky):
+            scan = sec_to_otbm._scan_sectors(sorted(self.map_dir.iterdir()))
+            self.assertEqual(scan.parse_failures, 1)
+            self.assertEqual(scan.skipped, 1)
+            areas = sec_to_otbm.load_all_sectors(self.map_dir)
+        self.assertEqual(sum(map(len, areas.values())), 2)
+        self.assertEqual(self._cache_entries(), [])
+
+        # The next clean run parses both files and caches them; the one after reuses that entry
+        areas = sec_to_otbm.load_all_sectors(self.map_dir)
+        self.assertEqual(sum(map(len, areas.values())), 4)
+        self.assertEqual(len(self._cache_entries()), 1)
+        with mock.patch.object(sec_to_otbm, '_scan_sectors', side_effect=AssertionError('cache not used')):
+            self.assertEqual(sec_to_otbm.load_all_sectors(self.map_dir), areas)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+"""_parse_mon_race (head read + bytes regex) against the original line-by-line RaceNumber parser.
+
+Run from the repository root: python -m unittest discover tests
+"""
+import random
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import parse_cache  # noqa: E402
+import sec_to_otbm  # noqa: E402
+
+
+def reference_race(mon_file):
+    """RaceNumber as the original build_race_lookup read it: text mode, every line, first valid one"""
+    with open(mon_file, 'r', encoding='latin-1', errors='ignore') as f:
+        for line in f:
+            line = line.strip()
+            if line.startswith('RaceNumber'):
+                try:
+                    return int(line.split('=')[1].split('#')[0].strip())
+                except:  # noqa: E722 (as in the original)
+                    pass
+    return None
+
+
+def padding(size):
+    """Comment lines totalling `size` bytes"""
+    lines = []
+    while size > 0:
+        line = '#' * min(size - 1, 79) + '\n' if size > 1 else '\n'
+        lines.append(line)
+        size -= len(line)
+    return ''.join(lines)
+
+
+HEAD = sec_to_otbm._MON_HEAD_BYTES
+
+SAMPLES = {
+    'plain': 'Name = "rat"\nRaceNumber = 21\n',
+    'no_race': 'Name = "rat"\nOutfit = (21, 0-0-0-0)\n',
+    'comment_after': 'RaceNumber = 7   # race\n',
+    'commented_out': '# RaceNumber = 999\nRaceNumber = 8\n',
+    'quoted_mention': 'Talk = "RaceNumber = 12"\nRaceNumber = 9\n',
+    'invalid_then_valid': 'RaceNumber = x\nRaceNumber = 41\n',
+    'crlf': 'Name = "rat"\r\nRaceNumber = 33\r\n',
+    'cr_only': 'Name = "rat"\rRaceNumber = 34\r',
+    'indented': '  \t RaceNumber=35\n',
+    'latin1_space': '\xa0RaceNumber = 36\n',
+    'no_newline_at_end': 'Name = "rat"\nRaceNumber = 37',
+    # Past the head: found by the full-read fallback, not dropped
+    'race_after_long_header': padding(HEAD * 3) + 'RaceNumber = 50\n',
+    'invalid_in_head_valid_later': 'RaceNumber = ?\n' + padding(HEAD * 2) + 'RaceNumber = 51\n',
+    # A RaceNumber line cut by the head boundary must be read whole
+    'line_across_head': padding(HEAD - len('RaceNumber = 5')) + 'RaceNumber = 52\n',
+    'line_ends_at_head': padding(HEAD - len('RaceNumber = 53\n')) + 'RaceNumber = 53\n',
+    'exactly_head_no_race': padding(HEAD),
+}
+
+
+class MonRaceTest(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.mon_dir = Path(tmp.name)
+
+    def _write(self, name, text):
+        path = self.mon_dir / f'{name}.mon'
+        path.write_bytes(text.encode('latin-1'))
+        return path
+
+    def test_samples_match_reference(self):
+        for name, text in SAMPLES.items():
+            with self.subTest(name):
+                path = self._write(name, text)
+                self.assertEqual(sec_to_otbm._parse_mon_race(path), reference_race(path))
+
+    def test_long_header_race_is_found(self):
+        path = self._write('long', SAMPLES['race_after_long_header'])
+        self.assertEqual(sec_to_otbm._parse_mon_race(path), 50)
+
+    def test_randomised_files_match_reference(self):
+        rng = random.Random(770)
+        lines = ['Name = "x"', 'RaceNumber = 12', 'RaceNumber = bad', '# RaceNumber = 3', 'RaceNumber = 4 # c',
+                 'Outfit = (1, 2-3-4-5)', '', '   ', 'Talk = "RaceNumber = 6"', '\xa0RaceNumber=7']
+        for i in range(300):
+            body = [rng.choice(lines) for _ in range(rng.randrange(0, 8))]
+            if rng.random() < 0.4:
+                body.insert(rng.randrange(len(body) + 1), padding(rng.randrange(HEAD - 40, HEAD + 40)).rstrip('\n'))
+            text = rng.choice(('\n', '\r\n', '\r')).join(body) + rng.choice(('', '\n'))
+            path = self._write(f'r{i}', text)
+            with self.subTest(i=i):
+                self.assertEqual(sec_to_otbm._parse_mon_race(path), reference_race(path))
+
+    def test_build_race_lookup_keeps_long_header_files(self):
+        self._write('rat', SAMPLES['plain'])
+        self._write('dragon', SAMPLES['race_after_long_header'])
+        with mock.patch.object(parse_cache, 'CACHE_DIR', self.mon_dir / 'cache'):
+            lookup = sec_to_otbm.build_race_lookup(self.mon_dir)
+        self.assertEqual(lookup, {21: 'mon-rat', 50: 'mon-dragon'})
+
+
+if __name__ == '__main__':
+    unittest.main()
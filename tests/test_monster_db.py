@@ -0,0 +1,125 @@
+"""monster.db parsing from undecoded bytes (_read_token_lines) against the original text-mode parser.
+
+Run from the repository root: python -m unittest discover tests
+"""
+import random
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import sec_to_otbm  # noqa: E402
+
+try:
+    import generate_rme_data
+except ImportError:  # lxml missing: the RME half is skipped
+    generate_rme_data = None
+
+
+def reference_token_lines(path):
+    """split() tokens of each non-blank line, as the original parsers read them (text mode, latin-1)"""
+    with open(path, 'r', encoding='latin-1', errors='ignore') as f:
+        return [line.strip().split() for line in f if line.strip()]
+
+
+def reference_monster_db(path):
+    """The original parse_monster_db, as (race, x, y, z, radius, amount, spawntime) tuples"""
+    spawns = []
+    with open(path, 'r', encoding='latin-1', errors='ignore') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            parts = line.split()
+            if len(parts) < 7:
+                continue
+            try:
+                spawns.append(tuple(int(part) for part in parts[:7]))
+            except (ValueError, IndexError):
+                continue
+    return spawns
+
+
+SAMPLE = (
+    b'# race x y z radius amount spawntime\n'
+    b'1 32000 32000 7 3 2 60\n'
+    b'\n'
+    b'   \n'
+    b'2 32001 32001 7 3 1 90   # trailing comment\r\n'
+    b'3 32002 32002 7 3 1 90# glued comment\r\n'
+    b'#4 32003 32003 7 3 1 90\n'
+    b'  # indented comment 5 32003 32003 7 3 1 90\n'
+    b'5\t32004\t32004\t7\t3\t1\t90\n'
+    b'6 32005 32005 7 3 1\n'
+    b'7 32006 32006 7 3 x 90\n'
+    b'8\xa032007\xa032007 7 3 1 90\r'
+    b'9 32008\x1c32008\x8532008 7 3 1 90\r'
+    b'10 32009 32009 7 3 1 90 extra columns\x0b\x0c\n'
+    b'11 32010 32010 7 3 1 +90\n'
+    b'12 32011 32011 7 3 1 9_0\n'
+    b'13 32012 32012 7 3 1 \xb2\n'
+    b'14 32013 32013 7 3 1 90'
+)
+
+
+class MonsterDbTest(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+
+    def _write(self, name, data):
+        path = self.root / name
+        path.write_bytes(data)
+        return path
+
+    def _parsers(self):
+        parsers = [sec_to_otbm._scan_monster_db]
+        if generate_rme_data is not None:
+            parsers.append(generate_rme_data.parse_monsters_db)
+        return parsers
+
+    def _token_readers(self):
+        readers = [sec_to_otbm._read_token_lines]
+        if generate_rme_data is not None:
+            readers.append(generate_rme_data._read_token_lines)
+        return readers
+
+    def _assert_matches_reference(self, path):
+        for read in self._token_readers():
+            tokens = [[token.decode('latin-1') for token in line.split()] for line in read(path)]
+            self.assertEqual([line for line in tokens if line], reference_token_lines(path))
+        for parse in self._parsers():
+            self.assertEqual(parse(path), reference_monster_db(path))
+
+    def test_sample_matches_reference(self):
+        path = self._write('monster.db', SAMPLE)
+        self._assert_matches_reference(path)
+        races = [spawn[0] for spawn in sec_to_otbm._scan_monster_db(path)]
+        self.assertEqual(races, [1, 2, 5, 8, 9, 10, 11, 12, 14])
+
+    def test_randomised_files_match_reference(self):
+        rng = random.Random(770)
+        tokens = [b'1', b'32000', b'07', b'-3', b'+4', b'x', b'#', b'#5', b'\xe9', b'1_0', b'\xb2']
+        separators = [b' ', b'  ', b'\t', b'\xa0', b'\x1c', b'\x1f', b'\x85', b'\x0b', b'\x0c']
+        endings = [b'\n', b'\r\n', b'\r']
+        for i in range(200):
+            lines = []
+            for _ in range(rng.randrange(0, 12)):
+                parts = [rng.choice(tokens) if rng.random() < 0.3 else str(rng.randrange(100)).encode()
+                         for _ in range(rng.randrange(0, 10))]
+                line = b''.join(part + rng.choice(separators) for part in parts)
+                lines.append(rng.choice((b'', b' ', b'\xa0')) + line)
+            data = b''.join(line + rng.choice(endings) for line in lines)
+            if rng.random() < 0.3:
+                data = data.rstrip(b'\r\n')
+            path = self._write(f'r{i}.db', data)
+            with self.subTest(i=i):
+                self._assert_matches_reference(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+""".npc Home / Radius / Outfit parsing against the original line-by-line parser.
+
+Run from the repository root: python -m unittest discover tests
+"""
+import os
+import random
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import sec_to_otbm  # noqa: E402
+
+try:
+    import generate_rme_data
+except ImportError:  # lxml missing
+    generate_rme_data = None
+
+
+def reference_scan(npc_files):
+    """(npc_spawns, npc_creatures) as the original parse_npc_files built them"""
+    npc_spawns = []
+    npc_creatures = {}
+    for npc_file in npc_files:
+        display_name = 'npc-' + Path(npc_file).stem
+        home_x = home_y = home_z = None
+        radius = 3
+        looktype = None
+        lookhead = lookbody = looklegs = lookfeet = 0
+        with open(npc_file, 'r', encoding='latin-1', errors='ignore') as f:
+            for line in f:
+                line = line.strip()
+                if line.startswith('Name') and '=' in line:
+                    pass
+                elif line.startswith('Home') and '=' in line:
+                    try:
+                        coords = line.split('=')[1].strip().strip('[]')
+                        parts = coords.split(',')
+                        home_x = int(parts[0])
+                        home_y = int(parts[1])
+                        home_z = int(parts[2])
+                    except:  # noqa: E722 (as in the original)
+                        pass
+                elif line.startswith('Radius') and '=' in line:
+                    try:
+                        radius = int(line.split('=')[1].strip())
+                    except:  # noqa: E722
+                        pass
+                elif line.startswith('Outfit') and '=' in line:
+                    outfit_str = line.split('=', 1)[1].strip().strip('()')
+                    try:
+                        parts = outfit_str.split(',', 1)
+                        looktype = int(parts[0].strip()) if len(parts) > 0 else None
+                        if len(parts) > 1:
+                            colors = parts[1].strip().split('-')
+                            lookhead = int(colors[0]) if len(colors) > 0 else 0
+                            lookbody = int(colors[1]) if len(colors) > 1 else 0
+                            looklegs = int(colors[2]) if len(colors) > 2 else 0
+                            lookfeet = int(colors[3]) if len(colors) > 3 else 0
+                    except:  # noqa: E722
+                        pass
+        if home_x is not None:
+            npc_spawns.append({'name': display_name, 'x': home_x, 'y': home_y, 'z': home_z, 'radius': radius})
+        effective_looktype = looktype if (looktype is not None and looktype != 0) else 130
+        npc_creatures[display_name] = {'name': display_name, 'looktype': effective_looktype, 'lookhead': lookhead,
+                                       'lookbody': lookbody, 'looklegs': looklegs, 'lookfeet': lookfeet}
+    return npc_spawns, npc_creatures
+
+
+SAMPLES = {
+    'plain': 'Name = "Frans"\nHome = [32000,32100,7]\nRadius = 2\nOutfit = (128, 1-2-3-4)\n',
+    'crlf': 'Home = [32001,32101,7]\r\nRadius = 4\r\nOutfit = (129, 5-6-7-8)\r\n',
+    'value_with_equals': 'Home = [32002,32102,7] = old\nRadius = 5 = 6\nOutfit = (130, 1-2-3-4) = x\n',
+    'equals_inside_home': 'Home = [32003=1,32103,7]\n',
+    'key_prefix': 'HomeTown = [32004,32104,6]\nRadiusMax = 9\nOutfitColor = (131, 0-0-0-0)\n',
+    'no_spaces': 'Home=[32005,32105,7]\nRadius=1\nOutfit=(132,9-9-9-9)\n',
+    'indented': '  \t\xa0Home = [32006,32106,7]\n\x1cRadius = 7\n',
+    'partial_home': 'Home = [32007,x,7]\n',
+    'bad_radius_and_outfit': 'Home = [32008,32108,7]\nRadius = far\nOutfit = (133, 1-x-3-4)\n',
+    'no_equals': 'Home [32009,32109,7]\nRadius 3\n',
+    'talk_mentions': 'ADDRESS,"hello$",! -> "Welcome Home = friend."\nHome = [32010,32110,7]\n',
+    'empty': '',
+}
+
+
+class SecNpcFilesTest(unittest.TestCase):
+
+    @staticmethod
+    def scan(path):
+        return sec_to_otbm._scan_npc_files([path])
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.npc_dir = Path(tmp.name)
+
+    def _write(self, name, text):
+        path = self.npc_dir / f'{name}.npc'
+        path.write_bytes(text.encode('latin-1'))
+        return path
+
+    def test_samples_match_reference(self):
+        for name, text in SAMPLES.items():
+            with self.subTest(name):
+                path = self._write(name, text)
+                self.assertEqual(self.scan(path), reference_scan([path]))
+
+    def test_randomised_files_match_reference(self):
+        rng = random.Random(770)
+        keys = ['Home', 'Radius', 'Outfit', 'Name', 'HomeX', 'Talk']
+        values = ['[1,2,3]', '[4,5,6] = [7,8,9]', '5', '5 = 6', '(1, 2-3-4-5)', '(7,8-9) = (1, 1-1-1-1)', 'x', '']
+        for i in range(200):
+            lines = []
+            for _ in range(rng.randrange(0, 8)):
+                lead = rng.choice(('', ' ', '\t', '\xa0'))
+                sep = rng.choice((' = ', '=', ' ', ' =='))
+                lines.append(lead + rng.choice(keys) + sep + rng.choice(values))
+            path = self._write(f'r{i}', rng.choice(('\n', '\r\n')).join(lines))
+            with self.subTest(i=i):
+                self.assertEqual(self.scan(path), reference_scan([path]))
+
+
+@unittest.skipIf(generate_rme_data is None, 'generate_rme_data needs lxml')
+class RmeNpcFilesTest(SecNpcFilesTest):
+
+    @staticmethod
+    def scan(path):
+        return generate_rme_data._scan_npc_files([os.fspath(path)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+"""Regression check: per-floor parallel monster placement must match the serial path exactly.
+
+Run from the repository root: python -m unittest discover tests
+"""
+import random
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import sec_to_otbm  # noqa: E402
+
+
+def _build_areas(rng):
+    """Three floors of a 60x60 patch; roughly one tile in five has no items (not walkable)"""
+    areas = {}
+    for z in (6, 7, 8):
+        for x in range(1000, 1060):
+            for y in range(2000, 2060):
+                items = [] if rng.random() < 0.2 else [(100,)]
+                areas.setdefault((x & ~0xFF, y & ~0xFF, z), []).append((x, y, 0, items))
+    return areas
+
+
+def _build_spawns(rng):
+    """Spawns on all floors, interleaved, with repeated centers so the center nudge runs too"""
+    centers = [(rng.randrange(1010, 1050), rng.randrange(2010, 2050)) for _ in range(40)]
+    spawns = [("monster0", 1020, 2020, 7, 3, 60)]  # on the center preset in _place
+    for i in range(300):
+        x, y = rng.choice(centers)
+        spawns.append((f"monster{i % 7}", x, y, rng.choice((6, 7, 8)), rng.randrange(1, 6), 60))
+    return spawns
+
+
+class ParallelSpawnPlacementTest(unittest.TestCase):
+
+    def _place(self, parallel):
+        rng = random.Random(770)
+        grid, _ = sec_to_otbm.load_walkable_tiles_from_sectors(_build_areas(rng))
+        spawns = _build_spawns(rng)
+        # A center placed before the monster pass (as an earlier spawn would) must be seen by its floor's worker
+        spawn_centers = {sec_to_otbm._tile_key(1020, 2020, 7)}
+        center_offsets = sec_to_otbm._ring_search_offsets(range(1, 25), grid.width)
+        placement_offsets = sec_to_otbm._ring_search_offsets(range(sec_to_otbm._SPAWN_REACH + 1), grid.width)
+        if parallel:
+            with mock.patch.object(sec_to_otbm, '_PARALLEL_SPAWN_MIN', 1), \
+                    mock.patch.object(sec_to_otbm.os, 'cpu_count', return_value=4):
+                results = sec_to_otbm._place_monster_spawns(
+                    spawns, grid, spawn_centers, center_offsets, placement_offsets)
+        else:
+            results = sec_to_otbm._place_monster_spawns(
+                spawns, grid, spawn_centers, center_offsets, placement_offsets)
+        return results, bytes(grid.state), spawn_centers
+
+    def test_parallel_matches_serial(self):
+        serial_results, serial_state, serial_centers = self._place(parallel=False)
+        parallel_results, parallel_state, parallel_centers = self._place(parallel=True)
+        # Sanity: the fixture actually nudges centers and claims tiles
+        self.assertTrue(any(shifted for *_, shifted in serial_results))
+        self.assertIn(sec_to_otbm._TILE_USED, serial_state)
+        self.assertEqual(parallel_results, serial_results)
+        self.assertEqual(parallel_state, serial_state)
+        self.assertEqual(parallel_centers, serial_centers)
+
+
+if __name__ == '__main__':
+    unittest.main()
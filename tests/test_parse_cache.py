@@ -0,0 +1,96 @@
+"""parse_cache.load_cached: hits, eviction per input directory and recovery from bad entries.
+
+Run from the repository root: python -m unittest discover tests
+"""
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import parse_cache  # noqa: E402
+
+
+class LoadCachedTest(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.root = Path(tmp.name)
+        patcher = mock.patch.object(parse_cache, 'CACHE_DIR', self.root / 'cache')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        print_patcher = mock.patch('builtins.print')
+        print_patcher.start()
+        self.addCleanup(print_patcher.stop)
+        self.builds = 0
+
+    def _input(self, folder, text):
+        path = self.root / folder / 'monster.db'
+        path.parent.mkdir(exist_ok=True)
+        path.write_text(text)
+        return path
+
+    def _load(self, path, version=1):
+        def build():
+            self.builds += 1
+            return path.read_text()
+        return parse_cache.load_cached('monster_db', [path], build, version)
+
+    def test_alternating_folders_keep_their_entries(self):
+        a = self._input('game-a', 'a')
+        b = self._input('game-b', 'b')
+        for _ in range(3):
+            self.assertEqual(self._load(a), 'a')
+            self.assertEqual(self._load(b), 'b')
+        self.assertEqual(self.builds, 2)
+        self.assertEqual(len(list(parse_cache.CACHE_DIR.glob('monster_db-*.pkl'))), 2)
+
+    def test_changed_input_replaces_its_own_entry(self):
+        a = self._input('game-a', 'a')
+        b = self._input('game-b', 'b')
+        self._load(a)
+        self._load(b)
+        a.write_text('a2 (different size)')
+        self.assertEqual(self._load(a), 'a2 (different size)')
+        self.assertEqual(self._load(b), 'b')
+        self.assertEqual(self.builds, 3)
+        self.assertEqual(len(list(parse_cache.CACHE_DIR.glob('monster_db-*.pkl'))), 2)
+        self.assertEqual(list(parse_cache.CACHE_DIR.glob('*.tmp')), [])
+
+    def test_version_is_part_of_the_key(self):
+        a = self._input('game-a', 'a')
+        self._load(a, version=1)
+        self._load(a, version=2)
+        self.assertEqual(self.builds, 2)
+
+    def test_source_edit_is_part_of_the_key(self):
+        a = self._input('game-a', 'a')
+        source = self.root / 'parser.py'
+        source.write_text('v1')
+        parse_cache.load_cached('monster_db', [a], lambda: 'v1', 1, source=source)
+        source.write_text('v2')
+        parse_cache._source_digest.cache_clear()
+        self.assertEqual(parse_cache.load_cached('monster_db', [a], lambda: 'v2', 1, source=source), 'v2')
+
+    def test_bad_entry_is_rebuilt(self):
+        a = self._input('game-a', 'a')
+        self._load(a)
+        (cache_file,) = parse_cache.CACHE_DIR.glob('monster_db-*.pkl')
+        cache_file.write_bytes(b'\x80\x05not a pickle')
+        self.assertEqual(self._load(a), 'a')
+        self.assertEqual(self._load(a), 'a')
+        self.assertEqual(self.builds, 2)
+
+    def test_store_false_skips_the_write(self):
+        a = self._input('game-a', 'a')
+        parse_cache.load_cached('monster_db', [a], lambda: 'partial', 1, store=lambda result: False)
+        self.assertFalse(os.path.exists(parse_cache.CACHE_DIR)
+                         and any(parse_cache.CACHE_DIR.iterdir()))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+"""Pins the spawn XML written for repeated and near-repeated monster.db lines.
+
+Every monster.db line is its own spawn: exact repeats and lines that differ only in radius, spawntime,
+race or by one tile are neither merged nor dropped. The expected XML below is what the original
+one-spawn-per-line converter writes for this input.
+
+Run from the repository root: python -m unittest discover tests
+"""
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import parse_cache  # noqa: E402
+import sec_to_otbm  # noqa: E402
+
+MONSTER_DB = """\
+# race x y z radius amount spawntime
+1 32005 32005 7 3 2 60
+1 32005 32005 7 3 2 60
+1 32005 32005 7 5 2 60
+1 32005 32005 7 3 2 90
+2 32005 32005 7 3 1 60
+1 32006 32005 7 3 1 60
+"""
+
+EXPECTED_XML = """\
+<?xml version="1.0"?>
+<spawns>
+\t<spawn centerx="32005" centery="32005" centerz="7" radius="1">
+\t\t<monster name="mon-rat" x="0" y="0" z="7" spawntime="60"/>
+\t\t<monster name="mon-rat" x="-1" y="-1" z="7" spawntime="60"/>
+\t</spawn>
+\t<spawn centerx="32004" centery="32004" centerz="7" radius="1">
+\t\t<monster name="mon-rat" x="-1" y="-1" z="7" spawntime="60"/>
+\t\t<monster name="mon-rat" x="-1" y="0" z="7" spawntime="60"/>
+\t</spawn>
+\t<spawn centerx="32004" centery="32005" centerz="7" radius="1">
+\t\t<monster name="mon-rat" x="0" y="0" z="7" spawntime="60"/>
+\t\t<monster name="mon-rat" x="-1" y="0" z="7" spawntime="60"/>
+\t</spawn>
+\t<spawn centerx="32004" centery="32006" centerz="7" radius="1">
+\t\t<monster name="mon-rat" x="0" y="0" z="7" spawntime="90"/>
+\t\t<monster name="mon-rat" x="-1" y="0" z="7" spawntime="90"/>
+\t</spawn>
+\t<spawn centerx="32005" centery="32004" centerz="7" radius="1">
+\t\t<monster name="mon-cat" x="0" y="0" z="7" spawntime="60"/>
+\t</spawn>
+\t<spawn centerx="32006" centery="32005" centerz="7" radius="1">
+\t\t<monster name="mon-rat" x="0" y="0" z="7" spawntime="60"/>
+\t</spawn>
+</spawns>"""
+
+
+class SpawnsXmlTest(unittest.TestCase):
+
+    def test_each_monster_db_line_is_one_spawn(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp = Path(tmp)
+            (tmp / 'mon').mkdir()
+            (tmp / 'npc').mkdir()
+            (tmp / 'mon' / 'rat.mon').write_text('Name = "rat"\nRaceNumber = 1\n', encoding='latin-1')
+            (tmp / 'mon' / 'cat.mon').write_text('Name = "cat"\nRaceNumber = 2\n', encoding='latin-1')
+            (tmp / 'monster.db').write_text(MONSTER_DB, encoding='latin-1')
+            # An 11x11 walkable patch around the spawns, one OTBM area
+            areas = {(32000 & ~0xFF, 32000 & ~0xFF, 7):
+                     [(x, y, 0, [(100,)]) for x in range(32000, 32011) for y in range(32000, 32011)]}
+            output = tmp / 'spawn.xml'
+            with mock.patch.object(parse_cache, 'CACHE_DIR', tmp / 'cache'), \
+                    mock.patch.object(sec_to_otbm, '_LOGS_DIR', tmp / 'logs'), \
+                    mock.patch('builtins.print'):
+                sec_to_otbm.generate_spawns_xml(tmp / 'monster.db', tmp / 'mon', tmp / 'npc', output, areas)
+            self.assertEqual(output.read_text(encoding='utf-8'), EXPECTED_XML)
+
+
+if __name__ == '__main__':
+    unittest.main()